@@ -35,6 +35,14 @@ def get_article_by_url(db: Session, url: str):
         return source.article
     return None
 
+def get_all_source_urls(db: Session) -> List[str]:
+    """
+    기능: ArticleSource 테이블에 저장된 모든 원본 기사 URL을 반환합니다. 수집기의 URL 프런티어를 채우는 데 사용됩니다.
+    input: db (DB 세션)
+    output: URL 문자열 리스트
+    """
+    return [url for (url,) in db.query(models.ArticleSource.url).all()]
+
 def create_article(db: Session, article_data: Dict[str, Any]) -> models.Article:
     """
     기능: 하나의 대표 기사(Article) 객체를 생성하고, 연관된 Category, Image 정보도 함께 저장합니다.
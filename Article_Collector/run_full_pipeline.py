@@ -18,12 +18,29 @@ if current_dir not in sys.path:
 
 from scripts.run_collection import run_collection_pipeline
 from scripts.run_processing2 import run_processing_pipeline
+from src.processing.model_registry import get_model_registry
 from src.utils.logger import setup_logger
 
 async def main():
     logger = setup_logger(name="pipeline_coordinator", level="INFO")
     logger.info("======= 전체 데이터 파이프라인 작업을 시작합니다 =======")
 
+    # 번역기/형태소 분석기/요약기를 백그라운드 스레드에서 미리 로드해 수집(네트워크)과 겹쳐 실행한다.
+    # 각 단계는 모델이 필요해지는 시점에 레지스트리에서 준비를 기다린다.
+    registry = get_model_registry()
+    registry.prewarm()
+    try:
+        await run_stages(logger)
+    finally:
+        registry.close()
+        logger.info(f"[ModelRegistry] {registry.status()}")
+
+async def run_stages(logger):
+    """
+    기능: 1단계(수집)와 2단계(처리 및 DB 저장)를 차례로 실행합니다.
+    input: logger
+    output: 없음
+    """
     # --- 1단계: 데이터 수집 ---
     logger.info("[PIPELINE] 1단계 시작: 데이터 수집")
     collection_output_dir = await run_collection_pipeline()
@@ -0,0 +1,240 @@
+# Parser benchmark
+# 저장해 둔 목록/기사 페이지로 수집기별 추출 함수의 파싱+추출 시간을 HTML 파서 백엔드(html.parser / lxml / selectolax)별로 비교한다.
+#
+# 1. 페이지 저장:  python -m scripts.benchmark_parsers record --site chosun --category politics --articles 10
+# 2. 비교 실행:    python -m scripts.benchmark_parsers run [--site chosun] [--repeat 5]
+#
+# 결과의 '일치'는 html.parser 결과와 추출 결과(dict/list)가 같은 페이지 수이다. 백엔드를 바꾸기 전에 확인한다.
+# article의 'structured' 행은 ld+json/og: 선추출 시간이며, '일치'는 선추출만으로 제목/본문/이미지를 모두 얻어 DOM 파싱을 건너뛴 페이지 수이다.
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import statistics
+
+from src.collection.bbc_collector import BBCCollector, parse_bbc_article_links, parse_bbc_article
+from src.collection.cnn_collector import CnnCollector, parse_cnn_article_links, extract_article_details_cnn
+from src.collection.guardian_collector import GuardianCollector, parse_guardian_article_links, parse_guardian_article
+from src.collection.thetimes_collector import TheTimesCollector, parse_thetimes_article_links, parse_thetimes_article
+from src.collection.yonhap_collector import YonhapCollector
+from src.collection.chosun_collector import ChosunCollector
+from src.collection.joongang_collector import JoongangCollector
+from src.collection.donga_collector import DongaCollector, parse_donga_article_links, parse_donga_article
+from src.collection.hankyoreh_collector import HankyorehCollector
+from src.collection.kyunghyang_collector import KyunghyangCollector, parse_kyunghyang_article_links, parse_kyunghyang_article
+from src.collection.html_parser import PARSER_BACKENDS, resolve_parser
+from src.collection.extraction_spec import extract_links, extract_article
+from src.collection.structured_data import STRUCTURED_FIELDS, scan_structured_data
+from src.utils.http_session import get_session, close_all_sessions
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_PAGES_DIR = os.path.join(PROJECT_ROOT, 'Data', 'benchmark_pages')
+
+
+def _korean(links_fn, article_fn):
+    return (
+        lambda c, page, html, parser: links_fn(html, page['url'], c.base_url, c.site_name, parser),
+        lambda c, page, html, parser: article_fn(html, page['url'], page['title'], page['category'], c.site_name, c.base_url, parser),
+    )
+
+
+def _spec():
+    # 추출 스펙(configs/extraction_specs.yaml)을 쓰는 수집기
+    return (
+        lambda c, page, html, parser: extract_links(c.extraction_spec, html, page['url'], c.base_url, parser),
+        lambda c, page, html, parser: extract_article(c.extraction_spec, html, page['url'], page['title'], page['category'], c.site_name, parser, False),
+    )
+
+
+# site_name -> (수집기 클래스, 목록 추출 호출, 기사 추출 호출). 추출 함수마다 인자가 달라 호출 형태를 여기서 맞춘다.
+SITES = {
+    "bbc": (BBCCollector,
+            lambda c, page, html, parser: parse_bbc_article_links(html, c.base_url, parser),
+            lambda c, page, html, parser: parse_bbc_article(html, page['url'], page['title'], page['category'], c.site_name, parser)),
+    "cnn": (CnnCollector,
+            lambda c, page, html, parser: parse_cnn_article_links(html, c.base_url, parser),
+            lambda c, page, html, parser: extract_article_details_cnn(html, page['title'], parser)),
+    "the_guardian": (GuardianCollector,
+                     lambda c, page, html, parser: parse_guardian_article_links(html, page['url'], c.base_url, parser),
+                     lambda c, page, html, parser: parse_guardian_article(html, page['url'], page['title'], page['category'], c.site_name, parser)),
+    "the_times": (TheTimesCollector,
+                  lambda c, page, html, parser: parse_thetimes_article_links(html, page['url'], c.base_url, c.site_name, parser),
+                  lambda c, page, html, parser: parse_thetimes_article(html, page['url'], page['title'], page['category'], c.site_name, parser)),
+    "yonhap": (YonhapCollector, *_spec()),
+    "chosun": (ChosunCollector, *_spec()),
+    "joongang": (JoongangCollector, *_spec()),
+    "donga": (DongaCollector, *_korean(parse_donga_article_links, parse_donga_article)),
+    "hankyoreh": (HankyorehCollector, *_spec()),
+    "kyunghyang": (KyunghyangCollector, *_korean(parse_kyunghyang_article_links, parse_kyunghyang_article)),
+}
+
+
+async def record_pages(site_name: str, category: str, num_articles: int, pages_dir: str):
+    """
+    기능: 수집기의 요청 경로로 카테고리 목록 페이지와 기사 페이지를 받아 디스크에 저장한다.
+    input: site_name (수집기 site_name), category (카테고리 경로 세그먼트), num_articles (저장할 기사 수), pages_dir (저장 폴더)
+    output: 없음
+    """
+    collector_class, links_call, _ = SITES[site_name]
+    collector = collector_class()
+    site_dir = os.path.join(pages_dir, site_name)
+    os.makedirs(site_dir, exist_ok=True)
+    manifest_path = os.path.join(site_dir, 'manifest.json')
+    manifest = []
+    if os.path.exists(manifest_path):
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+
+    session = get_session()
+    try:
+        category_url = f"{collector.base_url}/{category}"
+        listing_html = await collector.fetch_text(session, category_url)
+        listing_file = f"listing_{len(manifest):03d}.html"
+        with open(os.path.join(site_dir, listing_file), 'w', encoding='utf-8') as f:
+            f.write(listing_html)
+        manifest.append({'kind': 'listing', 'file': listing_file, 'url': category_url, 'title': '', 'category': category})
+
+        links = links_call(collector, manifest[-1], listing_html, 'html.parser')
+        for link in links[:num_articles]:
+            try:
+                article_bytes = await collector.fetch_bytes(session, link['url'])
+            except Exception as e:
+                print(f"[Benchmark] 기사 저장 실패 ({link['url']}): {e}")
+                continue
+            article_file = f"article_{len(manifest):03d}.html"
+            with open(os.path.join(site_dir, article_file), 'wb') as f:
+                f.write(article_bytes)
+            manifest.append({'kind': 'article', 'file': article_file, 'url': link['url'], 'title': link['title'], 'category': category})
+    finally:
+        await close_all_sessions()
+
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    print(f"[Benchmark] {site_name}: 목록 1개, 기사 {sum(1 for p in manifest if p['kind'] == 'article')}개 저장 ({site_dir})")
+
+
+def _load_pages(site_dir: str) -> list[tuple[dict, str | bytes]]:
+    with open(os.path.join(site_dir, 'manifest.json'), 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    pages = []
+    for page in manifest:
+        path = os.path.join(site_dir, page['file'])
+        if page['kind'] == 'listing':
+            with open(path, 'r', encoding='utf-8') as f:
+                pages.append((page, f.read()))
+        else:
+            with open(path, 'rb') as f:
+                pages.append((page, f.read()))
+    return pages
+
+
+def benchmark_site(site_name: str, pages_dir: str, repeat: int) -> list[dict]:
+    """
+    기능: 저장된 페이지마다 백엔드별로 추출 함수를 repeat번 실행해 페이지당 중앙값 시간을 잰다. 기사 페이지는 구조화 데이터 선추출 시간도 잰다.
+    input: site_name, pages_dir (저장 폴더), repeat (반복 횟수)
+    output: {'site', 'kind', 'parser', 'pages', 'ms_per_page', 'matches', 'errors'} 딕셔너리 리스트
+    """
+    collector_class, links_call, article_call = SITES[site_name]
+    collector = collector_class()
+    pages = _load_pages(os.path.join(pages_dir, site_name))
+    # 설치되지 않은 백엔드는 다른 백엔드로 대체되므로 실제로 쓰이는 것만 잰다.
+    backends = [backend for backend in PARSER_BACKENDS if resolve_parser(backend) == backend]
+
+    rows = []
+    for kind, call in (('listing', links_call), ('article', article_call)):
+        kind_pages = [(page, html) for page, html in pages if page['kind'] == kind]
+        if not kind_pages:
+            continue
+        baseline = {}
+        for backend in backends:
+            timings, matches, errors = [], 0, 0
+            for page, html in kind_pages:
+                samples = []
+                result = None
+                try:
+                    for _ in range(repeat):
+                        started = time.perf_counter()
+                        result = call(collector, page, html, backend)
+                        samples.append(time.perf_counter() - started)
+                except Exception as e:
+                    errors += 1
+                    print(f"[Benchmark] {site_name}/{kind}/{backend} 추출 오류 ({page['file']}): {e}")
+                    continue
+                timings.append(statistics.median(samples))
+                if backend == 'html.parser':
+                    baseline[page['file']] = result
+                if baseline.get(page['file']) == result:
+                    matches += 1
+            rows.append({
+                'site': site_name, 'kind': kind, 'parser': backend, 'pages': len(kind_pages),
+                'ms_per_page': statistics.mean(timings) * 1000 if timings else float('nan'),
+                'matches': matches, 'errors': errors,
+            })
+        if kind == 'article':
+            rows.append(_benchmark_structured(site_name, kind_pages, repeat))
+    return rows
+
+
+def _benchmark_structured(site_name: str, kind_pages: list, repeat: int) -> dict:
+    timings, covered = [], 0
+    for page, html in kind_pages:
+        samples = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            found = scan_structured_data(html)
+            samples.append(time.perf_counter() - started)
+        timings.append(statistics.median(samples))
+        if all(found.get(field) for field in STRUCTURED_FIELDS):
+            covered += 1
+    return {
+        'site': site_name, 'kind': 'article', 'parser': 'structured', 'pages': len(kind_pages),
+        'ms_per_page': statistics.mean(timings) * 1000, 'matches': covered, 'errors': 0,
+    }
+
+
+def print_report(rows: list[dict]):
+    print(f"{'site':<14}{'kind':<9}{'parser':<13}{'pages':>6}{'ms/page':>10}{'speedup':>9}{'일치':>6}{'오류':>6}")
+    baseline = {(row['site'], row['kind']): row['ms_per_page'] for row in rows if row['parser'] == 'html.parser'}
+    for row in rows:
+        base = baseline.get((row['site'], row['kind']))
+        speedup = f"{base / row['ms_per_page']:.1f}x" if base and row['ms_per_page'] > 0 else '-'
+        print(f"{row['site']:<14}{row['kind']:<9}{row['parser']:<13}{row['pages']:>6}{row['ms_per_page']:>10.2f}{speedup:>9}{row['matches']:>6}{row['errors']:>6}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="수집기 추출 함수의 HTML 파서 백엔드별 성능을 비교합니다.")
+    parser.add_argument('--pages-dir', default=DEFAULT_PAGES_DIR, help="저장된 페이지 폴더")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    record_parser = subparsers.add_parser('record', help="목록/기사 페이지를 받아 저장합니다.")
+    record_parser.add_argument('--site', required=True, choices=sorted(SITES))
+    record_parser.add_argument('--category', required=True, help="카테고리 경로 세그먼트 (예: politics)")
+    record_parser.add_argument('--articles', type=int, default=10, help="저장할 기사 수")
+
+    run_parser = subparsers.add_parser('run', help="저장된 페이지로 백엔드별 추출 시간을 잽니다.")
+    run_parser.add_argument('--site', action='append', choices=sorted(SITES), help="생략하면 저장된 모든 사이트")
+    run_parser.add_argument('--repeat', type=int, default=5, help="페이지당 반복 횟수")
+    args = parser.parse_args()
+
+    if args.command == 'record':
+        asyncio.run(record_pages(args.site, args.category, args.articles, args.pages_dir))
+        return
+
+    sites = args.site or sorted(
+        name for name in SITES if os.path.exists(os.path.join(args.pages_dir, name, 'manifest.json'))
+    )
+    if not sites:
+        print(f"[Benchmark] 저장된 페이지가 없습니다. 먼저 record로 페이지를 저장하세요. ({args.pages_dir})")
+        sys.exit(1)
+
+    rows = []
+    for site_name in sites:
+        rows.extend(benchmark_site(site_name, args.pages_dir, max(1, args.repeat)))
+    print_report(rows)
+
+
+if __name__ == '__main__':
+    main()
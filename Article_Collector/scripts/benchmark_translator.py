@@ -0,0 +1,172 @@
+# Translator benchmark
+# 같은 영어 문장들로 번역기 백엔드(transformers: NllbTranslator / ct2: int8 CTranslate2)의 처리량과 최대 메모리를 비교한다.
+#
+#   python -m scripts.benchmark_translator --input <기사 JSON 폴더 또는 .json/.txt 파일> [--backend transformers --backend ct2]
+#                                           [--limit 500] [--batch-size 32]
+#
+# 입력: 수집 결과 기사 JSON(들)에서 영어 기사의 제목/본문을 문장으로 나눠 쓴다. (summary 번역 모드로 수집하면 영어 원문이 남는다)
+#       .txt 파일은 한 줄을 한 문단으로 본다.
+# 백엔드마다 별도 프로세스에서 모델을 로드하고 번역하므로 최대 RSS(peak RSS)가 서로 섞이지 않는다.
+# tokens/s는 출력 번역문의 NLLB 토큰 수 / 번역 시간(모델 로드 제외)이고, '일치'는 첫 번째 백엔드와 번역문이 같은 문장 비율이다.
+
+import os
+import sys
+import json
+import time
+import resource
+import argparse
+import tempfile
+import subprocess
+
+from src.processing.translation_batcher import TRANSLATION_BATCH_SIZE, is_english_text, split_sentences, translate_sentences
+from src.processing.ct2_translator import TRANSLATOR_MODEL_ID
+from src.processing.translator_loader import create_translator
+
+BACKENDS = ('transformers', 'ct2')
+
+
+def _iter_texts(path: str):
+    if os.path.isdir(path):
+        for root, _, files in os.walk(path):
+            for name in sorted(files):
+                if name.endswith(('.json', '.txt')):
+                    yield from _iter_texts(os.path.join(root, name))
+        return
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.endswith('.txt'):
+            yield from (line for line in f.read().splitlines() if line.strip())
+            return
+        data = json.load(f)
+    for item in data if isinstance(data, list) else [data]:
+        if isinstance(item, str):
+            yield item
+        elif isinstance(item, dict):
+            yield from (item.get(key) for key in ('title', 'body') if item.get(key))
+
+
+def load_sentences(path: str, limit: int) -> list[str]:
+    """
+    기능: 입력 파일/폴더에서 영어 텍스트를 모아 문장으로 나누고, 중복을 뺀 앞의 limit개 문장을 반환한다.
+    input: path (기사 JSON 폴더, .json 또는 .txt 파일), limit (최대 문장 수)
+    output: 문장 리스트
+    """
+    sentences = {}
+    for text in _iter_texts(path):
+        if not is_english_text(text):
+            continue
+        for paragraph in text.split("\n"):
+            for sentence in split_sentences(paragraph):
+                sentences.setdefault(sentence, None)
+                if len(sentences) >= limit:
+                    return list(sentences)
+    return list(sentences)
+
+
+def measure(backend: str, sentences_path: str, output_path: str, batch_size: int):
+    """
+    기능: (자식 프로세스) 번역기를 로드하고 문장들을 batch_size개씩 번역해 시간과 최대 RSS를 기록한다.
+    input: backend, sentences_path (문장 JSON), output_path (결과 JSON), batch_size (묶음당 문장 수)
+    output: 없음. 결과는 output_path에 저장한다.
+    """
+    with open(sentences_path, 'r', encoding='utf-8') as f:
+        sentences = json.load(f)
+
+    started = time.perf_counter()
+    translator = create_translator(backend)
+    load_seconds = time.perf_counter() - started
+
+    outputs = []
+    started = time.perf_counter()
+    for start in range(0, len(sentences), batch_size):
+        outputs.extend(translate_sentences(translator, sentences[start:start + batch_size]))
+    translate_seconds = time.perf_counter() - started
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'backend': backend,
+            'model_name': translator.get_model_info()['model_name'],
+            'load_seconds': load_seconds,
+            'translate_seconds': translate_seconds,
+            # 리눅스의 ru_maxrss 단위는 KB
+            'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+            'outputs': outputs,
+        }, f, ensure_ascii=False)
+
+
+def run_backend(backend: str, sentences_path: str, batch_size: int) -> dict | None:
+    with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
+        output_path = f.name
+    try:
+        completed = subprocess.run(
+            [sys.executable, '-m', 'scripts.benchmark_translator', '--measure', backend,
+             '--sentences', sentences_path, '--output', output_path, '--batch-size', str(batch_size)],
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        )
+        if completed.returncode != 0:
+            print(f"[Benchmark] {backend} 백엔드 실행 실패 (exit {completed.returncode})")
+            return None
+        with open(output_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    finally:
+        os.remove(output_path)
+
+
+def print_report(sentences: list[str], results: list[dict]):
+    from transformers import AutoTokenizer
+
+    tokenizer = AutoTokenizer.from_pretrained(TRANSLATOR_MODEL_ID)
+    source_tokens = sum(len(ids) for ids in tokenizer(sentences)['input_ids'])
+    print(f"\n문장 {len(sentences)}개, 입력 토큰 {source_tokens}개")
+    print(f"{'backend':<14}{'load s':>8}{'translate s':>13}{'out tok/s':>11}{'sent/s':>9}{'peak RSS MB':>13}{'speedup':>9}{'일치':>7}")
+    baseline = results[0]
+    for result in results:
+        output_tokens = sum(len(ids) for ids in tokenizer(result['outputs'])['input_ids'])
+        seconds = result['translate_seconds']
+        speedup = f"{baseline['translate_seconds'] / seconds:.1f}x" if seconds > 0 else '-'
+        matches = sum(1 for a, b in zip(baseline['outputs'], result['outputs']) if a == b) / max(1, len(sentences))
+        print(f"{result['backend']:<14}{result['load_seconds']:>8.1f}{seconds:>13.1f}{output_tokens / seconds if seconds else 0:>11.1f}"
+              f"{len(sentences) / seconds if seconds else 0:>9.1f}{result['peak_rss_mb']:>13.0f}{speedup:>9}{matches:>7.0%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="번역기 백엔드별 처리량(tokens/s)과 최대 메모리(peak RSS)를 비교합니다.")
+    parser.add_argument('--input', help="기사 JSON 폴더, .json 또는 .txt 파일")
+    parser.add_argument('--backend', action='append', choices=BACKENDS, help="생략하면 transformers, ct2 순서로 모두 실행")
+    parser.add_argument('--limit', type=int, default=500, help="번역할 최대 문장 수")
+    parser.add_argument('--batch-size', type=int, default=TRANSLATION_BATCH_SIZE, help="묶음당 문장 수 (TranslationBatcher와 같은 기본값)")
+    # 자식 프로세스용 인자
+    parser.add_argument('--measure', choices=BACKENDS, help=argparse.SUPPRESS)
+    parser.add_argument('--sentences', help=argparse.SUPPRESS)
+    parser.add_argument('--output', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        measure(args.measure, args.sentences, args.output, max(1, args.batch_size))
+        return
+
+    if not args.input:
+        parser.error("--input 이 필요합니다.")
+    sentences = load_sentences(args.input, args.limit)
+    if not sentences:
+        print(f"[Benchmark] 영어 문장을 찾지 못했습니다. ({args.input})")
+        sys.exit(1)
+
+    with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False, encoding='utf-8') as f:
+        json.dump(sentences, f, ensure_ascii=False)
+        sentences_path = f.name
+    try:
+        results = []
+        for backend in args.backend or BACKENDS:
+            print(f"[Benchmark] {backend} 백엔드로 문장 {len(sentences)}개 번역 중...")
+            result = run_backend(backend, sentences_path, max(1, args.batch_size))
+            if result:
+                results.append(result)
+    finally:
+        os.remove(sentences_path)
+
+    if results:
+        print_report(sentences, results)
+
+
+if __name__ == '__main__':
+    main()
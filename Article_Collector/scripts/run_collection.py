@@ -37,13 +37,29 @@ from src.collection.hankyoreh_collector import HankyorehCollector
 from src.collection.kyunghyang_collector import KyunghyangCollector
 from src.utils.text_processing import preprocess_text_simple
 from src.utils.logger import setup_logger
-from models.translation.nllb_translator import NllbTranslator
+from src.utils.http_session import get_session, close_all_sessions
+from src.collection.crawl_engine import ARTICLE_WORKERS, CATEGORY_WORKERS, SITE_WORKERS
+from src.collection.stream_pipeline import Stage, StreamPipeline
+from src.collection.url_frontier import get_url_frontier
+from src.collection.feed_discovery import DISCOVERY_MODE
+from src.collection.parse_executor import shutdown_parse_executor
+from src.processing.translation_batcher import TRANSLATION_MODE, TranslationBatcher, detect_language, is_english_text
+from src.processing.translation_memory import TranslationMemory
+from src.processing.model_registry import get_model_registry
+from src.processing.translator_loader import USE_TRANSLATION_MEMORY, get_translator
+from src.utils.browser_manager import get_browser_manager
 
 # 설정 파일 및 데이터 디렉토리 경로 - 프로젝트 루트를 기준으로 재설정
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 CONFIG_FILE_PATH = os.path.join(PROJECT_ROOT, 'configs', 'news_sites.yaml')
 COLLECTED_ARTICLES_BASE_DIR = os.path.join(PROJECT_ROOT, 'data', 'collected_articles')
 
+# 스트리밍 수집 파이프라인의 전처리/저장 단계 워커 수
+PREPROCESS_WORKERS = int(os.getenv("COLLECTION_PREPROCESS_WORKERS", 2))
+PERSIST_WORKERS = int(os.getenv("COLLECTION_PERSIST_WORKERS", 4))
+# 번역 단계 워커 수. 이만큼의 기사가 동시에 문장을 공용 번역 묶음에 넣는다. (모델 호출은 번역 스레드 하나)
+TRANSLATE_WORKERS = int(os.getenv("COLLECTION_TRANSLATE_WORKERS", 16))
+
 # GCS 설정 - 로컬 개발 환경에서도 실행 가능하도록 예외 처리
 GCS_BUCKET_NAME = "betodi-gpu"  # 실제 GCS 버킷 이름
 storage_client = None
@@ -72,26 +88,8 @@ COLLECTOR_CLASSES = {
     '경향신문': KyunghyangCollector
 }
 
-# 번역기 인스턴스 - None으로 초기화하고, 필요할 때 생성
-translator: NllbTranslator = None
-
-def get_translator() -> NllbTranslator:
-    """
-    기능: 번역기(NllbTranslator)의 싱글턴 인스턴스를 반환합니다. 인스턴스가 없으면 새로 생성하고, 이미 있으면 기존 인스턴스를 반환합니다.
-    input: 없음
-    output: NllbTranslator 인스턴스 또는 초기화 실패 시 None
-    """
-    global translator
-    if translator is None:
-        print("[Translator] 번역기 인스턴스가 없으므로 새로 생성합니다...")
-        try:
-            translator = NllbTranslator()
-            model_info = translator.get_model_info()
-            print(f"[Translator] 번역기 로드 완료: {model_info['model_name']}")
-        except Exception as e:
-            print(f"[Translator] 번역기 초기화 실패: {e}")
-            translator = None
-    return translator
+# 파이프라인 시작 시 백그라운드에서 미리 로드할 수 있도록 번역기 로더를 등록한다.
+get_model_registry().register('translator', get_translator)
 
 def get_collector_for_site(site_name: str, site_config: dict) -> Any:
     """
@@ -175,7 +173,7 @@ async def download_and_encode_image(session: aiohttp.ClientSession, url: str, re
 
 async def preprocess_article(article: dict, press_company: str) -> dict:
     """
-    기능: 단일 기사 데이터를 전처리합니다. 영어 기사의 경우 번역을 수행하고, 불필요한 텍스트를 정리하며, 데이터 형식을 통일합니다.
+    기능: 단일 기사 데이터를 전처리합니다. 불필요한 텍스트를 정리하며, 데이터 형식을 통일합니다. (영어 기사 번역은 번역 단계에서 수행)
     input: article (전처리할 기사 딕셔너리), press_company (언론사 이름)
     output: 전처리된 기사 딕셔너리 또는 처리할 수 없는 경우 None
     """
@@ -206,24 +204,43 @@ async def preprocess_article(article: dict, press_company: str) -> dict:
         print(f"  - 경고: 최종 기사 내용이 30자 미만이라 저장하지 않습니다. (제목: '{article['title'][:30]}...')")
         return None
 
-    current_translator = get_translator()
-    if current_translator and article.get('body'):
-        english_chars = sum(1 for c in article['body'] if c.isascii() and c.isalpha())
-        total_chars = sum(1 for c in article['body'] if c.isalpha())
-        
-        if total_chars > 0 and english_chars / total_chars > 0.7:
-            print(f"  - 영어 기사로 판단되어 번역을 시작합니다: '{article.get('title', '제목 없음')[:30]}...'")
-            try:
-                translated_text = current_translator.translate(article['body'])
-                article['body'] = translated_text
-                
-                translated_title = current_translator.translate(article['title'])
-                article['title'] = translated_title
-                print(f"  - 번역 완료: '{article['title'][:30]}...'")
-                
-            except Exception as e:
-                print(f"  - 경고: 번역 중 오류 발생: {e}")
+    # 처리 파이프라인이 언어별로 그룹화하고, summary 번역 모드에서 요약문 번역 여부를 정하는 데 쓴다.
+    article['language'] = detect_language(article['body'])
+    return article
 
+async def create_batcher() -> TranslationBatcher | None:
+    """
+    기능: 모델 레지스트리에서 번역기가 준비되기를 (이벤트 루프를 막지 않고) 기다린 뒤 번역 묶음 처리기를 만듭니다.
+    input: 없음
+    output: TranslationBatcher 또는 번역기 로드 실패 시 None
+    """
+    try:
+        current_translator = await get_model_registry().wait('translator')
+    except Exception as e:
+        print(f"[Translator] 번역기를 불러오지 못해 영어 기사를 번역하지 않고 저장합니다: {e}")
+        return None
+    if current_translator is None:
+        print("[Translator] 번역기를 불러오지 못해 영어 기사를 번역하지 않고 저장합니다.")
+        return None
+    memory = TranslationMemory(current_translator.get_model_info()['model_name']) if USE_TRANSLATION_MEMORY else None
+    return TranslationBatcher(current_translator, memory=memory)
+
+async def translate_article(article: dict, batcher: TranslationBatcher) -> dict:
+    """
+    기능: 영어 기사의 제목과 본문을 번역 단계의 공용 묶음에 넣어 번역합니다. 영어 기사가 아니면 그대로 반환합니다.
+    input: article (전처리된 기사 딕셔너리), batcher (TranslationBatcher)
+    output: 번역된 기사 딕셔너리
+    """
+    if not article.get('body') or not is_english_text(article['body']):
+        return article
+
+    print(f"  - 영어 기사로 판단되어 번역을 시작합니다: '{article.get('title', '제목 없음')[:30]}...'")
+    try:
+        article['title'], article['body'] = await batcher.translate_texts([article['title'], article['body']])
+        article['language'] = 'ko'
+        print(f"  - 번역 완료: '{article['title'][:30]}...'")
+    except Exception as e:
+        print(f"  - 경고: 번역 중 오류 발생: {e}")
     return article
 
 async def upload_json_to_gcs_async(data: dict, gcs_path: str):
@@ -256,78 +273,128 @@ async def upload_json_to_gcs_async(data: dict, gcs_path: str):
         f.write(json_bytes)
     print(f"  - 로컬 저장 완료: {local_path}")
 
-async def run_collection_for_site(site_name: str, site_config: dict, collection_time_str: str, session: aiohttp.ClientSession) -> int:
+def build_category_jobs(site_name: str, site_config: dict) -> list[dict]:
     """
-    기능: 특정 언론사의 모든 카테고리에서 기사를 수집하고 전처리하여 GCS에 JSON 파일로 저장합니다.
-    input: site_name (언론사 이름), site_config (언론사 설정), collection_time_str (수집 시간 문자열), session (aiohttp 클라이언트 세션)
-    output: 성공적으로 GCS에 저장된 기사의 수
+    기능: 언론사 설정에서 (수집기, 카테고리, 경로) 작업 목록을 만듭니다.
+    input: site_name (언론사 이름), site_config (언론사 설정)
+    output: {'site_name', 'collector', 'category', 'path_segment', ('feeds')} 딕셔너리 리스트
     """
-    print(f"\n[run_collection] {site_name.upper()} 수집 시작...")
-    
     collector = get_collector_for_site(site_name, site_config)
-    if not collector: return 0
+    if not collector: return []
 
     categories_config = site_config.get('categories', {})
     if not categories_config:
         print(f"경고: {site_name}에 대한 카테고리 설정이 없습니다. 건너뜁니다.")
-        return 0
+        return []
+    feeds_config = site_config.get('feeds') or {}
 
-    category_tasks = []
+    category_jobs = []
     for category_display_name, category_path_segment in categories_config.items():
-        if isinstance(category_path_segment, list):
-            for path_segment in category_path_segment:
-                category_tasks.append(collector.collect_by_category(category_display_name, path_segment))
-        elif isinstance(category_path_segment, str):
-            category_tasks.append(collector.collect_by_category(category_display_name, category_path_segment))
-
-    if not category_tasks:
+        path_segments = category_path_segment if isinstance(category_path_segment, list) else [category_path_segment]
+        feed_urls = feeds_config.get(category_display_name)
+        if feed_urls and DISCOVERY_MODE != 'html':
+            # 피드가 카테고리 전체를 대신한다. 경로 세그먼트는 피드 실패 시 대체할 목록 페이지로만 쓴다.
+            category_jobs.append({
+                'site_name': site_name,
+                'collector': collector,
+                'category': category_display_name,
+                'path_segment': path_segments[0],
+                'feeds': feed_urls if isinstance(feed_urls, list) else [feed_urls]
+            })
+            continue
+        for path_segment in path_segments:
+            if isinstance(path_segment, str):
+                category_jobs.append({
+                    'site_name': site_name,
+                    'collector': collector,
+                    'category': category_display_name,
+                    'path_segment': path_segment
+                })
+
+    if not category_jobs:
         print(f"경고: {site_name}에 대한 유효한 카테고리 설정이 없습니다.")
-        return 0
+    return category_jobs
 
-    category_results = await asyncio.gather(*category_tasks, return_exceptions=True)
-    
-    files_saved_count = 0
+async def run_streaming_collection(sites_config: dict, collection_time_str: str, session: aiohttp.ClientSession) -> int:
+    """
+    기능: 링크 수집 -> 본문 수집/파싱 -> 전처리 -> 번역(영어 기사) -> 저장 단계를 크기 제한 큐로 연결해 실행합니다.
+          각 기사는 준비되는 즉시 다음 단계로 넘어가므로, 카테고리 전체가 끝나기를 기다리지 않고 저장됩니다.
+    input: sites_config (news_sites.yaml의 sites), collection_time_str (수집 시간 문자열), session (aiohttp 클라이언트 세션)
+    output: 성공적으로 저장된 기사의 수
+    """
+    category_jobs = []
+    for site_name, site_config in sites_config.items():
+        print(f"\n[run_collection] {site_name.upper()} 수집 작업 준비...")
+        category_jobs.extend(build_category_jobs(site_name, site_config))
 
-    for result in category_results:
-        if isinstance(result, Exception):
-            print(f"카테고리 수집 중 오류 발생: {result}")
-            continue
-            
-        articles_data = result
-        if not articles_data:
-            continue
+    if not category_jobs:
+        return 0
 
-        category_display_name = articles_data[0].get('category', 'etc') if articles_data else 'etc'
-        print(f"카테고리 '{category_display_name}' ({site_name})에서 {len(articles_data)}개 기사 수집 완료. 전처리 및 GCS 저장 시작...")
-        
-        async def process_and_save_to_json(article_data: dict) -> bool:
-            """
-            기능: 단일 기사 데이터를 전처리하고 GCS에 JSON으로 저장합니다.
-            output: 성공 시 True, 실패 시 False
-            """
-            processed_article = await preprocess_article(article_data, site_name)
-            if not processed_article:
-                return False
-
-            filename = f"{slugify(processed_article.get('title', 'untitled'))}.json"
-            category_name = processed_article.get('category', 'etc')
-            
-            # GCS 저장 경로 생성
-            gcs_path = f"collected_articles/{collection_time_str}/{category_name}/{filename}"
+    frontier = get_url_frontier()
+    saved_count = 0
+    # summary 번역 모드에서는 영어 기사를 영어 그대로 저장하고, 처리 파이프라인에서 요약문만 번역한다.
+    # 번역기는 모델 레지스트리가 백그라운드 스레드에서 로드하고, 번역 단계는 첫 영어 기사가 도착했을 때 준비를 기다린다.
+    batcher_task = asyncio.create_task(create_batcher()) if TRANSLATION_MODE == "collect" else None
 
-            try:
-                await upload_json_to_gcs_async(processed_article, gcs_path)
-                return True
-            except Exception as e:
-                # 에러는 upload 함수에서 이미 출력됨
-                return False
+    async def discover_links(job: dict) -> list[dict]:
+        article_infos = await job['collector'].discover_new_links(session, job['category'], job['path_segment'], job.get('feeds'))
+        return [{**job, 'info': info} for info in article_infos]
 
-        save_tasks = [process_and_save_to_json(article) for article in articles_data]
-        save_results = await asyncio.gather(*save_tasks)
-        files_saved_count += sum(1 for r in save_results if r)
+    async def fetch_article(item: dict) -> dict | None:
+        info = item['info']
+        article = await item['collector'].fetch_article_content(session, info['url'], info['title'], item['category'])
+        if not article:
+            return None
+        return {'site_name': item['site_name'], 'article': article}
 
-    print(f"[{site_name.upper()}] 총 {files_saved_count}개의 기사 GCS 저장 완료.")
-    return files_saved_count
+    async def preprocess(item: dict) -> dict | None:
+        processed_article = await preprocess_article(item['article'], item['site_name'])
+        if not processed_article:
+            # 본문이 없거나 너무 짧은 기사도 다음 실행에서 다시 가져오지 않는다.
+            frontier.mark_seen([item['article'].get('url')])
+            return None
+        return processed_article
+
+    async def translate(processed_article: dict) -> dict:
+        if not processed_article.get('body') or not is_english_text(processed_article['body']):
+            return processed_article
+        batcher = await batcher_task
+        if batcher is None:
+            return processed_article
+        return await translate_article(processed_article, batcher)
+
+    async def persist(processed_article: dict) -> None:
+        nonlocal saved_count
+        filename = f"{slugify(processed_article.get('title', 'untitled'))}.json"
+        category_name = processed_article.get('category', 'etc')
+
+        # GCS 저장 경로 생성
+        gcs_path = f"collected_articles/{collection_time_str}/{category_name}/{filename}"
+        await upload_json_to_gcs_async(processed_article, gcs_path)
+        frontier.mark_seen([processed_article['url']])
+        saved_count += 1
+
+    stages = [
+        Stage('links', discover_links, SITE_WORKERS * CATEGORY_WORKERS, fan_out=True),
+        # 수집기의 fetch_article_content가 요청과 파싱을 함께 수행한다.
+        Stage('fetch+parse', fetch_article, SITE_WORKERS * ARTICLE_WORKERS),
+        Stage('preprocess', preprocess, PREPROCESS_WORKERS),
+    ]
+    if batcher_task:
+        stages.append(Stage('translate', translate, TRANSLATE_WORKERS))
+    stages.append(Stage('persist', persist, PERSIST_WORKERS))
+
+    pipeline = StreamPipeline('CollectionPipeline', stages)
+    try:
+        await pipeline.run(category_jobs)
+        # 피드 워터마크는 찾은 기사가 저장(mark_seen)된 뒤에 올린다. 실패한 기사가 있으면 그 발행 시각에서 멈춘다.
+        frontier.commit_feed_watermarks()
+    finally:
+        if batcher_task:
+            batcher = await batcher_task
+            if batcher:
+                await batcher.close()
+    return saved_count
 
 async def run_collection_pipeline() -> str | None:
     """
@@ -347,20 +414,29 @@ async def run_collection_pipeline() -> str | None:
     collection_time_str = collection_time.strftime("%Y%m%d_%H%M%S")
     gcs_output_prefix = f"collected_articles/{collection_time_str}"
 
-    # 비동기 HTTP 세션 생성
-    async with aiohttp.ClientSession() as session:
-        site_tasks = [
-            run_collection_for_site(site_name, site_config, collection_time_str, session)
-            for site_name, site_config in config.get('sites', {}).items()
-        ]
+    # 번역기 로드를 백그라운드에서 시작해 링크 수집/본문 요청과 겹쳐 실행한다.
+    if TRANSLATION_MODE == "collect":
+        get_model_registry().prewarm('translator')
+
+    # 이미 DB에 저장된 기사 URL을 수집 제외 목록에 반영
+    get_url_frontier().seed_from_db()
+
+    # 모든 사이트가 공유하는 풀링된 HTTP 세션
+    session = get_session()
+    try:
+        sites_config = config.get('sites', {})
         
-        if not site_tasks:
+        if not sites_config:
             logger.warning("설정 파일에 수집할 사이트가 없습니다.")
             return None
         
-        results = await asyncio.gather(*site_tasks)
+        total_files_saved = await run_streaming_collection(sites_config, collection_time_str, session)
+    finally:
+        await close_all_sessions()
+        # 페이지 풀은 유휴 타이머로만 브라우저를 닫으므로, 파이프라인이 끝나면 직접 종료한다.
+        await get_browser_manager().shutdown()
+        shutdown_parse_executor()
 
-    total_files_saved = sum(results)
     logger.info(f"전체 수집 완료. 총 {total_files_saved}개의 기사를 GCS에 저장했습니다.")
     
     if total_files_saved > 0:
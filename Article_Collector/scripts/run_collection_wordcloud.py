@@ -32,6 +32,8 @@ PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 # 유틸리티 및 SQLAlchemy 관련 모듈
 from src.utils.logger import setup_logger
 from src.utils.text_processing import preprocess_text_simple
+from src.utils.http_session import get_session, close_all_sessions
+from src.utils.http_cache import HttpCache, get_http_cache, make_cache_key
 from sqlalchemy import create_engine, Column, Integer, String, DateTime, func
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
@@ -133,14 +135,28 @@ async def search_naver_news(session: aiohttp.ClientSession, keyword: str, semaph
         "X-Naver-Client-Secret": NAVER_CLIENT_SECRET
     }
     params = {"query": keyword, "display": 15, "sort": "sim"}
+
+    # 같은 키워드를 신선도 시간 안에 다시 검색하면 디스크 캐시의 응답을 쓴다.
+    http_cache = get_http_cache()
+    cache_key = make_cache_key(NAVER_API_URL, params)
+    cache_entry = http_cache.lookup(cache_key)
+    cached_body = http_cache.get_fresh(cache_entry, NAVER_API_URL)
+    if cached_body is not None:
+        return json.loads(cached_body).get('items', [])
+    headers.update(HttpCache.conditional_headers(cache_entry))
     
     async with semaphore: # 세마포를 통해 동시 요청 수 제어
         try:
             await asyncio.sleep(2) # 요청 간 짧은 지연 추가
             async with session.get(NAVER_API_URL, headers=headers, params=params, timeout=10) as response:
-                response.raise_for_status()
-                data = await response.json()
-                return data.get('items', [])
+                if response.status == 304 and cache_entry is not None:
+                    http_cache.refresh(cache_key)
+                    body = cache_entry.body
+                else:
+                    response.raise_for_status()
+                    body = await response.text()
+                    http_cache.store(cache_key, body, response.headers)
+                return json.loads(body).get('items', [])
         except Exception as e:
             print(f"  - '{keyword}' 네이버 뉴스 검색 실패: {e}")
             return []
@@ -302,8 +318,9 @@ async def run_wordcloud_collection_pipeline() -> Optional[str]:
     ssl_context = ssl.create_default_context()
     ssl_context.set_ciphers('DEFAULT@SECLEVEL=1')
 
-    connector = aiohttp.TCPConnector(ssl=ssl_context)
-    async with aiohttp.ClientSession(connector=connector) as session:
+    # 완화된 SSL 설정을 쓰는 별도 이름의 공유 세션 (커넥션 풀, DNS 캐시, keep-alive 재사용)
+    session = get_session("wordcloud", ssl_context=ssl_context)
+    try:
         # 2. 키워드별 뉴스 검색 (병렬)
         search_tasks = [search_naver_news(session, kw, semaphore) for kw in keywords]
         search_results = await asyncio.gather(*search_tasks)
@@ -335,6 +352,8 @@ async def run_wordcloud_collection_pipeline() -> Optional[str]:
         save_tasks = [process_and_save(art) for art in valid_articles]
         results = await asyncio.gather(*save_tasks)
         saved_count = sum(1 for r in results if r)
+    finally:
+        await close_all_sessions()
 
     logger.info(f"WordCloud 수집 완료. 총 {saved_count}개의 기사를 저장했습니다.")
     
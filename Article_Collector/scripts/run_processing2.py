@@ -5,15 +5,18 @@ from datetime import datetime
 from typing import List, Dict, Any
 # from google.cloud import storage # GCS 관련 import 주석 처리
 # import io # GCS 관련 import 주석 처리
-import subprocess
-import tempfile
 import re
 import textwrap # 텍스트 줄바꿈을 위해 임포트
 import logging
 
 # 필요한 모듈 임포트
-from src.processing.article_grouper import ArticleGrouper
+from src.processing.article_grouper import ArticleGrouper, warm_up_tokenizer
 # from src.processing.summarizer import GeminiAPIRefiner # Gemini API 대신 GPT-OSS 사용
+from src.processing.gpt_oss_summarizer import GptOssSummarizer, SummarizationWorkerError, SummarizationPromptVersionError, make_token_budget_batches
+from src.processing.translation_batcher import TRANSLATION_MODE, is_english_text, translate_texts_blocking
+from src.processing.translation_memory import TranslationMemory
+from src.processing.model_registry import get_model_registry
+from src.processing.translator_loader import USE_TRANSLATION_MEMORY, get_translator
 from DB.database import get_db
 from src.utils.logger import setup_logger
 from DB import crud # crud 모듈 임포트
@@ -27,75 +30,6 @@ PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 # storage_client = storage.Client()
 # bucket = storage_client.bucket(GCS_BUCKET_NAME)
 
-class GptOssSummarizer:
-    """
-    외부 gpt-oss-20b 요약 스크립트를 호출하여 요약을 수행하는 클래스.
-    """
-    def __init__(self):
-        current_script_path = os.path.dirname(os.path.abspath(__file__))
-        self.summarization_script_path = os.path.join(current_script_path, 'run_summarization_by_gpt.py')
-        if not os.path.exists(self.summarization_script_path):
-            raise FileNotFoundError(f"Summarization script not found at: {self.summarization_script_path}")
-
-    def refine_text(self, title: str, body: str) -> str:
-        if not body or not body.strip():
-            print("Warning: Empty body provided for summarization. Skipping.")
-            return ""
-
-        summary = ""
-        tmp_file_path = None
-        try:
-            # 임시 파일에 요약할 본문 내용 저장
-            with tempfile.NamedTemporaryFile(mode='w+', delete=False, encoding='utf-8', suffix='.txt') as tmp_file:
-                tmp_file.write(body)
-                tmp_file_path = tmp_file.name
-
-            command = [
-                sys.executable,  # 현재 파이썬 인터프리터 사용
-                self.summarization_script_path,
-                '--text_file',
-                tmp_file_path
-            ]
-            
-            # [수정] 자식 프로세스를 위한 환경 변수 설정
-            # 부모 프로세스의 환경을 복사한 뒤, 필요한 HF 관련 변수를 덮어씁니다.
-            # 이렇게 해야 자식 프로세스가 올바른 캐시 경로를 사용합니다.
-            child_env = os.environ.copy()
-            child_env['HF_HOME'] = '/home/bobo9245/projects/hf_cache'
-            child_env['HF_HUB_ENABLE_HF_TRANSFER'] = '1'
-
-            print(f"Calling GPT-OSS summarization script for title: {title[:30]}...")
-            result = subprocess.run(
-                command, 
-                capture_output=True, 
-                text=True, 
-                encoding='utf-8', 
-                check=True,
-                env=child_env  # 생성한 환경 변수를 자식 프로세스에 전달
-            )
-
-            # [수정된 최종 로직]
-            # 이제 요약 스크립트가 순수한 결과물만 stdout으로 보내므로, 그대로 사용합니다.
-            summary = result.stdout
-            
-            if not summary or not summary.strip():
-                 print(f"Warning: Summarization script returned an empty result for title: {title[:30]}")
-                 print(f"Stderr from script:\n{result.stderr}") # 디버깅을 위해 stderr 출력
-
-        except subprocess.CalledProcessError as e:
-            print(f"Error calling summarization script for title '{title[:30]}': {e}")
-            print(f"Stdout from script on error:\n{e.stdout}")
-            print(f"Stderr from script on error:\n{e.stderr}")
-            summary = "" # 오류 발생 시 요약문은 비워둠
-        except Exception as e:
-            print(f"An unexpected error occurred during summarization for title '{title[:30]}': {e}")
-            summary = ""
-        finally:
-            if tmp_file_path and os.path.exists(tmp_file_path):
-                os.remove(tmp_file_path)
-
-        return summary.strip()
-
 # def load_articles_from_gcs(gcs_prefix: str) -> List[Dict[str, Any]]:
 #     """
 #     기능: GCS의 특정 경로(prefix)에 있는 모든 JSON 파일을 다운로드하여 내용물을 리스트로 반환합니다.
@@ -144,95 +78,204 @@ def load_articles_from_local(local_path_prefix: str) -> List[Dict[str, Any]]:
     print(f"총 {len(all_articles)}개의 기사를 로컬에서 로드했습니다.")
     return all_articles
 
+def load_summarizer() -> GptOssSummarizer:
+    """
+    기능: 요약기를 만들고 요약 워커의 모델 로드가 끝날 때까지 기다립니다. 모델 레지스트리의 'summarizer' 로더로 쓰입니다.
+          워커 시작에 실패해도 요약기는 돌려주며, 첫 요약 요청 때 워커를 다시 띄웁니다.
+          워커의 프롬프트 버전이 다르면 다시 띄워도 같으므로 예외를 그대로 올립니다.
+    input: 없음
+    output: GptOssSummarizer 인스턴스
+    """
+    summarizer = GptOssSummarizer()
+    try:
+        summarizer.worker.start()
+    except SummarizationPromptVersionError:
+        summarizer.close()
+        raise
+    except SummarizationWorkerError as e:
+        print(f"[SummaryWorker] 미리 로드 실패, 첫 요청 때 다시 시작합니다: {e}")
+    return summarizer
+
+# 파이프라인 시작 시 백그라운드에서 미리 로드할 수 있도록 요약기, 형태소 분석기, 번역기(summary 번역 모드) 로더를 등록한다.
+get_model_registry().register('summarizer', load_summarizer, closer=GptOssSummarizer.close)
+get_model_registry().register('tokenizer', warm_up_tokenizer)
+get_model_registry().register('translator', get_translator)
+
 def run_processing_pipeline(
     local_data_path: str
 ) -> None:
     """전체 기사 처리 파이프라인을 실행합니다."""
     logger = setup_logger('processing_pipeline')
+    registry = get_model_registry()
+    # 수집 단계에서 이미 시작했으면 그대로 두고, 아니면 기사 로드/그룹화와 겹쳐 요약 모델을 로드하기 시작한다.
+    registry.prewarm('summarizer', 'tokenizer')
+    if TRANSLATION_MODE == "summary":
+        registry.prewarm('translator')
     
     # 1. 로컬에서 기사 로드
     logger.info(f"로컬에서 기사 로드 중: {local_data_path}")
     articles = load_articles_from_local(local_data_path)
     if not articles:
         logger.warning("처리할 기사가 없습니다.")
+        registry.release('summarizer')
         return
 
     # 2. 기사 그룹화
     logger.info(f"총 {len(articles)}개의 기사 그룹화 중...")
+    registry.get('tokenizer')
     grouper = ArticleGrouper()
     groups, noise = grouper.group(articles)
     logger.info(f"그룹핑 완료: {len(groups)}개 그룹, {len(noise)}개 단일 기사.")
 
-    # 3. 요약기 초기화
-    summarizer = GptOssSummarizer()
+    # 3. 요약기 준비 (미리 로드가 끝나지 않았으면 기다린다)
+    summarizer = registry.get('summarizer')
     
     # 4. 각 그룹 처리 및 DB 저장
+    # summary 번역 모드에서는 묶음마다 영어 결과의 제목과 요약문을 번역한 뒤 저장한다.
+    output_translator = EnglishOutputTranslator(logger) if TRANSLATION_MODE == "summary" else None
     try:
         with get_db() as db:
             # 4-1. 단일 기사(noise) 처리
+            # 토큰 예산 단위로 묶어 워커가 한 번의 generate로 여러 기사를 요약하게 한다.
             logger.info(f"{len(noise)}개의 단일 기사를 처리합니다...")
-            for article in noise:
-                logger.info(f"단일 기사 처리 중: {article['title'][:30]}...")
-                summary = summarizer.refine_text(article['title'], article['body'])
-                article['body'] = summary
-                
-                # crud 함수가 기대하는 데이터 형식에 맞춰 키를 추가/매핑합니다.
-                if 'url' in article and 'source_url' not in article:
-                    article['source_url'] = article['url']
-                if 'source' in article and 'source_title' not in article:
-                    article['source_title'] = article['title']
-                if 'source' in article and 'press_company' not in article:
-                    article['press_company'] = article['source']
-                
-                crud.create_single_article(db=db, article_data=article)
+            for batch in make_token_budget_batches(noise, lambda art: art.get('body', '')):
+                logger.info(f"단일 기사 {len(batch)}개 묶음 요약 중: {batch[0]['title'][:30]}...")
+                results = summarizer.summarize_batch([(art['title'], art['body']) for art in batch])
+
+                for article, result in zip(batch, results):
+                    article['body'] = result['summary']
+
+                    # crud 함수가 기대하는 데이터 형식에 맞춰 키를 추가/매핑합니다.
+                    if 'url' in article and 'source_url' not in article:
+                        article['source_url'] = article['url']
+                    if 'source' in article and 'source_title' not in article:
+                        article['source_title'] = article['title']
+                    if 'source' in article and 'press_company' not in article:
+                        article['press_company'] = article['source']
+
+                if output_translator:
+                    output_translator.translate(batch)
+                for article in batch:
+                    crud.create_single_article(db=db, article_data=article)
 
             # 4-2. 그룹 기사 처리
             logger.info(f"{len(groups)}개의 그룹 기사를 처리합니다...")
-            for group in groups:
-                if not group: continue
-                
-                representative_article = group[0]
-                logger.info(f"그룹 대표 기사 처리 중: {representative_article['title'][:30]}... ({len(group)}개 기사)")
-
-                # 그룹 내 모든 기사 본문을 하나로 합침
-                text_to_summarize = "\n\n".join(
-                    [art.get('body', '').strip() for art in group if art.get('body')]
-                )
-                
-                summary = summarizer.refine_text(representative_article['title'], text_to_summarize)
-                
-                # 대표 기사 데이터 준비
-                if 'url' in representative_article and 'source_url' not in representative_article:
-                    representative_article['source_url'] = representative_article['url']
-                
-                representative_article_data = {
-                    'title': representative_article['title'],
-                    'body': summary,
-                    'category': representative_article.get('category', '기타'),
-                    'image_url': representative_article.get('image_url', ''),
-                    'source_url': representative_article.get('source_url')
-                }
-
-                # 원본 기사 목록 준비
-                source_articles_data = [
-                    {
-                        'title': art.get('title'),
-                        'url': art.get('url'),
-                        'press_company': art.get('source')
-                    } for art in group
-                ]
-                
-                crud.create_grouped_article(
-                    db=db,
-                    representative_article_data=representative_article_data,
-                    source_articles_data=source_articles_data
+            # 그룹 내 모든 기사 본문을 하나로 합침
+            # 본문을 정렬해 합치므로 그룹 구성원이 같으면 순서가 달라도 요약 캐시 키가 같다.
+            group_entries = [
+                (group, "\n\n".join(sorted([art.get('body', '').strip() for art in group if art.get('body')])))
+                for group in groups if group
+            ]
+            for batch in make_token_budget_batches(group_entries, lambda entry: entry[1]):
+                logger.info(f"그룹 기사 {len(batch)}개 묶음 요약 중...")
+                results = summarizer.summarize_batch(
+                    [(group[0]['title'], text_to_summarize) for group, text_to_summarize in batch]
                 )
 
+                grouped_outputs = []
+                for (group, _), result in zip(batch, results):
+                    representative_article = group[0]
+
+                    # 대표 기사 데이터 준비
+                    if 'url' in representative_article and 'source_url' not in representative_article:
+                        representative_article['source_url'] = representative_article['url']
+
+                    representative_article_data = {
+                        'title': representative_article['title'],
+                        'body': result['summary'],
+                        'category': representative_article.get('category', '기타'),
+                        'image_url': representative_article.get('image_url', ''),
+                        'source_url': representative_article.get('source_url')
+                    }
+
+                    # 원본 기사 목록 준비
+                    source_articles_data = [
+                        {
+                            'title': art.get('title'),
+                            'url': art.get('url'),
+                            'press_company': art.get('source')
+                        } for art in group
+                    ]
+                    grouped_outputs.append((representative_article, representative_article_data, source_articles_data))
+
+                if output_translator:
+                    output_translator.translate(
+                        [data for _, data, _ in grouped_outputs],
+                        languages=[article.get('language') for article, _, _ in grouped_outputs]
+                    )
+                for representative_article, representative_article_data, source_articles_data in grouped_outputs:
+                    logger.info(f"그룹 대표 기사 저장 중: {representative_article_data['title'][:30]}... ({len(source_articles_data)}개 기사)")
+                    crud.create_grouped_article(
+                        db=db,
+                        representative_article_data=representative_article_data,
+                        source_articles_data=source_articles_data
+                    )
+
         logger.info(f"기사 처리 파이프라인 완료.")
 
     except Exception as e:
         logger.error(f"기사 처리 파이프라인 중 오류 발생: {e}", exc_info=True)
+    finally:
+        if output_translator:
+            output_translator.close()
+        registry.release('summarizer')
+        logger.info(f"[ModelRegistry] {registry.status()}")
+
+class EnglishOutputTranslator:
+    """
+    summary 번역 모드에서 영어 기사로 만든 최종 결과(단일 기사 요약, 그룹 대표 기사)의 제목과 요약문을 묶음 단위로 번역하는 클래스.
+    번역기와 번역 메모리는 처음 번역할 영어 결과가 나왔을 때 한 번만 준비한다.
+    """
+    def __init__(self, logger: logging.Logger):
+        self.logger = logger
+        self.translator = None
+        self.memory = None
+        self._prepared = False
+
+    def _prepare(self):
+        self._prepared = True
+        try:
+            self.translator = get_model_registry().get('translator')
+        except Exception:
+            self.translator = None
+        if self.translator is None:
+            self.logger.warning("번역기를 불러오지 못해 영어 요약을 번역하지 않고 저장합니다.")
+            return
+        if USE_TRANSLATION_MEMORY:
+            self.memory = TranslationMemory(self.translator.get_model_info()['model_name'])
+
+    def translate(self, outputs: List[Dict[str, Any]], languages: List[str] | None = None):
+        """
+        기능: 결과들 중 영어 기사에서 나온 것의 제목과 (요약 모델이 영어로 쓴 경우) 요약문을 한 번에 번역합니다.
+              요약 모델이 이미 한국어로 요약한 본문은 번역하지 않습니다.
+        input: outputs ('title', 'body'를 가진 결과 딕셔너리 리스트. 제자리에서 수정),
+               languages (결과별 원문 언어. 생략하면 각 결과의 'language')
+        output: 없음
+        """
+        languages = languages or [output.get('language') for output in outputs]
+        targets = []
+        for output, language in zip(outputs, languages):
+            if language != 'en':
+                continue
+            targets.append((output, 'title'))
+            if output.get('body') and is_english_text(output['body']):
+                targets.append((output, 'body'))
+        if not targets:
+            return
+        if not self._prepared:
+            self._prepare()
+        if self.translator is None:
+            return
+
+        texts = [output[key] for output, key in targets]
+        self.logger.info(f"영어 결과의 제목/요약문 {len(texts)}개를 번역합니다. ({sum(len(text) for text in texts)}자)")
+        for (output, key), translated in zip(targets, translate_texts_blocking(self.translator, texts, self.memory)):
+            output[key] = translated
 
+    def close(self):
+        if self.memory is not None:
+            self.logger.info(f"[TranslationMemory] {self.memory.stats()}")
+            self.memory.close()
 
 if __name__ == "__main__":
     print("이 스크립트는 외부(예: 파이프라인 조정자)에서 local_data_path 인자와 함께 호출되어야 합니다.")
@@ -5,12 +5,11 @@ from datetime import datetime
 from typing import List, Dict, Any
 # from google.cloud import storage
 # import io
-import subprocess
-import tempfile
 
 # 필요한 모듈 임포트
 from src.processing.article_grouper import ArticleGrouper
 # from src.processing.summarizer import GeminiAPIRefiner
+from src.processing.gpt_oss_summarizer import GptOssSummarizer, make_token_budget_batches
 from DB.database import get_db
 from src.utils.logger import setup_logger
 
@@ -20,75 +19,6 @@ PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 # storage_client = storage.Client()
 # bucket = storage_client.bucket(GCS_BUCKET_NAME)
 
-class GptOssSummarizer:
-    """
-    외부 gpt-oss-20b 요약 스크립트를 호출하여 요약을 수행하는 클래스.
-    """
-    def __init__(self):
-        current_script_path = os.path.dirname(os.path.abspath(__file__))
-        self.summarization_script_path = os.path.join(current_script_path, 'run_summarization_by_gpt.py')
-        if not os.path.exists(self.summarization_script_path):
-            raise FileNotFoundError(f"Summarization script not found at: {self.summarization_script_path}")
-
-    def refine_text(self, title: str, body: str) -> str:
-        if not body or not body.strip():
-            print("Warning: Empty body provided for summarization. Skipping.")
-            return ""
-
-        summary = ""
-        tmp_file_path = None
-        try:
-            # 임시 파일에 요약할 본문 내용 저장
-            with tempfile.NamedTemporaryFile(mode='w+', delete=False, encoding='utf-8', suffix='.txt') as tmp_file:
-                tmp_file.write(body)
-                tmp_file_path = tmp_file.name
-
-            command = [
-                sys.executable,  # 현재 파이썬 인터프리터 사용
-                self.summarization_script_path,
-                '--text_file',
-                tmp_file_path
-            ]
-            
-            # [수정] 자식 프로세스를 위한 환경 변수 설정
-            # 부모 프로세스의 환경을 복사한 뒤, 필요한 HF 관련 변수를 덮어씁니다.
-            # 이렇게 해야 자식 프로세스가 올바른 캐시 경로를 사용합니다.
-            child_env = os.environ.copy()
-            child_env['HF_HOME'] = '/home/bobo9245/projects/hf_cache'
-            child_env['HF_HUB_ENABLE_HF_TRANSFER'] = '1'
-
-            print(f"Calling GPT-OSS summarization script for title: {title[:30]}...")
-            result = subprocess.run(
-                command, 
-                capture_output=True, 
-                text=True, 
-                encoding='utf-8', 
-                check=True,
-                env=child_env  # 생성한 환경 변수를 자식 프로세스에 전달
-            )
-
-            # [수정된 최종 로직]
-            # 이제 요약 스크립트가 순수한 결과물만 stdout으로 보내므로, 그대로 사용합니다.
-            summary = result.stdout
-            
-            if not summary or not summary.strip():
-                 print(f"Warning: Summarization script returned an empty result for title: {title[:30]}")
-                 print(f"Stderr from script:\n{result.stderr}") # 디버깅을 위해 stderr 출력
-
-        except subprocess.CalledProcessError as e:
-            print(f"Error calling summarization script for title '{title[:30]}': {e}")
-            print(f"Stdout from script on error:\n{e.stdout}")
-            print(f"Stderr from script on error:\n{e.stderr}")
-            summary = "" # 오류 발생 시 요약문은 비워둠
-        except Exception as e:
-            print(f"An unexpected error occurred during summarization for title '{title[:30]}': {e}")
-            summary = ""
-        finally:
-            if tmp_file_path and os.path.exists(tmp_file_path):
-                os.remove(tmp_file_path)
-
-        return summary.strip()
-
 # def load_articles_from_gcs(gcs_prefix: str) -> List[Dict[str, Any]]:
 #     """
 #     기능: GCS의 특정 경로(prefix)에 있는 모든 JSON 파일을 다운로드하여 내용물을 리스트로 반환합니다.
@@ -183,80 +113,96 @@ def run_processing_for_wc_pipeline(local_data_path: str):
     
     logger.info(f"전체 그룹핑 완료: {len(all_groups)}개 그룹, {len(all_noise)}개 단일 기사.")
 
+    summarizer = GptOssSummarizer()
     try:
         with get_db() as db:
-            summarizer = GptOssSummarizer()
 
             # 단일 기사(noise) 처리
+            noise_entries = []
             for article_data in all_noise:
-                title = article_data.get('title', '제목 없음')
-                logger.info(f"단일 기사 처리 중: {title[:30]}...")
-                
                 body_content = article_data.get('body', '')
                 if isinstance(body_content, list):
                     original_body = "\n".join(body_content)
                 else:
                     original_body = body_content
-                
-                summarized_body = summarizer.refine_text(title=title, body=original_body) 
-                if not summarized_body:
-                    logger.warning(f"  - 요약문 생성 실패. 원본 본문을 사용합니다.")
-                    summarized_body = original_body[:1000]
-                
-                final_article_data = {
-                    'title': title,
-                    'body': summarized_body,
-                    'category': article_data.get('category', '기타'),
-                    'image_url': article_data.get('image_url', ''),
-                    'source_title': title,
-                    'source_url': article_data.get('url'),
-                    'press_company': '네이버뉴스'
-                }
-                
-                crud.create_single_article(db=db, article_data=final_article_data)
+                noise_entries.append((article_data, original_body))
+
+            for batch in make_token_budget_batches(noise_entries, lambda entry: entry[1]):
+                logger.info(f"단일 기사 {len(batch)}개 묶음 요약 중...")
+                results = summarizer.summarize_batch(
+                    [(article_data.get('title', '제목 없음'), original_body) for article_data, original_body in batch]
+                )
+
+                for (article_data, original_body), result in zip(batch, results):
+                    title = article_data.get('title', '제목 없음')
+                    summarized_body = result['summary']
+                    if not summarized_body:
+                        logger.warning(f"  - 요약문 생성 실패. 원본 본문을 사용합니다. ({title[:30]})")
+                        summarized_body = original_body[:1000]
+
+                    final_article_data = {
+                        'title': title,
+                        'body': summarized_body,
+                        'category': article_data.get('category', '기타'),
+                        'image_url': article_data.get('image_url', ''),
+                        'source_title': title,
+                        'source_url': article_data.get('url'),
+                        'press_company': '네이버뉴스'
+                    }
+
+                    crud.create_single_article(db=db, article_data=final_article_data)
 
             # 그룹 기사 처리
+            group_entries = []
             for group in all_groups:
                 if not group: continue
-                logger.info(f"{len(group)}개의 기사를 가진 그룹 처리 중...")
-                
                 bodies_to_summarize = [
-                    article.get('body', '').strip() 
+                    article.get('body', '').strip()
                     for article in group if article.get('body')
                 ]
-                text_to_summarize = "\n\n".join(bodies_to_summarize)
-                
-                main_article_title = group[0].get('title', '그룹 기사')
-                summarized_body = summarizer.refine_text(title=main_article_title, body=text_to_summarize)
-                if not summarized_body:
-                    logger.warning(f"  - 그룹 요약문 생성 실패. 그룹 처리를 건너뜁니다.")
-                    continue
+                # 본문을 정렬해 합치므로 그룹 구성원이 같으면 순서가 달라도 요약 캐시 키가 같다.
+                group_entries.append((group, "\n\n".join(sorted(bodies_to_summarize))))
+
+            for batch in make_token_budget_batches(group_entries, lambda entry: entry[1]):
+                logger.info(f"그룹 기사 {len(batch)}개 묶음 요약 중...")
+                results = summarizer.summarize_batch(
+                    [(group[0].get('title', '그룹 기사'), text_to_summarize) for group, text_to_summarize in batch]
+                )
+
+                for (group, _), result in zip(batch, results):
+                    main_article_title = group[0].get('title', '그룹 기사')
+                    summarized_body = result['summary']
+                    if not summarized_body:
+                        logger.warning(f"  - 그룹 요약문 생성 실패. 그룹 처리를 건너뜁니다. ({main_article_title[:30]})")
+                        continue
+
+                    main_article = group[0]
+                    representative_article_data = {
+                        'title': main_article_title,
+                        'body': summarized_body,
+                        'category': main_article.get('category', '기타'),
+                        'image_url': main_article.get('image_url', ''),
+                        'source_url': main_article.get('url')
+                    }
+
+                    source_articles_data = []
+                    for article in group:
+                        source_articles_data.append({
+                            'title': article.get('title'),
+                            'url': article.get('url'),
+                            'press_company': '네이버뉴스'
+                        })
+
+                    crud.create_grouped_article(db=db,
+                                                representative_article_data=representative_article_data,
+                                                source_articles_data=source_articles_data)
 
-                main_article = group[0]
-                representative_article_data = {
-                    'title': main_article_title,
-                    'body': summarized_body,
-                    'category': main_article.get('category', '기타'),
-                    'image_url': main_article.get('image_url', ''),
-                    'source_url': main_article.get('url')
-                }
-                
-                source_articles_data = []
-                for article in group:
-                    source_articles_data.append({
-                        'title': article.get('title'),
-                        'url': article.get('url'),
-                        'press_company': '네이버뉴스'
-                    })
-                
-                crud.create_grouped_article(db=db, 
-                                            representative_article_data=representative_article_data,
-                                            source_articles_data=source_articles_data)
-        
         logger.info(f"기사 처리 파이프라인 완료. 마지막 처리 시간: {processing_start_time.isoformat()}")
 
     except Exception as e:
         logger.error(f"기사 처리 파이프라인 중 오류 발생: {e}", exc_info=True)
+    finally:
+        summarizer.close()
 
 if __name__ == "__main__":
     print("이 스크립트는 외부(예: 파이프라인 조정자)에서 local_data_path 인자와 함께 호출되어야 합니다.") 
\ No newline at end of file
@@ -2,49 +2,72 @@
 단일 기사 텍스트를 입력받아 gpt-oss-20b 모델로 요약(재작성)을 생성합니다.
 사용법:
 python scripts/run_summarization_by_gpt.py --text_file sample.txt
+
+상주 워커 모드 (모델을 한 번만 로드하고 stdin/stdout JSON 라인으로 작업을 처리):
+python scripts/run_summarization_by_gpt.py --serve
 """
 import os
 import sys
+import json
 import torch
 from transformers import AutoTokenizer, AutoModelForCausalLM
 import argparse
 import pathlib
 import textwrap
 
+# 스크립트 경로로 직접 실행되므로 프로젝트 루트를 추가해 src 패키지를 불러온다.
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+# build_prompt()의 지시문을 바꾸면 gpt_oss_summarizer.PROMPT_VERSION을 올린다. ready 이벤트로 부모에게 알려준다.
+from src.processing.gpt_oss_summarizer import PROMPT_VERSION
+
 os.environ['HF_HOME'] = '/home/bobo9245/projects/hf_cache'
 os.environ['HF_HUB_ENABLE_HF_TRANSFER'] = '1'
 
+MODEL_ID = os.getenv("SUMMARY_MODEL_ID", "openai/gpt-oss-20b")
+# 한 번의 generate()에 넣을 입력 토큰 총량(패딩 포함)과 최대 기사 수
+GENERATE_TOKEN_BUDGET = int(os.getenv("SUMMARY_GENERATE_TOKEN_BUDGET", 12000))
+GENERATE_MAX_BATCH_SIZE = int(os.getenv("SUMMARY_GENERATE_MAX_BATCH_SIZE", 8))
+GENERATION_KWARGS = dict(
+    max_new_tokens=6000,
+    do_sample=True,
+    temperature=0.4,
+    repetition_penalty=1.2,
+    top_k=50,
+    top_p=0.95
+)
 
-def summarize_with_gpt(article_path):
-    """gpt-oss-20b 모델을 사용하여 텍스트 파일을 읽어 기사 형식으로 재작성하고, 최종 결과만 stdout으로 출력합니다."""
-    
-    # 1. 모델 및 토크나이저 불러오기
-    model_id = "openai/gpt-oss-20b"
+
+def load_model(model_id: str = MODEL_ID):
+    """
+    기능: gpt-oss 모델과 토크나이저를 불러온다.
+    input: model_id (HuggingFace 모델 ID)
+    output: (model, tokenizer) 튜플
+    """
     print(f"'{model_id}' 모델과 토크나이저를 불러옵니다...", file=sys.stderr)
-    try:
-        model = AutoModelForCausalLM.from_pretrained(
-            model_id,
-            torch_dtype="auto",
-            device_map="auto",
-        )
-        tokenizer = AutoTokenizer.from_pretrained(model_id)
-        model.eval()
-    except Exception as e:
-        print(f"모델 로딩 중 오류 발생: {e}", file=sys.stderr)
-        return
+    model = AutoModelForCausalLM.from_pretrained(
+        model_id,
+        torch_dtype="auto",
+        device_map="auto",
+    )
+    tokenizer = AutoTokenizer.from_pretrained(model_id)
+    model.eval()
+    # 배치 생성 시 causal LM은 왼쪽 패딩이어야 프롬프트 끝에서 바로 생성이 이어진다.
+    tokenizer.padding_side = "left"
+    if tokenizer.pad_token is None:
+        tokenizer.pad_token = tokenizer.eos_token
+    return model, tokenizer
 
-    # 2. 텍스트 파일 읽기
-    try:
-        document = pathlib.Path(article_path).read_text(encoding='utf-8')
-    except FileNotFoundError:
-        print(f"오류: 파일 경로를 찾을 수 없습니다 - {article_path}", file=sys.stderr)
-        return
-    except Exception as e:
-        print(f"파일 읽기 중 오류 발생: {e}", file=sys.stderr)
-        return
 
-    # 3. 프롬프트 구성
-    prompt_content = f"""당신은 주어진 '원본 본문'을 최종 결과물로 가공하는 전문 텍스트 가공자이다. 당신의 유일한 임무는 아래의 '엄격한 가이드라인'을 완벽하게 준수하여 '완성된 기사 본문'만을 출력하는 것이다.
+def build_prompt(document: str) -> str:
+    """
+    기능: 원본 본문을 재작성 지시 프롬프트로 감싼다.
+    input: document (원본 본문)
+    output: 프롬프트 문자열
+    """
+    return f"""당신은 주어진 '원본 본문'을 최종 결과물로 가공하는 전문 텍스트 가공자이다. 당신의 유일한 임무는 아래의 '엄격한 가이드라인'을 완벽하게 준수하여 '완성된 기사 본문'만을 출력하는 것이다.
 
     **[엄격한 가이드라인]**
     1.  **절대적인 출력 형식:** 당신의 최종 응답은 **오직 [완성된 기사 본문]**이어야 한다. 제목, 부제, 당신의 생각, 분석 과정, 노트, 설명 등 그 어떤 추가 텍스트도 절대로 포함해서는 안 된다. 또한, 특수 기호를 사용하지 않는다.
@@ -63,56 +86,197 @@ def summarize_with_gpt(article_path):
     이제, 모든 가이드라인과 예시를 완벽히 준수하여 다른 어떤 설명도 없이 '완성된 기사 본문'의 텍스트만 즉시 시작하라.
     [완성된 기사 본문]
     """
-    messages = [{"role": "user", "content": prompt_content}]
-    prompt = tokenizer.apply_chat_template(messages, tokenize=False, add_generation_prompt=True)
-    
-    # 4. 추론 수행
+
+
+def parse_generation(output_text: str) -> str:
+    """
+    기능: 모델 출력에서 최종 답변 부분만 잘라낸다. (inference_gpt.py 방식)
+    input: output_text (디코딩된 모델 출력 전체)
+    output: 최종 기사 본문 문자열
+    """
+    if "assistantfinal" in output_text:
+        return output_text.split("assistantfinal")[-1].strip()
+    if "<|assistant|>" in output_text:
+        return output_text.split("<|assistant|>")[-1].strip()
+    # 두 마커가 모두 없는 경우, 모델의 전체 출력을 그대로 사용합니다.
+    return output_text.strip()
+
+
+def _chat_prompt(tokenizer, document: str) -> str:
+    messages = [{"role": "user", "content": build_prompt(document)}]
+    return tokenizer.apply_chat_template(messages, tokenize=False, add_generation_prompt=True)
+
+
+def _generate(model, tokenizer, prompts: list[str]) -> list[str]:
+    """프롬프트 묶음을 패딩해 한 번의 generate()로 처리하고, 입력 순서대로 최종 본문을 돌려준다."""
+    inputs = tokenizer(prompts, return_tensors="pt", padding=True).to(model.device)
+    with torch.no_grad():
+        outputs = model.generate(**inputs, eos_token_id=tokenizer.eos_token_id,
+                                 pad_token_id=tokenizer.pad_token_id, **GENERATION_KWARGS)
+    return [parse_generation(tokenizer.decode(row, skip_special_tokens=True)) for row in outputs]
+
+
+def generate_summary(model, tokenizer, document: str) -> str:
+    """
+    기능: 이미 로드된 모델로 한 건의 본문을 재작성한다. 추론 오류는 호출자에게 그대로 전달된다.
+    input: model, tokenizer (load_model 결과), document (원본 본문)
+    output: 재작성된 기사 본문
+    """
+    return _generate(model, tokenizer, [_chat_prompt(tokenizer, document)])[0]
+
+
+def summarize_batch(model, tokenizer, items: list[tuple[str, str]],
+                    token_budget: int = GENERATE_TOKEN_BUDGET,
+                    max_batch_size: int = GENERATE_MAX_BATCH_SIZE) -> list[dict]:
+    """
+    기능: 여러 (title, body)를 토큰 길이가 비슷한 것끼리 묶어 패딩한 뒤 함께 생성한다.
+          묶음 생성이 실패하면 그 묶음만 한 건씩 다시 시도해 오류를 기사 단위로 격리한다.
+    input: model, tokenizer (load_model 결과), items ((title, body) 리스트),
+           token_budget (한 묶음의 최대 입력 토큰 수, 패딩 포함), max_batch_size (한 묶음의 최대 기사 수)
+    output: 입력 순서와 같은 {"summary": str, "error": str | None} 리스트
+    """
+    results: list[dict] = [{"summary": "", "error": None} for _ in items]
+    prompts = []
+    for index, (_, body) in enumerate(items):
+        try:
+            prompt = _chat_prompt(tokenizer, body)
+            prompts.append((index, prompt, len(tokenizer(prompt)["input_ids"])))
+        except Exception as e:
+            results[index]["error"] = f"prompt build failed: {e}"
+
+    # 길이순으로 정렬해 패딩 낭비를 줄이고, 최장 길이 x 개수가 예산을 넘기 전에 묶음을 자른다.
+    prompts.sort(key=lambda entry: entry[2])
+    batches, current = [], []
+    for entry in prompts:
+        candidate = current + [entry]
+        if current and (len(candidate) > max_batch_size or entry[2] * len(candidate) > token_budget):
+            batches.append(current)
+            candidate = [entry]
+        current = candidate
+    if current:
+        batches.append(current)
+
+    for batch in batches:
+        print(f"[summarize_batch] {len(batch)}건 묶음 생성 (최대 입력 {batch[-1][2]} 토큰)", file=sys.stderr)
+        try:
+            summaries = _generate(model, tokenizer, [prompt for _, prompt, _ in batch])
+            for (index, _, _), summary in zip(batch, summaries):
+                results[index]["summary"] = summary
+        except Exception as e:
+            print(f"묶음 추론 중 오류 발생, 한 건씩 재시도합니다: {e}", file=sys.stderr)
+            for index, prompt, _ in batch:
+                try:
+                    results[index]["summary"] = _generate(model, tokenizer, [prompt])[0]
+                except Exception as item_error:
+                    results[index]["error"] = str(item_error)
+    return results
+
+
+def summarize_with_gpt(article_path):
+    """gpt-oss-20b 모델을 사용하여 텍스트 파일을 읽어 기사 형식으로 재작성하고, 최종 결과만 stdout으로 출력합니다."""
+
+    # 1. 모델 및 토크나이저 불러오기
+    try:
+        model, tokenizer = load_model()
+    except Exception as e:
+        print(f"모델 로딩 중 오류 발생: {e}", file=sys.stderr)
+        return
+
+    # 2. 텍스트 파일 읽기
+    try:
+        document = pathlib.Path(article_path).read_text(encoding='utf-8')
+    except FileNotFoundError:
+        print(f"오류: 파일 경로를 찾을 수 없습니다 - {article_path}", file=sys.stderr)
+        return
+    except Exception as e:
+        print(f"파일 읽기 중 오류 발생: {e}", file=sys.stderr)
+        return
+
+    # 3. 추론 수행
     print("\n--- 추론 시작 ---", file=sys.stderr)
-    inputs = tokenizer(prompt, return_tensors="pt").to(model.device)
-    
     summary = ""
     try:
-        with torch.no_grad():
-            outputs = model.generate(
-                **inputs,
-                max_new_tokens=6000,
-                eos_token_id=tokenizer.eos_token_id,
-                do_sample=True,
-                temperature=0.4,
-                repetition_penalty=1.2,
-                top_k=50,
-                top_p=0.95
-            )
-        
-        output_text = tokenizer.decode(outputs[0], skip_special_tokens=True)
-
-        # 5. 결과 파싱 (inference_gpt.py 방식 적용)
-        if "assistantfinal" in output_text:
-            summary = output_text.split("assistantfinal")[-1].strip()
-        elif "<|assistant|>" in output_text:
-            summary = output_text.split("<|assistant|>")[-1].strip()
-        else:
-            # 두 마커가 모두 없는 경우, 모델의 전체 출력을 그대로 사용합니다.
-            summary = output_text
-
+        summary = generate_summary(model, tokenizer, document)
     except Exception as e:
         print(f"추론 중 오류 발생: {e}", file=sys.stderr)
 
-    # 6. 최종 결과물만 표준 출력(stdout)으로 인쇄
+    # 4. 최종 결과물만 표준 출력(stdout)으로 인쇄
     print(summary.strip())
-    
-    # 7. 상세 로그는 표준 에러(stderr)로 인쇄
+
+    # 5. 상세 로그는 표준 에러(stderr)로 인쇄
     print("\n--- 추론 종료 ---", file=sys.stderr)
     print("\n◆ 원본 본문 (stderr 로그)\n" + textwrap.fill(document, 60), file=sys.stderr)
     print("\n◆ 생성된 기사 본문 (stderr 로그)\n" + textwrap.fill(summary, 60), file=sys.stderr)
 
 
+def serve():
+    """
+    기능: 모델을 한 번만 로드한 뒤 stdin으로 들어오는 JSON 라인 작업을 순서대로 처리하는 상주 워커.
+          단건 요청: {"id": int, "title": str, "body": str}
+          단건 응답: {"id": int, "summary": str, "error": str | null}
+          묶음 요청: {"id": int, "items": [{"title": str, "body": str}, ...]}
+          묶음 응답: {"id": int, "results": [{"summary": str, "error": str | null}, ...]}
+          모델 로드가 끝나면 {"event": "ready"}를 먼저 보낸다.
+    input: 없음 (stdin)
+    output: 없음 (stdout)
+    """
+    # 프로토콜 채널은 원래 stdout만 사용하고, 라이브러리가 찍는 로그는 모두 stderr로 보낸다.
+    protocol_out = sys.stdout
+    sys.stdout = sys.stderr
+
+    def send(message: dict):
+        protocol_out.write(json.dumps(message, ensure_ascii=False) + "\n")
+        protocol_out.flush()
+
+    try:
+        model, tokenizer = load_model()
+    except Exception as e:
+        print(f"모델 로딩 중 오류 발생: {e}", file=sys.stderr)
+        send({"event": "fatal", "error": f"model load failed: {e}"})
+        sys.exit(1)
+
+    send({"event": "ready", "model_id": MODEL_ID, "prompt_version": PROMPT_VERSION})
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            job = json.loads(line)
+        except json.JSONDecodeError as e:
+            send({"id": None, "summary": "", "error": f"invalid job: {e}"})
+            continue
+
+        job_id = job.get("id")
+        if "items" in job:
+            items = [(item.get("title", ""), item.get("body", "")) for item in job["items"]]
+            try:
+                send({"id": job_id, "results": summarize_batch(model, tokenizer, items), "error": None})
+            except Exception as e:
+                print(f"묶음 작업 처리 중 오류 발생 (job {job_id}): {e}", file=sys.stderr)
+                send({"id": job_id, "results": [{"summary": "", "error": str(e)} for _ in items], "error": str(e)})
+            continue
+
+        try:
+            summary = generate_summary(model, tokenizer, job.get("body", ""))
+            send({"id": job_id, "summary": summary, "error": None})
+        except Exception as e:
+            print(f"추론 중 오류 발생 (job {job_id}): {e}", file=sys.stderr)
+            send({"id": job_id, "summary": "", "error": str(e)})
+
+
 def main():
     parser = argparse.ArgumentParser(description="GPT-OSS-20B 모델을 사용하여 기사를 재작성합니다.")
-    parser.add_argument("--text_file", type=str, required=True, help="재작성할 기사 본문이 담긴 텍스트 파일 경로")
+    parser.add_argument("--text_file", type=str, help="재작성할 기사 본문이 담긴 텍스트 파일 경로")
+    parser.add_argument("--serve", action="store_true", help="모델을 한 번만 로드하고 stdin/stdout으로 작업을 받는 상주 워커 모드")
     args = parser.parse_args()
-    
-    summarize_with_gpt(args.text_file)
+
+    if args.serve:
+        serve()
+    elif args.text_file:
+        summarize_with_gpt(args.text_file)
+    else:
+        parser.error("--text_file 또는 --serve 중 하나를 지정해야 합니다.")
 
 
 if __name__ == "__main__":
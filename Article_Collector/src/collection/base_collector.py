@@ -1,6 +1,21 @@
 from abc import ABC, abstractmethod
 import aiohttp
 import asyncio
+from contextlib import asynccontextmanager
+from src.utils.http_session import get_session
+from src.utils.rate_limiter import get_rate_limiter, THROTTLE_STATUSES
+from src.utils.http_cache import HttpCache, get_http_cache
+from src.collection.crawl_engine import ARTICLE_WORKERS, get_in_flight_semaphore, run_worker_pool
+from src.collection.url_frontier import get_url_frontier
+from src.collection.parse_executor import run_parser
+from src.collection.html_parser import DEFAULT_PARSER, collector_parser
+from src.collection.extraction_spec import get_extraction_spec, extract_links, extract_article
+from src.collection.structured_data import parse_with_structured_data
+from src.collection.feed_discovery import DISCOVERY_MODE, FEED_CHUNK_SIZE, FEED_OVERLAP_SECONDS, MAX_SITEMAP_DEPTH, FeedParser, slug_title
+from xml.etree.ElementTree import ParseError
+
+# 429/503 응답을 받았을 때 레이트 리미터의 백오프를 거쳐 다시 시도하는 횟수
+MAX_THROTTLE_RETRIES = 2
 
 class BaseCollector(ABC):
     """
@@ -8,10 +23,125 @@ class BaseCollector(ABC):
     input: 없음
     output: 없음
     """
+    # 추출 함수가 쓰는 HTML 파서 백엔드 (html.parser / lxml / selectolax). 수집기별로 덮어쓴다.
+    html_parser = DEFAULT_PARSER
+    # 추출 함수가 CSS 선택자와 문자열 조건만 써서 selectolax로 파싱해도 되는지. HTML_PARSER=selectolax는 이런 수집기에만 적용된다.
+    selectolax_safe = False
+    # configs/extraction_specs.yaml의 스펙 이름. 지정한 수집기는 extract_*_with_spec으로 목록/기사를 추출한다.
+    extraction_spec = None
+    # 기사 페이지의 ld+json/og: 메타를 먼저 훑어 DOM 파싱을 건너뛸지 여부. 구조화 데이터가 부정확한 사이트는 끈다.
+    use_structured_data = True
+
     def __init__(self, site_name, base_url):
         self.site_name = site_name
         self.base_url = base_url
         self.timeout_seconds = 30 # 기본 타임아웃 30초로 설정
+        self.html_parser = collector_parser(self.html_parser, self.selectolax_safe)
+        self.rate_limiter = get_rate_limiter()
+        self.url_frontier = get_url_frontier()
+        self.http_cache = get_http_cache()
+        if self.extraction_spec:
+            # 시작 시 스펙을 컴파일해 두어 설정 오류를 바로 드러내고, 추출 경로에서는 다시 컴파일하지 않는다.
+            get_extraction_spec(self.extraction_spec)
+
+    async def fetch_text(self, session: aiohttp.ClientSession, url: str, timeout: int | None = None, headers: dict | None = None, use_cache: bool = False) -> str:
+        """
+        기능: 호스트별 레이트 리미터의 허가를 받은 뒤 URL의 본문을 가져온다.
+              429/503 응답은 리미터에 알려 감속/대기한 뒤 다시 시도한다.
+              use_cache이면 디스크 HTTP 캐시를 거친다. (신선하면 캐시 본문, 아니면 조건부 요청 후 304면 캐시 본문)
+        input: aiohttp 클라이언트 세션(session), 요청 URL(url), 타임아웃 초(timeout), 요청 헤더(headers, 생략 시 self.headers),
+               캐시 사용 여부(use_cache, 목록/검색 페이지용)
+        output: 응답 본문 문자열 (str). 실패 시 aiohttp.ClientResponseError 등 예외 발생
+        """
+        return await self._fetch(session, url, timeout, headers, use_cache=use_cache, as_bytes=False)
+
+    async def fetch_bytes(self, session: aiohttp.ClientSession, url: str, timeout: int | None = None, headers: dict | None = None) -> bytes:
+        """
+        기능: fetch_text와 같은 경로(레이트 리미터, 동시 요청 상한, 재시도)로 응답 본문을 디코딩하지 않은 bytes로 가져온다.
+              파싱 프로세스 풀에 그대로 넘길 기사 본문 페이지용이며, 문자셋 판별은 파서가 맡는다.
+        input: aiohttp 클라이언트 세션(session), 요청 URL(url), 타임아웃 초(timeout), 요청 헤더(headers)
+        output: 응답 본문 (bytes)
+        """
+        return await self._fetch(session, url, timeout, headers, use_cache=False, as_bytes=True)
+
+    async def _fetch(self, session: aiohttp.ClientSession, url: str, timeout: int | None, headers: dict | None, use_cache: bool, as_bytes: bool):
+        headers = headers if headers is not None else getattr(self, 'headers', None)
+        timeout = timeout or self.timeout_seconds
+
+        cache_entry = None
+        if use_cache:
+            cache_entry = self.http_cache.lookup(url)
+            cached_body = self.http_cache.get_fresh(cache_entry, url)
+            if cached_body is not None:
+                return cached_body
+            headers = {**(headers or {}), **HttpCache.conditional_headers(cache_entry)}
+
+        async with self._request(session, url, headers, timeout) as response:
+            if response.status == 304 and cache_entry is not None:
+                self.http_cache.refresh(url)
+                return cache_entry.body
+            response.raise_for_status()
+            if as_bytes:
+                return await response.read()
+            body = await response.text()
+            if use_cache:
+                self.http_cache.store(url, body, response.headers)
+            return body
+
+    @asynccontextmanager
+    async def _request(self, session: aiohttp.ClientSession, url: str, headers: dict | None, timeout: int):
+        """
+        기능: 호스트별 레이트 리미터의 허가와 동시 요청 상한을 거쳐 GET 요청을 보내고 응답을 연다.
+              429/503 응답은 리미터에 알려 감속/대기한 뒤 MAX_THROTTLE_RETRIES번까지 다시 시도하고, 마지막 응답은 상태와 관계없이 넘긴다.
+        input: aiohttp 클라이언트 세션(session), 요청 URL(url), 요청 헤더(headers), 타임아웃 초(timeout)
+        output: aiohttp.ClientResponse (async with 블록 안에서만 유효)
+        """
+        for attempt in range(MAX_THROTTLE_RETRIES + 1):
+            await self.rate_limiter.acquire(url)
+            async with get_in_flight_semaphore():
+                async with session.get(url, headers=headers, timeout=timeout) as response:
+                    self.rate_limiter.report(url, response.status, response.headers.get('Retry-After'))
+                    if response.status in THROTTLE_STATUSES and attempt < MAX_THROTTLE_RETRIES:
+                        continue
+                    yield response
+                    return
+
+    async def parse(self, parse_fn, *args):
+        """
+        기능: 사이트별 추출 함수를 파싱 프로세스 풀에서 실행한다. 이벤트 루프에서는 BeautifulSoup 파싱을 하지 않는다.
+        input: parse_fn (모듈 최상위 추출 함수), args (HTML bytes/str과 피클 가능한 인자)
+        output: parse_fn의 반환값 (dict, list 등)
+        """
+        return await run_parser(parse_fn, *args)
+
+    async def extract_links_with_spec(self, html_content: str, category_url: str) -> list[dict]:
+        """
+        기능: 수집기의 추출 스펙(links 규칙)으로 카테고리 페이지에서 기사 링크를 추출한다. 파싱 프로세스 풀에서 실행된다.
+        input: 카테고리 페이지 HTML(html_content), 카테고리 URL(category_url)
+        output: {'title': str, 'url': str} 딕셔너리의 리스트 (list[dict])
+        """
+        return await self.parse(extract_links, self.extraction_spec, html_content, category_url, self.base_url, self.html_parser)
+
+    async def extract_article_with_spec(self, html_content: str | bytes, article_url: str, original_title: str, category: str) -> dict | None:
+        """
+        기능: 수집기의 추출 스펙(article 규칙)으로 기사 페이지에서 제목, 대표 이미지, 본문을 추출한다. 파싱 프로세스 풀에서 실행된다.
+        input: 기사 페이지 HTML(html_content), 기사 URL(article_url), 원본 제목(original_title), 카테고리(category)
+        output: 기사 상세 정보 딕셔너리 또는 본문이 없으면 None (dict | None)
+        """
+        return await self.parse(extract_article, self.extraction_spec, html_content, article_url, original_title, category, self.site_name, self.html_parser, self.use_structured_data)
+
+    async def parse_article(self, parse_fn, html_content: str | bytes, article_url: str, original_title: str, category: str, *args, text_filter=None) -> dict | None:
+        """
+        기능: 사이트별 기사 추출 함수를 구조화 데이터 선추출 단계와 함께 파싱 프로세스 풀에서 실행한다.
+              ld+json/og: 메타로 제목, 본문, 대표 이미지를 모두 얻으면 parse_fn은 실행하지 않는다.
+        input: parse_fn (parse_fn(html_content, article_url, original_title, category, site_name, *args) 형태의 추출 함수),
+               기사 페이지 HTML(html_content), 기사 URL(article_url), 원본 제목(original_title), 카테고리(category), args (추출 함수의 나머지 인자),
+               text_filter (parse_fn이 본문 텍스트에 적용하는 사이트별 필터. 구조화 데이터 본문에도 적용된다. 프로세스 풀로 넘기므로 모듈 수준 함수)
+        output: 기사 상세 정보 딕셔너리 또는 None (dict | None)
+        """
+        if not self.use_structured_data:
+            return await self.parse(parse_fn, html_content, article_url, original_title, category, self.site_name, *args)
+        return await self.parse(parse_with_structured_data, parse_fn, text_filter, html_content, article_url, original_title, category, self.site_name, *args)
 
     @abstractmethod
     async def fetch_article_links(self, session: aiohttp.ClientSession, category_url: str) -> list[dict]:
@@ -31,36 +161,103 @@ class BaseCollector(ABC):
         """
         pass
 
-    async def collect_by_category(self, category_name: str, category_path_segment: str) -> list[dict]:
+    async def _stream_feed(self, session: aiohttp.ClientSession, feed_url: str, since: float | None) -> FeedParser:
+        async with self._request(session, feed_url, getattr(self, 'headers', None), self.timeout_seconds) as response:
+            response.raise_for_status()
+            # 응답 전체를 모으지 않고 받은 조각을 바로 파서에 넘긴다.
+            parser = FeedParser(since)
+            async for chunk in response.content.iter_chunked(FEED_CHUNK_SIZE):
+                parser.feed(chunk)
+            parser.close()
+            return parser
+
+    async def fetch_feed_links(self, session: aiohttp.ClientSession, feed_urls: list[str]) -> list[dict]:
         """
-        기능: 특정 카테고리의 모든 기사를 수집한다.
-        input: 카테고리 이름(category_name), 카테고리 경로 세그먼트(category_path_segment)
-        output: 수집된 기사 데이터 딕셔너리의 리스트 (list[dict])
+        기능: RSS/Atom 피드와 (뉴스) 사이트맵을 스트리밍으로 파싱해 지난 실행 이후 발행된 기사 링크만 모은다.
+              피드별 워터마크(지난 실행에서 본 최신 발행 시각)에서 FEED_OVERLAP_SECONDS를 뺀 시각 이전 항목은 버리고,
+              사이트맵 인덱스는 lastmod가 그 이후인 하위 사이트맵만 따라간다.
+              찾은 항목은 url_frontier에 기억해 두고, 워터마크는 수집이 끝난 뒤 commit_feed_watermarks가 저장된 기사까지만 올린다.
+        input: aiohttp 클라이언트 세션(session), 피드/사이트맵 URL 리스트(feed_urls)
+        output: {'title': str, 'url': str} 딕셔너리의 리스트 (list[dict]). 요청/XML 오류는 예외로 올린다.
+        """
+        article_infos = {}
+        for feed_url in feed_urls:
+            watermark = self.url_frontier.get_feed_watermark(feed_url)
+            since = watermark - FEED_OVERLAP_SECONDS if watermark is not None else None
+            skipped_old = 0
+            pending = [(feed_url, 1)]
+            while pending:
+                url, depth = pending.pop(0)
+                parser = await self._stream_feed(session, url, since)
+                skipped_old += parser.skipped_old
+                for entry in parser.entries:
+                    article_infos.setdefault(entry['url'], {'title': entry['title'] or slug_title(entry['url']), 'url': entry['url']})
+                self.url_frontier.record_feed_entries(feed_url, parser.entries)
+                if depth < MAX_SITEMAP_DEPTH:
+                    pending.extend((sitemap['url'], depth + 1) for sitemap in parser.sitemaps)
+            print(f"[{self.site_name}] 피드 {feed_url}: 지난 실행 이전 항목 {skipped_old}개 건너뜀")
+        return list(article_infos.values())
+
+    async def discover_new_links(self, session: aiohttp.ClientSession, category_name: str, category_path_segment: str, feed_urls: list[str] | None = None) -> list[dict]:
+        """
+        기능: 카테고리의 기사 링크를 찾고, 이전 실행에서 이미 수집한 기사는 제외한다.
+              feed_urls가 있으면(COLLECTION_DISCOVERY=html이 아닐 때) 목록 페이지 대신 피드/사이트맵에서 찾고,
+              피드 요청이나 XML 파싱에 실패하면 목록 페이지로 대체한다.
+        input: aiohttp 클라이언트 세션(session), 카테고리 이름(category_name), 카테고리 경로 세그먼트(category_path_segment),
+               피드/사이트맵 URL 리스트(feed_urls)
+        output: 새 기사의 {'title': str, 'url': str} 딕셔너리 리스트 (list[dict])
         """
         category_url = f"{self.base_url}/{category_path_segment}"
-        collected_articles = []
-        async with aiohttp.ClientSession() as session:
+        if feed_urls and DISCOVERY_MODE != 'html':
+            print(f"[{self.site_name.upper()}/{category_name.upper()}] 피드에서 기사 링크 수집 중... ({len(feed_urls)}개 피드)")
+            try:
+                article_infos = await self.fetch_feed_links(session, feed_urls)
+            except (aiohttp.ClientError, asyncio.TimeoutError, ParseError) as e:
+                print(f"[{self.site_name.upper()}/{category_name.upper()}] 피드 수집 실패, 목록 페이지로 대체합니다: {e}")
+                article_infos = await self.fetch_article_links(session, category_url)
+        else:
             print(f"[{self.site_name.upper()}/{category_name.upper()}] 기사 링크 수집 중... ({category_url})")
             article_infos = await self.fetch_article_links(session, category_url)
 
-            if not article_infos:
-                print(f"[{self.site_name.upper()}/{category_name.upper()}] 수집할 기사를 찾지 못했습니다.")
-                return []
+        if not article_infos:
+            print(f"[{self.site_name.upper()}/{category_name.upper()}] 수집할 기사를 찾지 못했습니다.")
+            return []
+
+        # 이전 실행에서 이미 수집한 기사는 본문을 다시 가져오지 않는다.
+        new_article_infos = self.url_frontier.filter_new(article_infos)
+        skipped = len(article_infos) - len(new_article_infos)
+        if not new_article_infos:
+            print(f"[{self.site_name.upper()}/{category_name.upper()}] 새 기사가 없습니다. (이미 수집한 기사 {skipped}개)")
+            return []
 
-            print(f"[{self.site_name.upper()}/{category_name.upper()}] 총 {len(article_infos)}개의 기사 링크를 찾았습니다. 내용 수집 시작...")
+        print(f"[{self.site_name.upper()}/{category_name.upper()}] 총 {len(new_article_infos)}개의 새 기사 링크를 찾았습니다. (이미 수집한 기사 {skipped}개 제외)")
+        return new_article_infos
 
-            tasks = []
-            for info in article_infos:
-                # fetch_article_content는 이제 original_title과 category를 인자로 받음
-                tasks.append(self.fetch_article_content(session, info['url'], info['title'], category_name))
+    async def collect_by_category(self, category_name: str, category_path_segment: str, session: aiohttp.ClientSession | None = None) -> list[dict]:
+        """
+        기능: 특정 카테고리의 모든 기사를 수집한다.
+        input: 카테고리 이름(category_name), 카테고리 경로 세그먼트(category_path_segment),
+               aiohttp 클라이언트 세션(session, 생략 시 프로세스 공유 세션 사용)
+        output: 수집된 기사 데이터 딕셔너리의 리스트 (list[dict])
+        """
+        collected_articles = []
+        session = session or get_session()
+        article_infos = await self.discover_new_links(session, category_name, category_path_segment)
+        if not article_infos:
+            return []
 
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+        # 링크마다 코루틴을 띄우지 않고, 고정된 수의 워커가 큐에서 링크를 꺼내 본문을 수집한다.
+        results = await run_worker_pool(
+            article_infos,
+            lambda info: self.fetch_article_content(session, info['url'], info['title'], category_name),
+            ARTICLE_WORKERS
+        )
 
-            for result in results:
-                if isinstance(result, Exception):
-                    print(f"[{self.site_name.upper()}/{category_name.upper()}] 기사 수집 중 오류: {result}")
-                elif result:
-                    collected_articles.append(result)
-            
-            print(f"[{self.site_name.upper()}/{category_name.upper()}] 총 {len(collected_articles)}개의 기사 내용 수집 완료.")
+        for result in results:
+            if isinstance(result, Exception):
+                print(f"[{self.site_name.upper()}/{category_name.upper()}] 기사 수집 중 오류: {result}")
+            elif result:
+                collected_articles.append(result)
+        
+        print(f"[{self.site_name.upper()}/{category_name.upper()}] 총 {len(collected_articles)}개의 기사 내용 수집 완료.")
         return collected_articles
@@ -1,22 +1,27 @@
 from typing import List, Dict, Any, Optional
 import asyncio
 import aiohttp
-from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 import re
-import random
 from datetime import datetime
 from slugify import slugify
 
 from .base_collector import BaseCollector
+from .html_parser import make_soup, DEFAULT_PARSER
 from ..utils.browser_manager import get_browser
 
+# 추출 함수가 페이지마다 쓰는 정규식은 모듈 로드 시 한 번만 컴파일한다.
+_CNN_IMAGE_URL_RE = re.compile(r"https?://media\.cnn\.com/api/v1/images/stellar/prod/")
+_PARAGRAPH_CLASS_RE = re.compile(r"paragraph")
+_AD_CLASS_RE = re.compile(r"ad-slot|qtm-element|ad")
+
+
 # extract_article_details_cnn 함수는 여기에 유지
-def extract_article_details_cnn(html_content, title_from_link):
+def extract_article_details_cnn(html_content, title_from_link, parser: str = DEFAULT_PARSER):
     """
     CNN 기사의 HTML 콘텐츠에서 제목, 메인 이미지 URL, 본문을 추출합니다.
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = make_soup(html_content, parser)
     
     article_title = None
     h1_tag = soup.find('h1', class_='headline__text')
@@ -30,24 +35,24 @@ def extract_article_details_cnn(html_content, title_from_link):
     main_image_url = None
     lede_container_div = soup.find('div', class_='image__lede article__lede-wrapper')
     if lede_container_div:
-        dam_img_tag = lede_container_div.find('img', class_='image__dam-img', src=re.compile(r"https?://media\.cnn\.com/api/v1/images/stellar/prod/"))
+        dam_img_tag = lede_container_div.find('img', class_='image__dam-img', src=_CNN_IMAGE_URL_RE)
         if dam_img_tag and dam_img_tag.get('src'):
             main_image_url = dam_img_tag['src']
         if not main_image_url:
-            img_tag = lede_container_div.find('img', src=re.compile(r"https?://media\.cnn\.com/api/v1/images/stellar/prod/"))
+            img_tag = lede_container_div.find('img', src=_CNN_IMAGE_URL_RE)
             if img_tag and img_tag.get('src'):
                 main_image_url = img_tag['src']
         if not main_image_url:
             picture_tag = lede_container_div.find('picture')
             if picture_tag:
-                source_tag = picture_tag.find('source', srcset=re.compile(r"https?://media\.cnn\.com/api/v1/images/stellar/prod/"))
+                source_tag = picture_tag.find('source', srcset=_CNN_IMAGE_URL_RE)
                 if source_tag and source_tag.get('srcset'):
                     main_image_url = source_tag.get('srcset').split(',')[0].split(' ')[0]
     
     article_text_parts = []
     article_content_div = soup.find('div', class_='article__content')
     if article_content_div:
-        for p_tag in article_content_div.find_all('p', class_=re.compile(r"paragraph")):
+        for p_tag in article_content_div.find_all('p', class_=_PARAGRAPH_CLASS_RE):
             article_text_parts.append(p_tag.get_text(separator=' ', strip=True))
         
         for figure_or_img_div in article_content_div.find_all('div', class_='image'):
@@ -58,7 +63,7 @@ def extract_article_details_cnn(html_content, title_from_link):
             if credit_figcap:
                 article_text_parts.append(f"[Image Credit: {credit_figcap.get_text(strip=True)}]")
 
-        for ad_div in article_content_div.find_all('div', class_=re.compile(r"ad-slot|qtm-element|ad")):
+        for ad_div in article_content_div.find_all('div', class_=_AD_CLASS_RE):
             ad_div.decompose()
     else:
         print(f"경고 (CNN): <div class='article__content'>를 찾지 못했습니다. ({title_from_link})")
@@ -75,6 +80,46 @@ def extract_article_details_cnn(html_content, title_from_link):
     return article_title, main_image_url, body_content
 
 
+def parse_cnn_article(html_content: bytes, article_url: str, original_title: str, category: str, site_name: str, parser: str = DEFAULT_PARSER) -> dict | None:
+    """
+    CNN 기사 HTML에서 기사 상세 정보 딕셔너리를 만듭니다. 본문이 없으면 None을 반환합니다. 파싱 프로세스 풀에서 실행됩니다.
+    """
+    extracted_title, image_url, article_text = extract_article_details_cnn(html_content, original_title, parser)
+    if not article_text: # 본문 내용이 없으면 유효하지 않은 기사로 판단
+        print(f"[{site_name.upper()}/{category.upper()}] 기사 본문 내용을 추출하지 못했습니다: {article_url}")
+        return None
+
+    return {
+        "url": article_url,
+        "title": extracted_title,
+        "main_image_url": image_url,
+        "article_text": article_text,
+        "source": site_name,
+        "category": category
+    }
+
+
+def parse_cnn_article_links(html_content: str, base_url: str, parser: str = DEFAULT_PARSER) -> list[dict]:
+    """
+    CNN 카테고리 페이지 HTML에서 기사 제목과 URL을 추출합니다. 파싱 프로세스 풀에서 실행됩니다.
+    """
+    soup = make_soup(html_content, parser)
+    articles = []
+    # CNN 월드 페이지의 링크 선택자 (이전 코드 기반)
+    for link_tag in soup.select('a.container__link.container__link--type-article'):
+        href = link_tag.get('href')
+        if href:
+            article_url = urljoin(base_url, href) # urljoin 사용으로 상대/절대 경로 모두 처리
+
+            headline_span = link_tag.find('span', class_='container__headline-text')
+            title = headline_span.text.strip() if headline_span else "제목 없음"
+
+            # 중복 URL 체크
+            if not any(existing_article['url'] == article_url for existing_article in articles):
+                articles.append({'title': title, 'url': article_url})
+    return articles
+
+
 class CnnCollector(BaseCollector):
     def __init__(self):
         super().__init__(site_name="cnn", base_url="https://edition.cnn.com")
@@ -85,11 +130,7 @@ class CnnCollector(BaseCollector):
     async def fetch_article_links(self, session: aiohttp.ClientSession, category_url: str) -> list[dict]:
         print(f"[{self.site_name.upper()}] {category_url} 에서 기사 목록을 가져오는 중...")
         try:
-            async with session.get(category_url, headers=self.headers, timeout=30) as response:
-                if response.status != 200:
-                    print(f"[{self.site_name.upper()}] 메인 페이지 로딩 오류: {response.status}, URL: {category_url}")
-                    return []
-                html_content = await response.text()
+            html_content = await self.fetch_text(session, category_url, timeout=30, use_cache=True)
         except asyncio.TimeoutError:
             print(f"[{self.site_name.upper()}] 메인 페이지 로딩 시간 초과: {category_url}")
             return []
@@ -97,33 +138,15 @@ class CnnCollector(BaseCollector):
             print(f"[{self.site_name.upper()}] 메인 페이지 로딩 중 ClientError 발생: {e}, URL: {category_url}")
             return []
 
-        soup = BeautifulSoup(html_content, 'html.parser')
-        articles = []
-        # CNN 월드 페이지의 링크 선택자 (이전 코드 기반)
-        for link_tag in soup.select('a.container__link.container__link--type-article'):
-            href = link_tag.get('href')
-            if href:
-                article_url = urljoin(self.base_url, href) # urljoin 사용으로 상대/절대 경로 모두 처리
-
-                headline_span = link_tag.find('span', class_='container__headline-text')
-                title = headline_span.text.strip() if headline_span else "제목 없음"
-                
-                # 중복 URL 체크
-                if not any(existing_article['url'] == article_url for existing_article in articles):
-                    articles.append({'title': title, 'url': article_url})
+        articles = await self.parse(parse_cnn_article_links, html_content, self.base_url, self.html_parser)
         
         print(f"[{self.site_name.upper()}] 총 {len(articles)}개의 고유한 기사 링크를 찾았습니다 ({category_url}).")
         return articles
 
     async def fetch_article_content(self, session: aiohttp.ClientSession, article_url: str, original_title: str, category: str) -> dict | None:
-        await asyncio.sleep(random.uniform(1, 3))
         print(f"[{self.site_name.upper()}/{category.upper()}] 기사 내용 가져오기 시작: {original_title} ({article_url})")
         try:
-            async with session.get(article_url, headers=self.headers, timeout=self.timeout_seconds) as response:
-                if response.status != 200:
-                    print(f"[{self.site_name.upper()}/{category.upper()}] 기사 페이지 로딩 오류: {response.status}, URL: {article_url}")
-                    return None
-                html_content = await response.text()
+            html_content = await self.fetch_bytes(session, article_url)
         except asyncio.TimeoutError:
             print(f"[{self.site_name.upper()}/{category.upper()}] 기사 페이지 로딩 시간 초과: {article_url}")
             return None
@@ -135,25 +158,12 @@ class CnnCollector(BaseCollector):
             return None
 
         try:
-            # CNN용 상세 추출 함수 사용
-            extracted_title, image_url, article_text = extract_article_details_cnn(html_content, original_title)
+            # 구조화 데이터 선추출 후 필요할 때만 CNN용 상세 추출 함수를 파싱 프로세스 풀에서 실행
+            return await self.parse_article(parse_cnn_article, html_content, article_url, original_title, category, self.html_parser)
         except Exception as e:
             print(f"[{self.site_name.upper()}/{category.upper()}] HTML 파싱 또는 내용 추출 중 오류 ({article_url}): {e}")
             return None
 
-        if not article_text: # 본문 내용이 없으면 유효하지 않은 기사로 판단
-            print(f"[{self.site_name.upper()}/{category.upper()}] 기사 본문 내용을 추출하지 못했습니다: {article_url}")
-            return None
-
-        return {
-            "url": article_url,
-            "title": extracted_title,
-            "main_image_url": image_url,
-            "article_text": article_text,
-            "source": self.site_name,
-            "category": category
-        }
-
     def get_file_name(self, article_title: str) -> str:
         if article_title:
             # 파일명으로 사용하기 위해 제목을 slugify 처리
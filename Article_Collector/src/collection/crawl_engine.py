@@ -0,0 +1,62 @@
+import os
+import asyncio
+from typing import Any, Awaitable, Callable, Iterable
+
+# 카테고리 하나에서 기사 본문을 동시에 가져오는 워커 수
+ARTICLE_WORKERS = int(os.getenv("CRAWL_ARTICLE_WORKERS", 4))
+# 사이트 하나에서 동시에 수집하는 카테고리 수
+CATEGORY_WORKERS = int(os.getenv("CRAWL_CATEGORY_WORKERS", 2))
+# 동시에 수집하는 사이트 수
+SITE_WORKERS = int(os.getenv("CRAWL_SITE_WORKERS", 4))
+# 프로세스 전체에서 동시에 진행 중인 HTTP/브라우저 요청 수 상한
+MAX_IN_FLIGHT_REQUESTS = int(os.getenv("CRAWL_MAX_IN_FLIGHT", 16))
+
+# 세마포어는 생성된 이벤트 루프에서만 쓸 수 있으므로 루프별로 보관한다.
+_in_flight: dict[int, tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = {}
+
+
+def get_in_flight_semaphore() -> asyncio.Semaphore:
+    """
+    기능: 현재 이벤트 루프에서 공유하는 전역 동시 요청 세마포어를 반환한다.
+          사이트/카테고리가 늘어나도 동시에 열린 요청 수는 MAX_IN_FLIGHT_REQUESTS를 넘지 않는다.
+    input: 없음
+    output: asyncio.Semaphore
+    """
+    loop = asyncio.get_running_loop()
+    entry = _in_flight.get(id(loop))
+    if entry is None or entry[0] is not loop:
+        entry = (loop, asyncio.Semaphore(MAX_IN_FLIGHT_REQUESTS))
+        _in_flight[id(loop)] = entry
+    return entry[1]
+
+
+async def run_worker_pool(items: Iterable[Any], handler: Callable[[Any], Awaitable[Any]], num_workers: int) -> list[Any]:
+    """
+    기능: 고정된 수의 워커가 크기 제한 큐에서 항목을 꺼내 handler를 실행한다.
+          asyncio.gather로 모든 코루틴을 한 번에 띄우는 대신, 동시에 처리 중인 항목 수를 num_workers로 묶는다.
+    input: items (처리할 항목), handler (항목 하나를 처리하는 코루틴 함수), num_workers (워커 수)
+    output: 입력 순서와 같은 결과 리스트. 실패한 항목은 예외 객체가 들어간다. (gather(return_exceptions=True)와 동일)
+    """
+    num_workers = max(1, num_workers)
+    queue: asyncio.Queue = asyncio.Queue(maxsize=num_workers * 2)
+    results: dict[int, Any] = {}
+
+    async def producer():
+        for index, item in enumerate(items):
+            await queue.put((index, item))
+        for _ in range(num_workers):
+            await queue.put(None)
+
+    async def worker():
+        while True:
+            job = await queue.get()
+            if job is None:
+                return
+            index, item = job
+            try:
+                results[index] = await handler(item)
+            except Exception as e:
+                results[index] = e
+
+    await asyncio.gather(producer(), *[worker() for _ in range(num_workers)])
+    return [results[index] for index in sorted(results)]
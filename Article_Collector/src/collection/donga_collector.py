@@ -1,15 +1,136 @@
 from .base_collector import BaseCollector
+from .html_parser import make_soup, DEFAULT_PARSER
 import aiohttp
 from bs4 import BeautifulSoup
 import yaml
 import os
 import asyncio
 import re
-import random
+from src.utils.http_session import get_session
 
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 DEFAULT_CONFIG_PATH = os.path.join(PROJECT_ROOT, 'configs', 'news_sites.yaml')
 
+def parse_donga_article_links(html_content: str, category_url: str, base_url: str, site_name: str, parser: str = DEFAULT_PARSER) -> list[dict]:
+    """
+    기능: 동아일보 카테고리 페이지 HTML에서 기사 제목과 URL을 추출한다. 파싱 프로세스 풀에서 실행된다.
+    input: 카테고리 페이지 HTML(html_content), 카테고리 URL(category_url), 사이트 기본 URL(base_url), 사이트 이름(site_name), 파서 백엔드(parser)
+    output: {'title': str, 'url': str} 딕셔너리의 리스트 (list[dict])
+    """
+    article_infos = []
+    soup = make_soup(html_content, parser)
+
+    # 동아일보 카테고리 페이지 구조에 맞는 선택자로 수정
+    # 기사 카드는 article.news_card 이고, 제목과 링크는 div.news_body hX.tit a 에 있음
+    link_tags = soup.select('article.news_card div.news_body h2.tit a, article.news_card div.news_body h3.tit a, article.news_card div.news_body h4.tit a')
+
+    for link_tag in link_tags:
+        href = link_tag.get('href')
+        title = link_tag.get_text(strip=True)
+
+        if href and title and href.startswith(base_url):
+            # 상대 경로인 경우 절대 경로로 변환 (이미 절대 경로이지만, 만약을 위해)
+            if href.startswith('/'):
+                href = base_url + href
+            article_infos.append({'title': title, 'url': href})
+
+    unique_articles = {info['url']: info for info in article_infos}.values()
+    return list(unique_articles)
+
+
+# get_text(separator='\\n')로 만든 본문은 문자 그대로의 '\\n'으로, 구조화 데이터 본문은 실제 줄바꿈으로 줄이 나뉜다.
+_LINE_SEPARATOR_RE = re.compile(r'\n|\\n')
+
+
+def filter_donga_text(article_text: str, log_tag: str = "DONGA") -> str:
+    """
+    기능: 동아일보 본문 텍스트에서 빈 줄, 기자 정보(@donga.com, 짧은 '기자' 줄), 채널 추가/저작권(▶, ⓒ) 줄을 걸러낸다.
+          DOM 본문과 구조화 데이터(ld+json) 본문에 모두 적용된다.
+    input: article_text (본문 텍스트), log_tag (걸러낸 줄을 출력할 때 붙이는 태그)
+    output: 걸러낸 줄을 줄바꿈으로 이은 본문 (str)
+    """
+    filtered_lines = []
+    for line in _LINE_SEPARATOR_RE.split(article_text):
+        line_stripped = line.strip()
+        if not line_stripped: # 빈 줄 제거
+            continue
+        # 흔히 발견되는 기자 정보 패턴 (더 정교하게 수정 가능)
+        if "@donga.com" in line_stripped or "기자" in line_stripped and len(line_stripped) < 30: # 짧은 줄의 기자 언급
+            # 좀 더 정교한 필터링 로직 (예: 문장 시작이 아니거나 특정 단어와 함께 나올 때)
+            if not (line_stripped.startswith("동아닷컴") or line_stripped.startswith("입력 ") or line_stripped.startswith("수정 ")):
+                 # 기사 내용일 가능성이 있는 '기자' 언급은 유지 (예: "기자회견")
+                if not any(keyword in line_stripped for keyword in ["기자회견", "기자간담회"]):
+                    print(f"[{log_tag}] 필터링된 라인: {line_stripped}")
+                    continue
+        if "▶" in line_stripped or "ⓒ" in line_stripped: # 채널 추가, 저작권 등
+             print(f"[{log_tag}] 필터링된 라인 (특수문자): {line_stripped}")
+             continue
+        filtered_lines.append(line_stripped)
+    return "\n".join(filtered_lines)
+
+
+def parse_donga_article(html_content: bytes, article_url: str, original_title: str, category: str, site_name: str, base_url: str, parser: str = DEFAULT_PARSER) -> dict | None:
+    """
+    기능: 동아일보 기사 페이지 HTML에서 제목, 대표 이미지, 본문을 추출한다. 파싱 프로세스 풀에서 실행된다.
+    input: 기사 페이지 HTML(html_content), 기사 URL(article_url), 원본 제목(original_title), 카테고리(category),
+           사이트 이름(site_name), 사이트 기본 URL(base_url), 파서 백엔드(parser)
+    output: 기사 상세 정보 딕셔너리 또는 본문이 없으면 None (dict | None)
+    """
+    soup = make_soup(html_content, parser)
+
+    title_tag = soup.select_one('h1.title, div.article_title h1, header.view_head h1, header.article_header h1')
+    article_title = title_tag.get_text(strip=True) if title_tag else original_title
+
+    # 기사 본문 영역 선택자 변경
+    article_body_tag = soup.select_one('section.news_view')
+
+    article_text = ""
+    if article_body_tag:
+        # 광고, 이미지 캡션, 관련기사 등 불필요한 부분 제거
+        elements_to_remove = []
+        # 클래스에 'ad', '광고', 'AD' (대소문자 구분 없이) 포함하는 div 제거
+        elements_to_remove.extend(article_body_tag.find_all('div', class_=lambda x: x and any(s.lower() in x.lower() for s in ['ad', '광고', 'AD'])))
+        # figure 태그 (이미지 및 캡션 포함 가능성) 제거
+        elements_to_remove.extend(article_body_tag.find_all('figure'))
+        # script, style 태그 제거
+        elements_to_remove.extend(article_body_tag.find_all(['script', 'style']))
+        # 기자 정보, 댓글, 공유 버튼 등 영역 제거 (더 구체적인 선택자 필요시 추가)
+        elements_to_remove.extend(article_body_tag.select('div.reporter_info, div.arcticle_relation, section.reporter_sec, div.view_head_setting, div.article_dk_view, div.article_issue'))
+        # 추가적으로 제거할 영역 (제공된 HTML 기반)
+        elements_to_remove.extend(article_body_tag.select('div.view_m_adK, div.view_ad06, div.view_m_adA, div.article_end, section#poll_content, div.subscribe_wrap, div#is_relation_m, div.view_m_adI, div#is_trend_m, div.view_ad07, div.view_m_adD, div#is_relation_tablet, div#is_trend_tablet'))
+
+        for element in elements_to_remove:
+            element.decompose()
+
+        # 텍스트 추출 (줄바꿈 유지, 앞뒤 공백 제거)
+        article_text = article_body_tag.get_text(separator='\\n', strip=True)
+
+        # 특정 패턴 필터링 (기자 정보 등) - 필요시 정규식 사용
+        article_text = filter_donga_text(article_text, f"{site_name.upper()}/{category.upper()}")
+
+    if not article_text.strip():
+         print(f"[{site_name.upper()}/{category.upper()}] 기사 본문 내용을 찾지 못했습니다. URL: {article_url}")
+
+    main_image_url = None
+    og_image_tag = soup.find('meta', property='og:image')
+    if og_image_tag and og_image_tag.get('content'):
+        main_image_url = og_image_tag['content']
+    # TODO: og:image 없을 경우 대체 로직
+
+    if not article_text.strip():
+        print(f"[{site_name.upper()}/{category.upper()}] 기사 본문 내용을 추출하지 못했습니다: {article_url}")
+        return None
+
+    return {
+        "url": article_url,
+        "title": article_title,
+        "main_image_url": main_image_url,
+        "article_text": article_text.strip(),
+        "source": site_name,
+        "category": category
+    }
+
+
 class DongaCollector(BaseCollector):
     def __init__(self, config_path=DEFAULT_CONFIG_PATH):
         try:
@@ -29,110 +150,19 @@ class DongaCollector(BaseCollector):
         article_infos = []
         print(f"[{self.site_name}] Fetching links from {category_url}")
         try:
-            async with session.get(category_url, headers=self.headers, timeout=30) as response:
-                response.raise_for_status()
-                html_content = await response.text()
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # 동아일보 카테고리 페이지 구조에 맞는 선택자로 수정
-            # 기사 카드는 article.news_card 이고, 제목과 링크는 div.news_body hX.tit a 에 있음
-            link_tags = soup.select('article.news_card div.news_body h2.tit a, article.news_card div.news_body h3.tit a, article.news_card div.news_body h4.tit a')
-            
-            for link_tag in link_tags:
-                href = link_tag.get('href')
-                title = link_tag.get_text(strip=True)
-
-                if href and title and href.startswith(self.base_url):
-                    # 상대 경로인 경우 절대 경로로 변환 (이미 절대 경로이지만, 만약을 위해)
-                    if href.startswith('/'):
-                        href = self.base_url + href
-                    article_infos.append({'title': title, 'url': href})
-            
-            unique_articles = {info['url']: info for info in article_infos}.values()
-            article_infos = list(unique_articles)
+            html_content = await self.fetch_text(session, category_url, timeout=30, use_cache=True)
+            article_infos = await self.parse(parse_donga_article_links, html_content, category_url, self.base_url, self.site_name, self.html_parser)
             print(f"[{self.site_name}] Found {len(article_infos)} news links from {category_url}")
         except Exception as e:
             print(f"[{self.site_name}] Error fetching or parsing links from {category_url}: {e}")
         return article_infos
 
     async def fetch_article_content(self, session: aiohttp.ClientSession, article_url: str, original_title: str, category: str) -> dict | None:
-        await asyncio.sleep(random.uniform(1, 3)) # 1~3초 랜덤 지연
         print(f"[{self.site_name.upper()}/{category.upper()}] 기사 내용 가져오기 시작: {original_title} ({article_url})")
         try:
-            async with session.get(article_url, headers=self.headers, timeout=self.timeout_seconds) as response:
-                response.raise_for_status()
-                html_content = await response.text()
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            title_tag = soup.select_one('h1.title, div.article_title h1, header.view_head h1, header.article_header h1')
-            article_title = title_tag.get_text(strip=True) if title_tag else original_title
-            
-            # 기사 본문 영역 선택자 변경
-            article_body_tag = soup.select_one('section.news_view')
-            
-            article_text = ""
-            if article_body_tag:
-                # 광고, 이미지 캡션, 관련기사 등 불필요한 부분 제거
-                elements_to_remove = []
-                # 클래스에 'ad', '광고', 'AD' (대소문자 구분 없이) 포함하는 div 제거
-                elements_to_remove.extend(article_body_tag.find_all('div', class_=lambda x: x and any(s.lower() in x.lower() for s in ['ad', '광고', 'AD'])))
-                # figure 태그 (이미지 및 캡션 포함 가능성) 제거
-                elements_to_remove.extend(article_body_tag.find_all('figure'))
-                # script, style 태그 제거
-                elements_to_remove.extend(article_body_tag.find_all(['script', 'style']))
-                # 기자 정보, 댓글, 공유 버튼 등 영역 제거 (더 구체적인 선택자 필요시 추가)
-                elements_to_remove.extend(article_body_tag.select('div.reporter_info, div.arcticle_relation, section.reporter_sec, div.view_head_setting, div.article_dk_view, div.article_issue'))
-                # 추가적으로 제거할 영역 (제공된 HTML 기반)
-                elements_to_remove.extend(article_body_tag.select('div.view_m_adK, div.view_ad06, div.view_m_adA, div.article_end, section#poll_content, div.subscribe_wrap, div#is_relation_m, div.view_m_adI, div#is_trend_m, div.view_ad07, div.view_m_adD, div#is_relation_tablet, div#is_trend_tablet'))
-
-                for element in elements_to_remove:
-                    element.decompose()
-                
-                # 텍스트 추출 (줄바꿈 유지, 앞뒤 공백 제거)
-                article_text = article_body_tag.get_text(separator='\\n', strip=True)
-
-                # 특정 패턴 필터링 (기자 정보 등) - 필요시 정규식 사용
-                lines = article_text.split('\\n')
-                filtered_lines = []
-                for line in lines:
-                    line_stripped = line.strip()
-                    if not line_stripped: # 빈 줄 제거
-                        continue
-                    # 흔히 발견되는 기자 정보 패턴 (더 정교하게 수정 가능)
-                    if "@donga.com" in line_stripped or "기자" in line_stripped and len(line_stripped) < 30: # 짧은 줄의 기자 언급
-                        # 좀 더 정교한 필터링 로직 (예: 문장 시작이 아니거나 특정 단어와 함께 나올 때)
-                        if not (line_stripped.startswith("동아닷컴") or line_stripped.startswith("입력 ") or line_stripped.startswith("수정 ")):
-                             # 기사 내용일 가능성이 있는 '기자' 언급은 유지 (예: "기자회견")
-                            if not any(keyword in line_stripped for keyword in ["기자회견", "기자간담회"]):
-                                print(f"[{self.site_name.upper()}/{category.upper()}] 필터링된 라인: {line_stripped}")
-                                continue
-                    if "▶" in line_stripped or "ⓒ" in line_stripped: # 채널 추가, 저작권 등
-                         print(f"[{self.site_name.upper()}/{category.upper()}] 필터링된 라인 (특수문자): {line_stripped}")
-                         continue
-                    filtered_lines.append(line_stripped)
-                article_text = "\\n".join(filtered_lines)
-
-            if not article_text.strip():
-                 print(f"[{self.site_name.upper()}/{category.upper()}] 기사 본문 내용을 찾지 못했습니다. URL: {article_url}")
-
-            main_image_url = None
-            og_image_tag = soup.find('meta', property='og:image')
-            if og_image_tag and og_image_tag.get('content'):
-                main_image_url = og_image_tag['content']
-            # TODO: og:image 없을 경우 대체 로직
-
-            if not article_text.strip():
-                print(f"[{self.site_name.upper()}/{category.upper()}] 기사 본문 내용을 추출하지 못했습니다: {article_url}")
-                return None
-
-            return {
-                "url": article_url,
-                "title": article_title,
-                "main_image_url": main_image_url,
-                "article_text": article_text.strip(),
-                "source": self.site_name,
-                "category": category
-            }
+            html_content = await self.fetch_bytes(session, article_url)
+            return await self.parse_article(parse_donga_article, html_content, article_url, original_title, category, self.base_url, self.html_parser,
+                                            text_filter=filter_donga_text)
         except asyncio.TimeoutError:
             print(f"[{self.site_name.upper()}/{category.upper()}] 기사 페이지 로딩 시간 초과: {article_url}")
             return None
@@ -162,48 +192,46 @@ class DongaCollector(BaseCollector):
         print(f"[{self.name}] Extracting content from {news_url} (not implemented yet)")
         return None # 실제 구현 필요
 
-    async def search_by_keyword(self, keyword: str) -> list[dict]:
+    async def search_by_keyword(self, keyword: str, session: aiohttp.ClientSession | None = None) -> list[dict]:
         """
         키워드로 동아일보 기사를 검색합니다.
         """
         search_url = f"https://www.donga.com/news/search?query={keyword}"
         
-        async with aiohttp.ClientSession() as session:
-            try:
-                print(f"[{self.site_name}] 키워드 '{keyword}' 검색: {search_url}")
-                async with session.get(search_url, headers=self.headers, timeout=30) as response:
-                    response.raise_for_status()
-                    html_content = await response.text()
-                
-                soup = BeautifulSoup(html_content, 'html.parser')
-                articles = []
-                
-                # 동아일보 검색 결과에서 기사 링크 추출
-                search_results = soup.select('div.search_list_box article.news_card')
-                
-                for item in search_results[:10]:  # 최대 10개 기사만 수집
-                    try:
-                        link_tag = item.select_one('div.news_body h2.tit a, div.news_body h3.tit a')
-                        if link_tag:
-                            article_url = link_tag.get('href')
-                            title = link_tag.get_text(strip=True)
+        session = session or get_session()
+        try:
+            print(f"[{self.site_name}] 키워드 '{keyword}' 검색: {search_url}")
+            html_content = await self.fetch_text(session, search_url, timeout=30, use_cache=True)
+            
+            soup = BeautifulSoup(html_content, 'html.parser')
+            articles = []
+            
+            # 동아일보 검색 결과에서 기사 링크 추출
+            search_results = soup.select('div.search_list_box article.news_card')
+            
+            for item in search_results[:10]:  # 최대 10개 기사만 수집
+                try:
+                    link_tag = item.select_one('div.news_body h2.tit a, div.news_body h3.tit a')
+                    if link_tag:
+                        article_url = link_tag.get('href')
+                        title = link_tag.get_text(strip=True)
+                        
+                        if article_url and title:
+                            if not article_url.startswith('http'):
+                                article_url = f"https://www.donga.com{article_url}"
                             
-                            if article_url and title:
-                                if not article_url.startswith('http'):
-                                    article_url = f"https://www.donga.com{article_url}"
-                                
-                                # 개별 기사 내용 수집
-                                article_data = await self.fetch_article_content(session, article_url, title, 'search')
-                                if article_data:
-                                    articles.append(article_data)
-                                
-                    except Exception as e:
-                        print(f"[{self.site_name}] 검색 결과 처리 중 오류: {e}")
-                        continue
-                
-                print(f"[{self.site_name}] 키워드 '{keyword}'로 {len(articles)}개 기사 수집 완료")
-                return articles
-                
-            except Exception as e:
-                print(f"[{self.site_name}] 키워드 '{keyword}' 검색 중 오류: {e}")
-                return [] 
\ No newline at end of file
+                            # 개별 기사 내용 수집
+                            article_data = await self.fetch_article_content(session, article_url, title, 'search')
+                            if article_data:
+                                articles.append(article_data)
+                            
+                except Exception as e:
+                    print(f"[{self.site_name}] 검색 결과 처리 중 오류: {e}")
+                    continue
+            
+            print(f"[{self.site_name}] 키워드 '{keyword}'로 {len(articles)}개 기사 수집 완료")
+            return articles
+            
+        except Exception as e:
+            print(f"[{self.site_name}] 키워드 '{keyword}' 검색 중 오류: {e}")
+            return [] 
\ No newline at end of file
@@ -0,0 +1,298 @@
+import os
+import re
+from dataclasses import dataclass, field
+from urllib.parse import urljoin
+
+import yaml
+
+from src.collection.html_parser import CompiledSelector, make_soup, DEFAULT_PARSER
+from src.collection.structured_data import STRUCTURED_FIELDS, scan_structured_data, merge_structured_data
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_SPEC_PATH = os.path.join(PROJECT_ROOT, 'configs', 'extraction_specs.yaml')
+
+# 값 소스 중 선택자가 아닌 특수 소스
+_SOURCE_TEXT = ":text"   # 링크 자신의 텍스트
+_SOURCE_SLUG = ":slug"   # URL 마지막 경로 조각을 단어로 바꾼 것
+
+
+@dataclass
+class ValueSource:
+    """'선택자', '선택자@속성', '@속성', ':text', ':slug' 형태의 값 소스를 컴파일한 것."""
+    selector: CompiledSelector | None
+    attr: str | None = None
+    special: str | None = None
+
+
+@dataclass
+class LinkRules:
+    link: CompiledSelector
+    items: CompiledSelector | None = None
+    title: list[ValueSource] = field(default_factory=list)
+    same_site: bool = True
+    include: list[re.Pattern] = field(default_factory=list)
+    exclude: list[re.Pattern] = field(default_factory=list)
+
+
+@dataclass
+class ParagraphRule:
+    selector: CompiledSelector
+    direct: bool = False
+
+
+@dataclass
+class ArticleRules:
+    title: list[ValueSource] = field(default_factory=list)
+    body: list[CompiledSelector] = field(default_factory=list)
+    remove: CompiledSelector | None = None
+    paragraphs: list[ParagraphRule] = field(default_factory=list)
+    join: str = "\n"
+    body_text_fallback: bool = False
+    fallback_to_title: bool = False
+    image: list[ValueSource] = field(default_factory=list)
+    cut_from_last: list[str] = field(default_factory=list)
+    strip_through: list[tuple[str, str]] = field(default_factory=list)
+
+
+@dataclass
+class ExtractionSpec:
+    name: str
+    links: LinkRules | None = None
+    article: ArticleRules | None = None
+
+
+# 전역 추출 스펙 인스턴스 (프로세스마다 한 번 컴파일)
+_specs: dict[str, ExtractionSpec] | None = None
+
+
+def _compile_source(source: str) -> ValueSource:
+    if source in (_SOURCE_TEXT, _SOURCE_SLUG):
+        return ValueSource(selector=None, special=source)
+    selector, _, attr = source.partition('@')
+    return ValueSource(selector=CompiledSelector(selector) if selector else None, attr=attr or None)
+
+
+def _compile_link_rules(raw: dict) -> LinkRules:
+    return LinkRules(
+        link=CompiledSelector(raw['link']),
+        items=CompiledSelector(raw['items']) if raw.get('items') else None,
+        title=[_compile_source(s) for s in raw.get('title', [_SOURCE_TEXT])],
+        same_site=raw.get('same_site', True),
+        include=[re.compile(p) for p in raw.get('include', [])],
+        exclude=[re.compile(p) for p in raw.get('exclude', [])],
+    )
+
+
+def _compile_article_rules(raw: dict) -> ArticleRules:
+    remove = raw.get('remove', [])
+    return ArticleRules(
+        title=[_compile_source(s) for s in raw.get('title', [])],
+        body=[CompiledSelector(s) for s in raw.get('body', [])],
+        remove=CompiledSelector(', '.join(remove)) if remove else None,
+        paragraphs=[
+            ParagraphRule(CompiledSelector(p['selector']), p.get('direct', False)) if isinstance(p, dict)
+            else ParagraphRule(CompiledSelector(p))
+            for p in raw.get('paragraphs', [])
+        ],
+        join=raw.get('join', "\n"),
+        body_text_fallback=raw.get('body_text_fallback', False),
+        fallback_to_title=raw.get('fallback_to_title', False),
+        image=[_compile_source(s) for s in raw.get('image', [])],
+        cut_from_last=list(raw.get('cut_from_last', [])),
+        strip_through=[(rule['anchor'], rule['marker']) for rule in raw.get('strip_through', [])],
+    )
+
+
+def load_extraction_specs(spec_path: str = DEFAULT_SPEC_PATH) -> dict[str, ExtractionSpec]:
+    """
+    기능: 사이트별 추출 스펙 YAML을 읽어 CSS 선택자와 정규식을 모두 미리 컴파일하고 전역 스펙으로 등록한다.
+          수집기 생성 시와 파싱 프로세스 풀 워커 시작 시 한 번 호출되며, 추출 경로에서는 다시 컴파일하지 않는다.
+    input: spec_path (추출 스펙 YAML 경로)
+    output: {스펙 이름: ExtractionSpec} 딕셔너리
+    """
+    global _specs
+    with open(spec_path, 'r', encoding='utf-8') as f:
+        raw_specs = yaml.safe_load(f) or {}
+
+    specs = {}
+    for name, raw in raw_specs.items():
+        try:
+            specs[name] = ExtractionSpec(
+                name=name,
+                links=_compile_link_rules(raw['links']) if raw.get('links') else None,
+                article=_compile_article_rules(raw['article']) if raw.get('article') else None,
+            )
+        except Exception as e:
+            raise ValueError(f"추출 스펙 '{name}' 컴파일 실패 ({spec_path}): {e}") from e
+    _specs = specs
+    return specs
+
+
+def get_extraction_spec(name: str) -> ExtractionSpec:
+    """
+    기능: 컴파일된 추출 스펙을 이름으로 찾는다. 아직 컴파일하지 않았으면 기본 스펙 파일을 읽는다.
+    input: name (스펙 이름, 수집기 site_name)
+    output: ExtractionSpec
+    """
+    if _specs is None:
+        load_extraction_specs()
+    spec = _specs.get(name)
+    if spec is None:
+        raise ValueError(f"추출 스펙이 없습니다: {name} ({DEFAULT_SPEC_PATH})")
+    return spec
+
+
+def _slug_title(url: str) -> str:
+    parts = [part for part in url.split('/') if part]
+    if not parts:
+        return ""
+    slug = parts[-1].split('?')[0].replace('-', ' ').replace('_', ' ')
+    return ' '.join(word.capitalize() for word in slug.split())
+
+
+def _read_value(source: ValueSource, node, url: str | None = None) -> str:
+    """node 기준으로 값 소스를 읽는다. 없거나 비어 있으면 빈 문자열."""
+    if source.special == _SOURCE_TEXT:
+        return node.get_text(strip=True)
+    if source.special == _SOURCE_SLUG:
+        return _slug_title(url or "")
+    target = source.selector.select_one(node) if source.selector else node
+    if not target:
+        return ""
+    if source.attr:
+        return (target.get(source.attr) or "").strip()
+    return target.get_text(strip=True)
+
+
+def _first_value(sources: list[ValueSource], node, url: str | None = None) -> str:
+    for source in sources:
+        value = _read_value(source, node, url)
+        if value:
+            return value
+    return ""
+
+
+def extract_links(spec_name: str, html_content: str, category_url: str, base_url: str, parser: str = DEFAULT_PARSER) -> list[dict]:
+    """
+    기능: 추출 스펙의 links 규칙으로 카테고리 페이지 HTML에서 기사 제목과 URL을 추출한다. 파싱 프로세스 풀에서 실행된다.
+    input: 스펙 이름(spec_name), 카테고리 페이지 HTML(html_content), 카테고리 URL(category_url), 사이트 기본 URL(base_url), 파서 백엔드(parser)
+    output: {'title': str, 'url': str} 딕셔너리의 리스트 (list[dict])
+    """
+    rules = get_extraction_spec(spec_name).links
+    soup = make_soup(html_content, parser)
+
+    if rules.items:
+        link_tags = [(item, rules.link.select_one(item)) for item in rules.items.select(soup)]
+    else:
+        link_tags = [(link_tag, link_tag) for link_tag in rules.link.select(soup)]
+    if not link_tags:
+        print(f"[{spec_name}] Warning: '{(rules.items or rules.link).selector}' 항목을 찾을 수 없습니다. {category_url}의 구조가 변경되었을 수 있습니다.")
+
+    article_infos = {}
+    for item, link_tag in link_tags:
+        if not link_tag:
+            continue
+        href = link_tag.get('href')
+        if not href:
+            continue
+        url = urljoin(base_url + '/', href.strip())
+        if rules.same_site and not url.startswith(base_url):
+            continue
+        if rules.include and not any(pattern.search(url) for pattern in rules.include):
+            continue
+        if any(pattern.search(url) for pattern in rules.exclude):
+            continue
+        # ':text'는 링크 자신, 나머지 선택자는 기사 카드(item) 기준으로 읽는다.
+        title = ""
+        for source in rules.title:
+            title = _read_value(source, link_tag if source.special == _SOURCE_TEXT else item, url)
+            if title:
+                break
+        if title:
+            article_infos[url] = {'title': title, 'url': url}
+    return list(article_infos.values())
+
+
+def _apply_text_filters(rules: ArticleRules, text: str) -> str:
+    for phrase in rules.cut_from_last:
+        index = text.rfind(phrase)
+        if index != -1:
+            text = text[:index]
+    for anchor, marker in rules.strip_through:
+        anchor_index = text.find(anchor)
+        if anchor_index != -1:
+            marker_index = text.find(marker, anchor_index)
+            if marker_index != -1:
+                text = text[marker_index + len(marker):].lstrip()
+    return text
+
+
+def extract_article(spec_name: str, html_content: str | bytes, article_url: str, original_title: str, category: str, site_name: str, parser: str = DEFAULT_PARSER, use_structured_data: bool = True) -> dict | None:
+    """
+    기능: 추출 스펙의 article 규칙으로 기사 페이지 HTML에서 제목, 대표 이미지, 본문을 추출한다. 파싱 프로세스 풀에서 실행된다.
+          use_structured_data이면 ld+json/og: 메타를 먼저 훑고(본문에도 스펙의 텍스트 규칙 적용), 빠진 필드가 있을 때만 DOM을 파싱한다.
+    input: 스펙 이름(spec_name), 기사 페이지 HTML(html_content), 기사 URL(article_url), 원본 제목(original_title), 카테고리(category),
+           사이트 이름(site_name), 파서 백엔드(parser), 구조화 데이터 선추출 여부(use_structured_data)
+    output: 기사 상세 정보 딕셔너리 또는 본문이 없으면 None (dict | None)
+    """
+    rules = get_extraction_spec(spec_name).article
+    if not use_structured_data:
+        return _extract_article_dom(rules, html_content, article_url, original_title, category, site_name, parser)
+
+    found = scan_structured_data(html_content)
+    if found.get("article_text"):
+        found["article_text"] = _apply_text_filters(rules, found["article_text"]).strip()
+    if all(found.get(field) for field in STRUCTURED_FIELDS):
+        return merge_structured_data(None, found, article_url, original_title, category, site_name)
+    article = _extract_article_dom(rules, html_content, article_url, original_title, category, site_name, parser)
+    return merge_structured_data(article, found, article_url, original_title, category, site_name)
+
+
+def _extract_article_dom(rules: ArticleRules, html_content: str | bytes, article_url: str, original_title: str, category: str, site_name: str, parser: str) -> dict | None:
+    soup = make_soup(html_content, parser)
+
+    article_title = _first_value(rules.title, soup) or original_title
+
+    article_body_tag = None
+    for selector in rules.body:
+        article_body_tag = selector.select_one(soup)
+        if article_body_tag:
+            break
+
+    article_text = ""
+    if article_body_tag:
+        if rules.remove:
+            for element in rules.remove.select(article_body_tag):
+                element.decompose()
+        for rule in rules.paragraphs:
+            paragraphs = rule.selector.select(article_body_tag)
+            if rule.direct:
+                paragraphs = [p for p in paragraphs if p.parent == article_body_tag]
+            texts = [text for text in (p.get_text(strip=True) for p in paragraphs) if text]
+            if texts:
+                article_text = rules.join.join(texts)
+                break
+        if not article_text and rules.body_text_fallback:
+            article_text = article_body_tag.get_text(separator="\n", strip=True)
+
+    article_text = _apply_text_filters(rules, article_text)
+    if not article_text.strip() and rules.fallback_to_title:
+        print(f"[{site_name.upper()}/{category.upper()}] 본문 내용 없음, 제목으로 대체: {article_url}")
+        article_text = original_title
+
+    if not article_text.strip():
+        print(f"[{site_name.upper()}/{category.upper()}] 기사 본문 내용을 추출하지 못했습니다: {article_url}")
+        return None
+
+    main_image_url = _first_value(rules.image, soup) or None
+    if main_image_url:
+        main_image_url = urljoin(article_url, main_image_url)
+
+    return {
+        "url": article_url,
+        "title": article_title.strip(),
+        "main_image_url": main_image_url,
+        "article_text": article_text.strip(),
+        "source": site_name,
+        "category": category
+    }
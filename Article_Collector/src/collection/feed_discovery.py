@@ -0,0 +1,147 @@
+import os
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from xml.etree.ElementTree import XMLPullParser
+
+# 링크 탐색 방식. auto: 피드가 설정된 카테고리는 피드(RSS/Atom/사이트맵), 나머지는 목록 페이지. html: 항상 목록 페이지.
+DISCOVERY_MODE = os.getenv("COLLECTION_DISCOVERY", "auto")
+# 지난 실행의 최신 기사 시각에서 이만큼(초) 앞선 항목부터 다시 본다. 본문 수집에 실패한 기사를 다음 실행에서 다시 잡기 위함이며,
+# 이미 수집한 URL은 URL 프런티어가 걸러낸다.
+FEED_OVERLAP_SECONDS = int(os.getenv("FEED_OVERLAP_SECONDS", 60 * 60))
+# 피드 응답을 파서에 넘기는 단위(bytes)
+FEED_CHUNK_SIZE = 64 * 1024
+# 사이트맵 인덱스를 따라 들어가는 최대 깊이
+MAX_SITEMAP_DEPTH = 2
+
+# 항목(기사) 하나를 나타내는 요소: RSS item, Atom entry, 사이트맵 url
+_ENTRY_TAGS = {"item", "entry", "url"}
+# 사이트맵 인덱스의 하위 사이트맵
+_SITEMAP_TAG = "sitemap"
+_DATE_TAGS = ("publication_date", "lastmod", "pubDate", "published", "updated", "date")
+_TITLE_TAGS = ("title",)
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit('}', 1)[-1] if '}' in tag else tag
+
+
+def parse_feed_date(text: str | None) -> float | None:
+    """
+    기능: 피드/사이트맵 날짜 문자열(ISO 8601 또는 RFC 822)을 UNIX 시각으로 바꾼다. 시간대가 없으면 UTC로 본다.
+    input: text (날짜 문자열)
+    output: UNIX 시각 (float) 또는 해석할 수 없으면 None
+    """
+    if not text:
+        return None
+    text = text.strip()
+    try:
+        parsed = datetime.fromisoformat(text.replace('Z', '+00:00'))
+    except ValueError:
+        try:
+            parsed = parsedate_to_datetime(text)
+        except (TypeError, ValueError):
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+class FeedParser:
+    """
+    RSS 2.0 / Atom / 사이트맵(Google News 사이트맵 포함) XML을 조각 단위로 받아 스트리밍으로 파싱한다.
+    항목 요소가 끝날 때마다 링크/제목/날짜를 꺼내고 요소를 비워, 큰 사이트맵도 문서 전체 트리를 메모리에 두지 않는다.
+    since보다 오래된 항목은 버린다.
+    """
+    def __init__(self, since: float | None = None):
+        self.since = since
+        self.entries: list[dict] = []
+        self.sitemaps: list[dict] = []
+        self.skipped_old = 0
+        self._parser = XMLPullParser(events=("start", "end"))
+        self._stack = []
+
+    def feed(self, chunk: bytes):
+        self._parser.feed(chunk)
+        self._drain()
+
+    def close(self) -> list[dict]:
+        """남은 데이터를 처리하고 since 이후의 {'title', 'url', 'published'} 항목 리스트를 반환한다."""
+        self._parser.close()
+        self._drain()
+        return self.entries
+
+    def _drain(self):
+        for event, elem in self._parser.read_events():
+            if event == "start":
+                self._stack.append(elem)
+                continue
+            self._stack.pop()
+            name = _local_name(elem.tag)
+            if name in _ENTRY_TAGS:
+                self._handle_entry(elem)
+            elif name == _SITEMAP_TAG:
+                self._handle_sitemap(elem)
+            else:
+                continue
+            # 처리한 항목은 부모에서 떼어내 메모리를 돌려준다.
+            if self._stack:
+                self._stack[-1].remove(elem)
+
+    def _children(self, elem) -> dict:
+        """항목의 하위 요소를 {로컬 이름: 요소}로 모은다. (news:news 같은 중첩 요소도 포함)"""
+        children = {}
+        for child in elem.iter():
+            if child is elem:
+                continue
+            children.setdefault(_local_name(child.tag), child)
+        return children
+
+    def _published(self, children: dict) -> float | None:
+        for tag in _DATE_TAGS:
+            if tag in children:
+                published = parse_feed_date(children[tag].text)
+                if published is not None:
+                    return published
+        return None
+
+    def _handle_entry(self, elem):
+        children = self._children(elem)
+        url = None
+        if "loc" in children:
+            url = children["loc"].text
+        elif "link" in children:
+            link = children["link"]
+            # Atom은 <link href="..."/>, RSS는 <link>...</link>
+            url = link.get("href") or link.text
+            if _local_name(elem.tag) == "entry":
+                for child in elem:
+                    if _local_name(child.tag) == "link" and child.get("rel", "alternate") == "alternate" and child.get("href"):
+                        url = child.get("href")
+                        break
+        if not url or not url.strip():
+            return
+
+        published = self._published(children)
+        if self.since is not None and published is not None and published < self.since:
+            self.skipped_old += 1
+            return
+        title = next((children[tag].text.strip() for tag in _TITLE_TAGS if tag in children and children[tag].text), "")
+        self.entries.append({'title': title, 'url': url.strip(), 'published': published})
+
+    def _handle_sitemap(self, elem):
+        children = self._children(elem)
+        loc = children.get("loc")
+        if loc is None or not loc.text:
+            return
+        lastmod = parse_feed_date(children["lastmod"].text) if "lastmod" in children else None
+        if self.since is not None and lastmod is not None and lastmod < self.since:
+            self.skipped_old += 1
+            return
+        self.sitemaps.append({'url': loc.text.strip(), 'lastmod': lastmod})
+
+
+def slug_title(url: str) -> str:
+    """제목이 없는 사이트맵 항목을 위해 URL 마지막 경로 조각으로 임시 제목을 만든다."""
+    parts = [part for part in url.split('?')[0].split('/') if part]
+    return parts[-1].replace('-', ' ').replace('_', ' ') if parts else url
+
@@ -5,12 +5,18 @@ import yaml
 import os
 import asyncio
 import re
-import random
+from src.utils.http_session import get_session
 
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 DEFAULT_CONFIG_PATH = os.path.join(PROJECT_ROOT, 'configs', 'news_sites.yaml')
 
 class HankyorehCollector(BaseCollector):
+    # 추출 함수가 CSS 선택자와 문자열 조건만 쓰므로 selectolax로 파싱한다.
+    html_parser = "selectolax"
+    selectolax_safe = True
+    # 목록/기사 추출 규칙은 configs/extraction_specs.yaml의 hankyoreh 스펙을 쓴다.
+    extraction_spec = "hankyoreh"
+
     def __init__(self, config_path=DEFAULT_CONFIG_PATH):
         try:
             with open(config_path, 'r', encoding='utf-8') as f:
@@ -29,83 +35,18 @@ class HankyorehCollector(BaseCollector):
         article_infos = []
         print(f"[{self.site_name}] Fetching links from {category_url}")
         try:
-            async with session.get(category_url, headers=self.headers, timeout=30) as response:
-                response.raise_for_status()
-                html_content = await response.text()
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            article_list_container = soup.select_one('div.section_left__5BOCT ul')
-            if not article_list_container:
-                print(f"[{self.site_name}] Could not find article list container on {category_url}")
-                return article_infos
-
-            articles = article_list_container.select('li.ArticleList_item___OGQO article')
-            
-            for article_tag in articles:
-                link_tag = article_tag.select_one('a.BaseArticleCard_link__Q3YFK')
-                title_tag = article_tag.select_one('div.BaseArticleCard_title__TVFqt')
-
-                if link_tag and title_tag:
-                    href = link_tag.get('href')
-                    title = title_tag.get_text(strip=True)
-                    
-                    if href and title:
-                        # 상대 경로일 경우 base_url과 조합
-                        if href.startswith('/'):
-                            href = self.base_url + href
-                        
-                        if href.startswith(self.base_url): # 전체 URL이 base_url로 시작하는지 다시 확인
-                            article_infos.append({'title': title, 'url': href})
-            
-            unique_articles = {info['url']: info for info in article_infos}.values()
-            article_infos = list(unique_articles)
+            html_content = await self.fetch_text(session, category_url, timeout=30, use_cache=True)
+            article_infos = await self.extract_links_with_spec(html_content, category_url)
             print(f"[{self.site_name}] Found {len(article_infos)} news links from {category_url}")
         except Exception as e:
             print(f"[{self.site_name}] Error fetching or parsing links from {category_url}: {e}")
         return article_infos
 
     async def fetch_article_content(self, session: aiohttp.ClientSession, article_url: str, original_title: str, category: str) -> dict | None:
-        await asyncio.sleep(random.uniform(1, 3))
         print(f"[{self.site_name.upper()}/{category.upper()}] 기사 내용 가져오기 시작: {original_title} ({article_url})")
         try:
-            async with session.get(article_url, headers=self.headers, timeout=self.timeout_seconds) as response:
-                response.raise_for_status()
-                html_content = await response.text()
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # TODO: 한겨레 기사 상세 페이지 구조에 맞는 선택자로 수정 필요
-            title_tag = soup.select_one('span.title, h1.title, header h1')
-            article_title = title_tag.get_text(strip=True) if title_tag else original_title
-            
-            article_body_tag = soup.select_one('div.article-text, div.text, section.article-text-font-size')
-            article_text_content = ""
-            if article_body_tag:
-                # 기자 정보, 광고 등 제외
-                for el in article_body_tag.select('.journalist-info, .advertise, .related-articles, .copyright'):
-                    el.decompose()
-                paragraphs = article_body_tag.find_all('p', recursive=True)
-                for p in paragraphs:
-                    article_text_content += p.get_text(strip=True) + "\n"
-            if not article_text_content.strip(): article_text_content = original_title
-
-            main_image_url = None
-            og_image_tag = soup.find('meta', property='og:image')
-            if og_image_tag and og_image_tag.get('content'):
-                main_image_url = og_image_tag['content']
-            # TODO: og:image 없을 경우 대체 로직
-
-            if not article_text_content.strip():
-                print(f"[{self.site_name.upper()}/{category.upper()}] 기사 본문 내용을 추출하지 못했습니다: {article_url}")
-                return None
-
-            return {
-                "url": article_url,
-                "title": article_title,
-                "main_image_url": main_image_url,
-                "article_text": article_text_content.strip(),
-                "source": self.site_name,
-                "category": category
-            }
+            html_content = await self.fetch_bytes(session, article_url)
+            return await self.extract_article_with_spec(html_content, article_url, original_title, category)
         except asyncio.TimeoutError:
             print(f"[{self.site_name.upper()}/{category.upper()}] 기사 페이지 로딩 시간 초과: {article_url}")
             return None
@@ -135,48 +76,46 @@ class HankyorehCollector(BaseCollector):
         print(f"[{self.name}] Extracting content from {news_url} (not implemented yet)")
         return None # 실제 구현 필요
 
-    async def search_by_keyword(self, keyword: str) -> list[dict]:
+    async def search_by_keyword(self, keyword: str, session: aiohttp.ClientSession | None = None) -> list[dict]:
         """
         키워드로 한겨레 기사를 검색합니다.
         """
         search_url = f"https://search.hani.co.kr/search?searchword={keyword}"
         
-        async with aiohttp.ClientSession() as session:
-            try:
-                print(f"[{self.site_name}] 키워드 '{keyword}' 검색: {search_url}")
-                async with session.get(search_url, headers=self.headers, timeout=30) as response:
-                    response.raise_for_status()
-                    html_content = await response.text()
-                
-                soup = BeautifulSoup(html_content, 'html.parser')
-                articles = []
-                
-                # 한겨레 검색 결과에서 기사 링크 추출
-                search_results = soup.select('div.search-result-item, div.ArticleList_item___OGQO')
-                
-                for item in search_results[:10]:  # 최대 10개 기사만 수집
-                    try:
-                        link_tag = item.select_one('a, h3 a')
-                        if link_tag:
-                            article_url = link_tag.get('href')
-                            title = link_tag.get_text(strip=True)
+        session = session or get_session()
+        try:
+            print(f"[{self.site_name}] 키워드 '{keyword}' 검색: {search_url}")
+            html_content = await self.fetch_text(session, search_url, timeout=30, use_cache=True)
+            
+            soup = BeautifulSoup(html_content, 'html.parser')
+            articles = []
+            
+            # 한겨레 검색 결과에서 기사 링크 추출
+            search_results = soup.select('div.search-result-item, div.ArticleList_item___OGQO')
+            
+            for item in search_results[:10]:  # 최대 10개 기사만 수집
+                try:
+                    link_tag = item.select_one('a, h3 a')
+                    if link_tag:
+                        article_url = link_tag.get('href')
+                        title = link_tag.get_text(strip=True)
+                        
+                        if article_url and title:
+                            if not article_url.startswith('http'):
+                                article_url = f"https://www.hani.co.kr{article_url}"
+                            
+                            # 개별 기사 내용 수집
+                            article_data = await self.fetch_article_content(session, article_url, title, 'search')
+                            if article_data:
+                                articles.append(article_data)
                             
-                            if article_url and title:
-                                if not article_url.startswith('http'):
-                                    article_url = f"https://www.hani.co.kr{article_url}"
-                                
-                                # 개별 기사 내용 수집
-                                article_data = await self.fetch_article_content(session, article_url, title, 'search')
-                                if article_data:
-                                    articles.append(article_data)
-                                
-                    except Exception as e:
-                        print(f"[{self.site_name}] 검색 결과 처리 중 오류: {e}")
-                        continue
-                
-                print(f"[{self.site_name}] 키워드 '{keyword}'로 {len(articles)}개 기사 수집 완료")
-                return articles
-                
-            except Exception as e:
-                print(f"[{self.site_name}] 키워드 '{keyword}' 검색 중 오류: {e}")
-                return [] 
\ No newline at end of file
+                except Exception as e:
+                    print(f"[{self.site_name}] 검색 결과 처리 중 오류: {e}")
+                    continue
+            
+            print(f"[{self.site_name}] 키워드 '{keyword}'로 {len(articles)}개 기사 수집 완료")
+            return articles
+            
+        except Exception as e:
+            print(f"[{self.site_name}] 키워드 '{keyword}' 검색 중 오류: {e}")
+            return [] 
\ No newline at end of file
@@ -0,0 +1,240 @@
+import os
+from bs4 import BeautifulSoup
+
+try:
+    import soupsieve
+except ImportError:
+    soupsieve = None
+
+try:
+    import lxml  # noqa: F401  (BeautifulSoup의 'lxml' 트리 빌더가 사용)
+    _HAS_LXML = True
+except ImportError:
+    _HAS_LXML = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    try:
+        # selectolax 1.0 이전 버전은 Modest 백엔드만 있다.
+        from selectolax.parser import HTMLParser
+    except ImportError:
+        HTMLParser = None
+
+# 지원하는 파서 백엔드. html.parser는 순수 파이썬, lxml과 selectolax는 C 구현이다.
+PARSER_BACKENDS = ("html.parser", "lxml", "selectolax")
+# 수집기가 따로 지정하지 않았을 때 쓰는 백엔드
+DEFAULT_PARSER = "lxml"
+# 설정하면 수집기의 백엔드를 이 값으로 덮어쓴다. (비교/문제 확인용, 전역 스위치가 아님)
+# selectolax는 정규식/함수 find 조건을 지원하지 않으므로, selectolax_safe인 수집기에만 적용된다. (collector_parser 참고)
+PARSER_OVERRIDE = os.getenv("HTML_PARSER", "")
+
+_warned: set[str] = set()
+
+
+def resolve_parser(parser: str) -> str:
+    """
+    기능: 요청한 백엔드를 실제로 쓸 수 있는 백엔드로 바꾼다. 설치되지 않았으면 selectolax → lxml → html.parser 순으로 내려간다.
+    input: parser (백엔드 이름)
+    output: 사용할 백엔드 이름
+    """
+    parser = parser or DEFAULT_PARSER
+    if parser not in PARSER_BACKENDS:
+        raise ValueError(f"지원하지 않는 HTML 파서입니다: {parser} (가능: {', '.join(PARSER_BACKENDS)})")
+    if parser == "selectolax" and HTMLParser is None:
+        _warn_once(parser, "lxml")
+        parser = "lxml"
+    if parser == "lxml" and not _HAS_LXML:
+        _warn_once(parser, "html.parser")
+        parser = "html.parser"
+    return parser
+
+
+def collector_parser(parser: str, selectolax_safe: bool) -> str:
+    """
+    기능: 수집기가 지정한 백엔드에 HTML_PARSER 덮어쓰기를 적용한다.
+          HTML_PARSER=selectolax는 추출 함수가 문자열 조건과 CSS 선택자만 쓰는(selectolax_safe) 수집기에만 적용하고,
+          정규식/함수 조건을 쓰는 수집기는 자기 백엔드를 그대로 쓴다. (selectolax에서는 TypeError가 난다)
+    input: parser (수집기의 html_parser), selectolax_safe (수집기의 추출 함수가 selectolax에서 동작하는지 여부)
+    output: 수집기가 쓸 백엔드 이름
+    """
+    if not PARSER_OVERRIDE:
+        return parser
+    if PARSER_OVERRIDE not in PARSER_BACKENDS:
+        raise ValueError(f"지원하지 않는 HTML 파서입니다: HTML_PARSER={PARSER_OVERRIDE} (가능: {', '.join(PARSER_BACKENDS)})")
+    if PARSER_OVERRIDE == "selectolax" and not selectolax_safe:
+        return parser
+    return PARSER_OVERRIDE
+
+
+def make_soup(html_content: str | bytes, parser: str = DEFAULT_PARSER):
+    """
+    기능: 지정한 백엔드로 HTML을 파싱해 문서 객체를 만든다.
+          html.parser/lxml은 BeautifulSoup 객체를, selectolax는 같은 select_one/select/get_text 인터페이스를 가진 SelectolaxNode를 반환한다.
+    input: html_content (HTML 문자열 또는 bytes), parser (백엔드 이름)
+    output: BeautifulSoup 또는 SelectolaxNode
+    """
+    parser = resolve_parser(parser)
+    if parser == "selectolax":
+        return SelectolaxNode(HTMLParser(html_content).root)
+    return BeautifulSoup(html_content, parser)
+
+
+class CompiledSelector:
+    """
+    한 번 컴파일해 두고 여러 페이지에 재사용하는 CSS 선택자.
+    BeautifulSoup 문서에는 soupsieve로 미리 컴파일한 매처를, selectolax 문서에는 lexbor 선택자 엔진을 쓴다.
+    """
+    __slots__ = ("selector", "_matcher")
+
+    def __init__(self, selector: str):
+        self.selector = selector
+        self._matcher = soupsieve.compile(selector) if soupsieve is not None else None
+
+    def __repr__(self) -> str:
+        return f"<CompiledSelector {self.selector!r}>"
+
+    def select(self, node) -> list:
+        if self._matcher is None or isinstance(node, SelectolaxNode):
+            return node.select(self.selector)
+        return self._matcher.select(node)
+
+    def select_one(self, node):
+        if self._matcher is None or isinstance(node, SelectolaxNode):
+            return node.select_one(self.selector)
+        return self._matcher.select_one(node)
+
+
+def _warn_once(requested: str, fallback: str):
+    if requested not in _warned:
+        _warned.add(requested)
+        print(f"[HtmlParser] '{requested}' 백엔드가 설치되어 있지 않아 '{fallback}'로 파싱합니다.")
+
+
+class SelectolaxNode:
+    """
+    selectolax 노드를 BeautifulSoup Tag처럼 쓰기 위한 얇은 래퍼.
+    수집기가 쓰는 select_one/select/get_text/get/decompose와, 문자열 조건만 쓰는 find/find_all을 지원한다.
+    정규식이나 함수 조건은 CSS 선택자로 옮길 수 없으므로 TypeError를 낸다. 그런 수집기는 lxml 백엔드를 쓴다.
+    """
+    __slots__ = ("_node",)
+
+    _SKIPPED_TEXT_PARENTS = {"script", "style", "template", "noscript"}
+
+    def __init__(self, node):
+        self._node = node
+
+    def __bool__(self) -> bool:
+        return self._node is not None
+
+    def __repr__(self) -> str:
+        return f"<SelectolaxNode {self.name}>"
+
+    def __eq__(self, other) -> bool:
+        # 같은 문서 노드를 가리키는 래퍼끼리 같다고 본다. (BeautifulSoup의 p.parent == body 비교용)
+        return isinstance(other, SelectolaxNode) and self._node.mem_id == other._node.mem_id
+
+    def __hash__(self) -> int:
+        return self._node.mem_id
+
+    @property
+    def name(self) -> str:
+        return self._node.tag
+
+    @property
+    def parent(self) -> "SelectolaxNode | None":
+        node = self._node.parent
+        return SelectolaxNode(node) if node is not None else None
+
+    @property
+    def attrs(self) -> dict:
+        return dict(self._node.attributes)
+
+    @property
+    def text(self) -> str:
+        return self.get_text()
+
+    def get(self, key: str, default=None):
+        value = self._node.attributes.get(key, default)
+        if key == "class" and isinstance(value, str):
+            # BeautifulSoup은 class를 리스트로 돌려준다.
+            return value.split()
+        if value is None and key in self._node.attributes:
+            # 값 없는 속성(<input disabled>)은 BeautifulSoup처럼 빈 문자열로 본다.
+            return ""
+        return value
+
+    def __getitem__(self, key: str):
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def has_attr(self, key: str) -> bool:
+        return key in self._node.attributes
+
+    def select(self, selector: str) -> list["SelectolaxNode"]:
+        return [SelectolaxNode(node) for node in self._node.css(selector)]
+
+    def select_one(self, selector: str) -> "SelectolaxNode | None":
+        node = self._node.css_first(selector)
+        return SelectolaxNode(node) if node is not None else None
+
+    def get_text(self, separator: str = "", strip: bool = False) -> str:
+        parts = []
+        for node in self._node.traverse(include_text=True):
+            if node.tag != "-text":
+                continue
+            parent = node.parent
+            if parent is not None and parent.tag in self._SKIPPED_TEXT_PARENTS:
+                continue
+            text = node.text(deep=False)
+            if strip:
+                text = text.strip()
+                if not text:
+                    continue
+            parts.append(text)
+        return separator.join(parts)
+
+    def decompose(self):
+        self._node.decompose()
+
+    def find_all(self, name=None, attrs: dict | None = None, recursive: bool = True, class_=None, limit: int | None = None, **kwargs) -> list["SelectolaxNode"]:
+        selector = _to_css(name, {**(attrs or {}), **kwargs}, class_)
+        nodes = self._node.css(selector)
+        if not recursive:
+            nodes = [node for node in nodes if node.parent is not None and node.parent.mem_id == self._node.mem_id]
+        if limit:
+            nodes = nodes[:limit]
+        return [SelectolaxNode(node) for node in nodes]
+
+    def find(self, name=None, attrs: dict | None = None, recursive: bool = True, class_=None, **kwargs) -> "SelectolaxNode | None":
+        found = self.find_all(name, attrs, recursive=recursive, class_=class_, limit=1, **kwargs)
+        return found[0] if found else None
+
+
+def _to_css(name, attrs: dict, class_) -> str:
+    """BeautifulSoup의 find_all 조건(태그 이름, 문자열/True 속성 값, class_)을 CSS 선택자로 바꾼다."""
+    if name is None:
+        names = ["*"]
+    elif isinstance(name, str):
+        names = [name]
+    elif isinstance(name, (list, tuple, set)) and all(isinstance(n, str) for n in name):
+        names = list(name)
+    else:
+        raise TypeError(f"selectolax 백엔드는 문자열 태그 조건만 지원합니다: {name!r}")
+
+    conditions = ""
+    if class_ is not None:
+        attrs = {**attrs, "class": class_}
+    for key, value in attrs.items():
+        if value is True:
+            conditions += f"[{key}]"
+        elif isinstance(value, str):
+            escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+            # BeautifulSoup은 class 토큰 하나만 맞아도 일치로 본다. 공백이 있으면 전체 문자열 비교.
+            operator = "~=" if key == "class" and " " not in value else "="
+            conditions += f'[{key}{operator}"{escaped}"]'
+        else:
+            raise TypeError(f"selectolax 백엔드는 문자열/True 속성 조건만 지원합니다: {key}={value!r}")
+    return ", ".join(f"{n}{conditions}" for n in names)
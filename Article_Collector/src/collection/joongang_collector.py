@@ -5,12 +5,18 @@ import yaml
 import os
 import asyncio
 import re
-import random
+from src.utils.http_session import get_session
 
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 DEFAULT_CONFIG_PATH = os.path.join(PROJECT_ROOT, 'configs', 'news_sites.yaml')
 
 class JoongangCollector(BaseCollector):
+    # 추출 함수가 CSS 선택자와 문자열 조건만 쓰므로 selectolax로 파싱한다.
+    html_parser = "selectolax"
+    selectolax_safe = True
+    # 목록/기사 추출 규칙은 configs/extraction_specs.yaml의 joongang 스펙을 쓴다.
+    extraction_spec = "joongang"
+
     def __init__(self, config_path=DEFAULT_CONFIG_PATH):
         try:
             with open(config_path, 'r', encoding='utf-8') as f:
@@ -29,87 +35,18 @@ class JoongangCollector(BaseCollector):
         article_infos = []
         print(f"[{self.site_name}] Fetching links from {category_url}")
         try:
-            async with session.get(category_url, headers=self.headers, timeout=30) as response:
-                response.raise_for_status()
-                html_content = await response.text()
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            article_url_pattern = f"{self.base_url}/article/"
-            # Uses .card selector to find articles in showcase, most viewed, and latest lists.
-            # Selects <a> tags whose href starts with the article_url_pattern.
-            link_tags = soup.select(f'.card a[href^="{article_url_pattern}"]')
-
-            for link_tag in link_tags:
-                href = link_tag.get('href')
-                title = link_tag.get_text(strip=True)
-                if not title:
-                    img_tag = link_tag.find('img')
-                    if img_tag and img_tag.get('alt'):
-                        title = img_tag.get('alt').strip()
-                if not title: # Fallback for title from href
-                    title_parts = [part for part in href.split('/') if part]
-                    if title_parts:
-                        slug_part = title_parts[-1].split('?')[0] # Remove query params
-                        title = slug_part.replace('-', ' ').replace('_', ' ')
-                        title = ' '.join(word.capitalize() for word in title.split()) # Capitalize for readability
-
-                if href and title and href.startswith(self.base_url): # Ensure it's a valid article link from the same domain
-                    article_infos.append({'title': title, 'url': href})
-            
-            unique_articles = {info['url']: info for info in article_infos}.values()
-            article_infos = list(unique_articles)
+            html_content = await self.fetch_text(session, category_url, timeout=30, use_cache=True)
+            article_infos = await self.extract_links_with_spec(html_content, category_url)
             print(f"[{self.site_name}] Found {len(article_infos)} news links from {category_url}")
         except Exception as e:
             print(f"[{self.site_name}] Error fetching or parsing links from {category_url}: {e}")
         return article_infos
 
     async def fetch_article_content(self, session: aiohttp.ClientSession, article_url: str, original_title: str, category: str) -> dict | None:
-        await asyncio.sleep(random.uniform(1, 3))
         print(f"[{self.site_name.upper()}/{category.upper()}] 기사 내용 가져오기 시작: {original_title} ({article_url})")
         try:
-            async with session.get(article_url, headers=self.headers, timeout=self.timeout_seconds) as response:
-                response.raise_for_status()
-                html_content = await response.text()
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # TODO: 중앙일보 기사 상세 페이지 구조에 맞는 선택자로 수정 필요
-            title_tag = soup.select_one('h1.card_title, h1.title, article header h1')
-            article_title = title_tag.get_text(strip=True) if title_tag else original_title
-            
-            article_body_tag = soup.select_one('div#article_body, div.article_content, section.article_body')
-            article_text = ""
-            if article_body_tag:
-                paragraphs = article_body_tag.find_all('p', recursive=False)
-                if not paragraphs:
-                    paragraphs = article_body_tag.find_all('p')
-                for p in paragraphs:
-                    article_text += p.get_text(strip=True) + "\n"
-            if not article_text.strip(): article_text = original_title
-
-            main_image_url = None
-            # og_image_tag = soup.find('meta', property='og:image')
-            # if og_image_tag and og_image_tag.get('content'):
-            #     main_image_url = og_image_tag['content']
-            
-            if not main_image_url:
-                image_div = soup.select_one('div.image')
-                if image_div:
-                    img_tag = image_div.find('img')
-                    if img_tag and img_tag.get('data-src'):
-                        main_image_url = img_tag['data-src']
-            
-            if not article_text.strip():
-                print(f"[{self.site_name.upper()}/{category.upper()}] 기사 본문 내용을 추출하지 못했습니다: {article_url}")
-                return None
-
-            return {
-                "url": article_url,
-                "title": article_title,
-                "main_image_url": main_image_url,
-                "article_text": article_text.strip(),
-                "source": self.site_name,
-                "category": category
-            }
+            html_content = await self.fetch_bytes(session, article_url)
+            return await self.extract_article_with_spec(html_content, article_url, original_title, category)
         except asyncio.TimeoutError:
             print(f"[{self.site_name.upper()}/{category.upper()}] 기사 페이지 로딩 시간 초과: {article_url}")
             return None
@@ -139,47 +76,45 @@ class JoongangCollector(BaseCollector):
         print(f"[{self.name}] Extracting content from {news_url} (not implemented yet)")
         return None # 실제 구현 필요
 
-    async def search_by_keyword(self, keyword: str) -> list[dict]:
+    async def search_by_keyword(self, keyword: str, session: aiohttp.ClientSession | None = None) -> list[dict]:
         """
         키워드로 중앙일보 기사를 검색합니다.
         """
         search_url = f"https://www.joongang.co.kr/search?keyword={keyword}"
         
-        async with aiohttp.ClientSession() as session:
-            try:
-                print(f"[{self.site_name}] 키워드 '{keyword}' 검색: {search_url}")
-                async with session.get(search_url, headers=self.headers, timeout=30) as response:
-                    response.raise_for_status()
-                    html_content = await response.text()
-                
-                soup = BeautifulSoup(html_content, 'html.parser')
-                articles = []
-                
-                # 중앙일보 검색 결과에서 기사 링크 추출
-                search_results = soup.select('div.story_list_box li')
-                
-                for item in search_results[:10]:  # 최대 10개 기사만 수집
-                    try:
-                        link_tag = item.select_one('a')
-                        if link_tag:
-                            article_url = link_tag.get('href')
-                            if article_url and not article_url.startswith('http'):
-                                article_url = f"https://www.joongang.co.kr{article_url}"
+        session = session or get_session()
+        try:
+            print(f"[{self.site_name}] 키워드 '{keyword}' 검색: {search_url}")
+            html_content = await self.fetch_text(session, search_url, timeout=30, use_cache=True)
+            
+            soup = BeautifulSoup(html_content, 'html.parser')
+            articles = []
+            
+            # 중앙일보 검색 결과에서 기사 링크 추출
+            search_results = soup.select('div.story_list_box li')
+            
+            for item in search_results[:10]:  # 최대 10개 기사만 수집
+                try:
+                    link_tag = item.select_one('a')
+                    if link_tag:
+                        article_url = link_tag.get('href')
+                        if article_url and not article_url.startswith('http'):
+                            article_url = f"https://www.joongang.co.kr{article_url}"
+                        
+                        title = link_tag.get_text(strip=True)
+                        if article_url and title:
+                            # 개별 기사 내용 수집
+                            article_data = await self.fetch_article_content(session, article_url, title, 'search')
+                            if article_data:
+                                articles.append(article_data)
                             
-                            title = link_tag.get_text(strip=True)
-                            if article_url and title:
-                                # 개별 기사 내용 수집
-                                article_data = await self.fetch_article_content(session, article_url, title, 'search')
-                                if article_data:
-                                    articles.append(article_data)
-                                
-                    except Exception as e:
-                        print(f"[{self.site_name}] 검색 결과 처리 중 오류: {e}")
-                        continue
-                
-                print(f"[{self.site_name}] 키워드 '{keyword}'로 {len(articles)}개 기사 수집 완료")
-                return articles
-                
-            except Exception as e:
-                print(f"[{self.site_name}] 키워드 '{keyword}' 검색 중 오류: {e}")
-                return [] 
\ No newline at end of file
+                except Exception as e:
+                    print(f"[{self.site_name}] 검색 결과 처리 중 오류: {e}")
+                    continue
+            
+            print(f"[{self.site_name}] 키워드 '{keyword}'로 {len(articles)}개 기사 수집 완료")
+            return articles
+            
+        except Exception as e:
+            print(f"[{self.site_name}] 키워드 '{keyword}' 검색 중 오류: {e}")
+            return [] 
\ No newline at end of file
@@ -0,0 +1,65 @@
+import os
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable
+
+# HTML 파싱/추출을 실행하는 프로세스 수. 0이면 프로세스 풀 대신 이벤트 루프 기본 스레드 풀에서 파싱한다.
+PARSE_WORKERS = int(os.getenv("PARSE_WORKERS", os.cpu_count() or 1))
+
+# 전역 파싱 프로세스 풀 인스턴스
+_parse_executor = None
+
+
+def _init_parse_worker():
+    # 워커마다 추출 스펙을 한 번 컴파일해 두어 첫 작업부터 컴파일된 선택자/정규식을 쓴다.
+    from src.collection.extraction_spec import load_extraction_specs
+    try:
+        load_extraction_specs()
+    except Exception as e:
+        print(f"[ParseExecutor] 워커 추출 스펙 컴파일 실패: {e}")
+
+
+def get_parse_executor() -> ProcessPoolExecutor | None:
+    """
+    기능: 프로세스 전체에서 공유하는 파싱용 ProcessPoolExecutor를 반환한다. 처음 호출할 때 만든다.
+    input: 없음
+    output: ProcessPoolExecutor (PARSE_WORKERS가 0이면 None, 즉 기본 스레드 풀)
+    """
+    global _parse_executor
+    if PARSE_WORKERS <= 0:
+        return None
+    if _parse_executor is None:
+        _parse_executor = ProcessPoolExecutor(max_workers=PARSE_WORKERS, initializer=_init_parse_worker)
+        print(f"[ParseExecutor] 파싱 프로세스 풀 시작 (workers={PARSE_WORKERS})")
+    return _parse_executor
+
+
+async def run_parser(parse_fn: Callable[..., Any], *args) -> Any:
+    """
+    기능: 사이트별 추출 함수를 파싱 프로세스 풀에서 실행하고 결과를 기다린다.
+          BeautifulSoup 파싱이 이벤트 루프를 막지 않으므로 다른 요청의 네트워크 대기가 계속 진행된다.
+    input: parse_fn (모듈 최상위에 정의된 피클 가능한 함수), args (bytes/str 등 피클 가능한 인자)
+    output: parse_fn의 반환값 (dict, list 등 순수 파이썬 값)
+    """
+    global _parse_executor
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(get_parse_executor(), parse_fn, *args)
+    except BrokenProcessPool:
+        # 워커 프로세스가 죽으면 풀 전체를 쓸 수 없으므로, 다음 호출에서 새로 만든다.
+        print("[ParseExecutor] 파싱 프로세스 풀이 손상되어 다시 만듭니다.")
+        _parse_executor = None
+        raise
+
+
+def shutdown_parse_executor():
+    """
+    기능: 파싱 프로세스 풀을 종료한다. 수집 파이프라인이 끝날 때 호출한다.
+    input: 없음
+    output: 없음
+    """
+    global _parse_executor
+    if _parse_executor is not None:
+        _parse_executor.shutdown(wait=True, cancel_futures=True)
+        _parse_executor = None
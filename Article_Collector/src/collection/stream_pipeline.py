@@ -0,0 +1,104 @@
+import os
+import time
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Iterable
+
+# 큐 깊이를 로그로 남기는 주기(초)
+QUEUE_LOG_INTERVAL = float(os.getenv("STREAM_QUEUE_LOG_INTERVAL", 10))
+
+_SENTINEL = object()
+
+
+@dataclass
+class Stage:
+    """
+    스트리밍 파이프라인의 한 단계.
+    handler는 항목 하나를 받아 다음 단계로 넘길 결과를 반환한다. None이면 그 항목은 여기서 끝난다.
+    fan_out이면 handler가 리스트를 반환하고, 각 원소가 따로 다음 단계로 넘어간다.
+    """
+    name: str
+    handler: Callable[[Any], Awaitable[Any]]
+    workers: int
+    fan_out: bool = False
+    queue: asyncio.Queue = field(init=False, repr=False)
+    processed: int = field(default=0, init=False)
+    failed: int = field(default=0, init=False)
+
+
+class StreamPipeline:
+    """
+    크기 제한 큐로 연결된 비동기 단계들의 파이프라인.
+    각 항목은 준비되는 즉시 다음 단계로 넘어가므로 느린 항목 하나가 다른 항목을 붙잡지 않는다.
+    큐가 차면 앞 단계가 기다리므로(백프레셔) 메모리 사용량이 단계별 큐 크기로 묶인다.
+    """
+    def __init__(self, name: str, stages: list[Stage]):
+        self.name = name
+        self.stages = stages
+
+    async def _run_stage(self, index: int):
+        stage = self.stages[index]
+        next_stage = self.stages[index + 1] if index + 1 < len(self.stages) else None
+
+        async def forward(result):
+            if result is None or next_stage is None:
+                return
+            for item in (result if stage.fan_out else [result]):
+                await next_stage.queue.put(item)
+
+        async def worker():
+            while True:
+                item = await stage.queue.get()
+                if item is _SENTINEL:
+                    return
+                try:
+                    result = await stage.handler(item)
+                    stage.processed += 1
+                except Exception as e:
+                    stage.failed += 1
+                    print(f"[{self.name}/{stage.name}] 처리 중 오류: {e}")
+                    continue
+                await forward(result)
+
+        await asyncio.gather(*[worker() for _ in range(stage.workers)])
+        # 이 단계의 워커가 모두 끝나야 다음 단계에 종료를 알린다.
+        if next_stage is not None:
+            for _ in range(next_stage.workers):
+                await next_stage.queue.put(_SENTINEL)
+
+    async def _log_queue_depth(self, started_at: float):
+        while True:
+            await asyncio.sleep(QUEUE_LOG_INTERVAL)
+            print(f"[{self.name}] {time.monotonic() - started_at:.0f}s | {self.describe()}")
+
+    def describe(self) -> str:
+        return " | ".join(
+            f"{stage.name}: 대기 {stage.queue.qsize()}/{stage.queue.maxsize}, 완료 {stage.processed}, 실패 {stage.failed}"
+            for stage in self.stages
+        )
+
+    async def run(self, items: Iterable[Any]) -> list[Stage]:
+        """
+        기능: 입력 항목을 첫 단계에 흘려보내고 모든 단계가 끝날 때까지 기다린다.
+        input: items (첫 단계가 처리할 항목)
+        output: 단계 리스트 (처리/실패 건수 확인용)
+        """
+        for stage in self.stages:
+            stage.workers = max(1, stage.workers)
+            stage.queue = asyncio.Queue(maxsize=stage.workers * 2)
+            stage.processed = stage.failed = 0
+
+        async def feed():
+            for item in items:
+                await self.stages[0].queue.put(item)
+            for _ in range(self.stages[0].workers):
+                await self.stages[0].queue.put(_SENTINEL)
+
+        started_at = time.monotonic()
+        monitor = asyncio.create_task(self._log_queue_depth(started_at))
+        try:
+            await asyncio.gather(feed(), *[self._run_stage(i) for i in range(len(self.stages))])
+        finally:
+            monitor.cancel()
+        print(f"[{self.name}] 완료 ({time.monotonic() - started_at:.1f}s) | {self.describe()}")
+        return self.stages
@@ -0,0 +1,175 @@
+import os
+import re
+import json
+import html
+from typing import Any, Callable
+
+# 기사 dict 중 구조화 데이터로 채울 수 있는 필드
+STRUCTURED_FIELDS = ("title", "article_text", "main_image_url")
+# ld+json articleBody가 이보다 짧으면 요약문으로 보고 본문으로 쓰지 않는다.
+MIN_STRUCTURED_BODY_CHARS = int(os.getenv("MIN_STRUCTURED_BODY_CHARS", 200))
+
+# 기사로 보는 schema.org 타입
+_ARTICLE_TYPES = {
+    "NewsArticle", "Article", "ReportageNews", "AnalysisNewsArticle", "OpinionNewsArticle",
+    "BackgroundNewsArticle", "ReviewNewsArticle", "BlogPosting", "LiveBlogPosting",
+}
+
+_LD_JSON_RE = re.compile(
+    rb'<script\b[^>]*type\s*=\s*["\']?application/ld\+json["\']?[^>]*>(.*?)</script\s*>',
+    re.I | re.S,
+)
+_META_RE = re.compile(rb'<meta\b[^>]*>', re.I)
+_ATTR_RE = re.compile(rb'([a-zA-Z_:][-a-zA-Z0-9_:.]*)\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'>]+))')
+_HEAD_END_RE = re.compile(rb'</head\s*>', re.I)
+
+
+def _to_bytes(html_content: str | bytes) -> bytes:
+    return html_content if isinstance(html_content, bytes) else html_content.encode("utf-8", errors="replace")
+
+
+def _decode(value: bytes) -> str:
+    return html.unescape(value.decode("utf-8", errors="replace")).strip()
+
+
+def _iter_ld_objects(data: Any):
+    """ld+json 값(객체, 리스트, @graph)을 평탄하게 순회한다."""
+    if isinstance(data, list):
+        for item in data:
+            yield from _iter_ld_objects(item)
+    elif isinstance(data, dict):
+        yield data
+        if "@graph" in data:
+            yield from _iter_ld_objects(data["@graph"])
+
+
+def _is_article(obj: dict) -> bool:
+    types = obj.get("@type")
+    types = types if isinstance(types, list) else [types]
+    return any(isinstance(t, str) and t in _ARTICLE_TYPES for t in types)
+
+
+def _image_url(image: Any) -> str | None:
+    if isinstance(image, str):
+        return image or None
+    if isinstance(image, list):
+        for item in image:
+            url = _image_url(item)
+            if url:
+                return url
+    if isinstance(image, dict):
+        return _image_url(image.get("url") or image.get("contentUrl"))
+    return None
+
+
+def _scan_ld_json(raw: bytes) -> dict:
+    found = {}
+    for match in _LD_JSON_RE.finditer(raw):
+        block = match.group(1).strip()
+        if not block:
+            continue
+        try:
+            data = json.loads(block)
+        except ValueError:
+            try:
+                data = json.loads(block.decode("utf-8", errors="replace"), strict=False)
+            except ValueError:
+                continue
+        for obj in _iter_ld_objects(data):
+            if not _is_article(obj):
+                continue
+            headline = obj.get("headline") or obj.get("name")
+            if isinstance(headline, str) and headline.strip() and "title" not in found:
+                found["title"] = html.unescape(headline).strip()
+            body = obj.get("articleBody")
+            if isinstance(body, str) and len(body.strip()) >= MIN_STRUCTURED_BODY_CHARS and "article_text" not in found:
+                found["article_text"] = html.unescape(body).strip()
+            image = _image_url(obj.get("image") or obj.get("thumbnailUrl"))
+            if image and "main_image_url" not in found:
+                found["main_image_url"] = image
+    return found
+
+
+def _scan_meta(raw: bytes) -> dict:
+    # og:/twitter: 메타 태그는 <head> 안에 있으므로 그 앞까지만 훑는다.
+    head_end = _HEAD_END_RE.search(raw)
+    head = raw[:head_end.start()] if head_end else raw
+    meta = {}
+    for match in _META_RE.finditer(head):
+        attrs = {}
+        for attr in _ATTR_RE.finditer(match.group(0)):
+            value = attr.group(2) if attr.group(2) is not None else attr.group(3) if attr.group(3) is not None else attr.group(4)
+            attrs[attr.group(1).lower()] = value
+        key = attrs.get(b"property") or attrs.get(b"name")
+        content = attrs.get(b"content")
+        if key and content and key.lower() not in meta:
+            meta[key.lower()] = content
+
+    found = {}
+    title = meta.get(b"og:title") or meta.get(b"twitter:title")
+    if title:
+        found["title"] = _decode(title)
+    image = meta.get(b"og:image") or meta.get(b"og:image:url") or meta.get(b"twitter:image")
+    if image:
+        found["main_image_url"] = _decode(image)
+    return {key: value for key, value in found.items() if value}
+
+
+def scan_structured_data(html_content: str | bytes) -> dict:
+    """
+    기능: 전체 DOM을 만들지 않고 원본 HTML bytes에서 application/ld+json 기사 블록과 og: 메타 태그만 정규식으로 훑어 기사 필드를 찾는다.
+          ld+json 값이 og: 메타보다 우선한다.
+    input: html_content (HTML 문자열 또는 bytes)
+    output: STRUCTURED_FIELDS 중 찾은 필드만 담은 딕셔너리 (dict)
+    """
+    raw = _to_bytes(html_content)
+    found = _scan_meta(raw)
+    found.update(_scan_ld_json(raw))
+    return found
+
+
+def merge_structured_data(article: dict | None, found: dict, article_url: str, original_title: str, category: str, site_name: str) -> dict | None:
+    """
+    기능: DOM 추출 결과에서 비어 있는 필드를 구조화 데이터로 채운다. (사이트별로 다듬은 DOM 값이 우선)
+          DOM 추출이 실패했더라도 구조화 데이터에 본문이 있으면 기사로 만든다.
+    input: article (DOM 추출 결과 또는 None), found (scan_structured_data 결과), 기사 URL, 원본 제목, 카테고리, 사이트 이름
+    output: 기사 상세 정보 딕셔너리 또는 None (dict | None)
+    """
+    if article is None:
+        if not found.get("article_text"):
+            return None
+        article = {
+            "url": article_url,
+            "title": found.get("title") or original_title,
+            "main_image_url": None,
+            "article_text": "",
+            "source": site_name,
+            "category": category
+        }
+    for field, value in found.items():
+        if not article.get(field):
+            article[field] = value
+    return article
+
+
+def parse_with_structured_data(parse_fn: Callable[..., dict | None], text_filter: Callable[[str], str] | None, html_content: str | bytes, article_url: str, original_title: str, category: str, site_name: str, *args) -> dict | None:
+    """
+    기능: 구조화 데이터 선추출 단계. ld+json/og: 메타로 제목, 본문, 대표 이미지를 모두 얻으면 DOM 파싱을 건너뛰고,
+          빠진 필드가 있을 때만 사이트별 추출 함수를 실행해 나머지를 채운다. 파싱 프로세스 풀에서 실행된다.
+          구조화 데이터 본문에도 사이트별 본문 필터(text_filter)를 적용한다. 필터 후 본문이 MIN_STRUCTURED_BODY_CHARS보다 짧아지면 DOM 추출로 넘어간다.
+    input: parse_fn (parse_fn(html_content, article_url, original_title, category, site_name, *args) 형태의 사이트별 기사 추출 함수),
+           text_filter (본문 텍스트를 받아 기자 정보, 광고 문구 등을 걸러낸 텍스트를 반환하는 함수 또는 None),
+           기사 페이지 HTML(html_content), 기사 URL(article_url), 원본 제목(original_title), 카테고리(category), 사이트 이름(site_name), args (추출 함수의 나머지 인자)
+    output: 기사 상세 정보 딕셔너리 또는 None (dict | None)
+    """
+    found = scan_structured_data(html_content)
+    if text_filter is not None and found.get("article_text"):
+        filtered = text_filter(found["article_text"]).strip()
+        if len(filtered) >= MIN_STRUCTURED_BODY_CHARS:
+            found["article_text"] = filtered
+        else:
+            del found["article_text"]
+    if all(found.get(field) for field in STRUCTURED_FIELDS):
+        return merge_structured_data(None, found, article_url, original_title, category, site_name)
+    article = parse_fn(html_content, article_url, original_title, category, site_name, *args)
+    return merge_structured_data(article, found, article_url, original_title, category, site_name)
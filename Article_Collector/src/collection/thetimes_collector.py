@@ -1,12 +1,185 @@
 import asyncio
 import aiohttp
-from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
 import re
 import json # JSON 파싱을 위해 추가
-import random
 
 from .base_collector import BaseCollector
+from .html_parser import make_soup, DEFAULT_PARSER
+
+# 추출 함수가 페이지마다 쓰는 정규식은 모듈 로드 시 한 번만 컴파일한다.
+_ARTICLE_CARD_CLASS_RE = re.compile(r"css-dwp5gw|css-167tk2u|css-13fsqun|composed-article-card-.*css-dwp5gw|css-crn8pc|css-1d2smxu|css-15403k6|css-j6p0ps")
+# 제목 및 링크를 포함하는 a 태그 클래스 패턴 (article-headline 또는 css-xxxxxx 형태)
+_HEADLINE_LINK_CLASS_RE = re.compile(r"^(article-headline|css-)")
+_ARTICLE_PATH_RE = re.compile(r'/article/|/news/|/comment/|/sport/|/business/|/money/|/life/|/style/|/culture/', re.I)
+_EXCLUDED_PATH_RE = re.compile(r'(/section/|/topic/|/author/|/puzzles/|/search|/subscribe|/login|/video|/live)', re.I)
+
+
+def parse_thetimes_article_links(html_content: str, category_url: str, base_url: str, site_name: str, parser: str = DEFAULT_PARSER) -> list[dict]:
+    """
+    기능: The Times 카테고리 페이지 HTML에서 기사 제목과 URL을 추출한다. 파싱 프로세스 풀에서 실행된다.
+    input: 카테고리 페이지 HTML(html_content), 카테고리 URL(category_url), 사이트 기본 URL(base_url), 사이트 이름(site_name), 파서 백엔드(parser)
+    output: {'title': str, 'url': str} 딕셔너리의 리스트 (list[dict])
+    """
+    article_links = []
+    soup = make_soup(html_content, parser)
+    links_found = set()
+
+    # 사용자가 제공한 다양한 목록 컨테이너 선택자들
+    # data-testid 속성을 우선적으로 활용
+    list_container_selectors = [
+        {"tag": "div", "attrs": {"data-testid": "slice/ad/list-slice container"}},
+        {"tag": "section", "attrs": {"class": "css-2wymkw"}}, # World 섹션 상단
+        {"tag": "div", "attrs": {"class": "css-1luqq5m"}},
+        {"tag": "div", "attrs": {"class": "article-container css-kwby65", "data-testid": "article-container"}},
+        {"tag": "div", "attrs": {"class": "css-1fglklz"}}, # US 섹션 등
+        {"tag": "div", "attrs": {"class": "css-1ovapnw"}}  # US 섹션 4열
+    ]
+
+    # 사용자가 제공한 다양한 개별 기사 항목 선택자들
+    article_item_selectors = [
+        {"tag": "div", "attrs": {"data-testid": "lead-article"}},
+        {"tag": "div", "attrs": {"data-testid": "vertical-article"}},
+        {"tag": "div", "attrs": {"data-testid": "horizontal-article"}},
+        {"tag": "div", "attrs": {"class": _ARTICLE_CARD_CLASS_RE}},
+         # css-dwp5gw가 매우 흔하게 사용됨. 다른 구체적인 클래스명도 포함.
+    ]
+
+    processed_containers = set()
+
+    for container_selector_info in list_container_selectors:
+        tag_name = container_selector_info["tag"]
+        attrs = container_selector_info["attrs"]
+        # print(f"DEBUG: Trying container selector: <{tag_name} {attrs}>")
+
+        # 한 페이지에 동일한 구조의 컨테이너가 여러개 나올 수 있음 (예: 광고 후 새 목록)
+        # find_all로 모든 해당 컨테이너를 찾아서 순회
+        containers = soup.find_all(tag_name, attrs=attrs)
+        if not containers and tag_name == "div" and "data-testid" in attrs and attrs["data-testid"] == "slice/ad/list-slice container":
+             # css-13y27az 와 같은 래퍼 div를 못찾는 경우, 그 하위의 css-18xk854 (IN DEPTH 목록)를 직접 시도
+            containers = soup.find_all("div", attrs={"data-testid":"article-container", "class":"css-18xk854"})
+
+
+        for container in containers:
+            # 컨테이너 식별자를 만들어 중복 처리 방지 (너무 복잡하면 간단히 hash(str(container)) 사용)
+            container_id = str(container.attrs) 
+            if container_id in processed_containers:
+                continue
+            processed_containers.add(container_id)
+            # print(f"DEBUG: Processing container: {container_id}")
+
+            for item_selector_info in article_item_selectors:
+                item_tag_name = item_selector_info["tag"]
+                item_attrs = item_selector_info["attrs"]
+
+                potential_articles_in_item_selector = container.find_all(item_tag_name, attrs=item_attrs)
+                # print(f"DEBUG:   Found {len(potential_articles_in_item_selector)} items with <{item_tag_name} {item_attrs}> in container {container_id}")
+
+                for item in potential_articles_in_item_selector:
+                    # 링크 태그: data-testid 우선, 그 다음엔 다양한 class를 가진 a 태그
+                    link_tag = item.find('a', href=True, class_=_HEADLINE_LINK_CLASS_RE)
+
+                    if not link_tag: # 가끔 a 태그가 더 깊이 있을 수 있음 (예: div > div > a)
+                        link_tag = item.find('a', href=True, recursive=True, class_=_HEADLINE_LINK_CLASS_RE)
+
+                    title_text = None
+                    if link_tag:
+                        # 제목: a 태그 내부의 span 또는 a 태그 자체 텍스트
+                        span_in_a = link_tag.find('span')
+                        if span_in_a and span_in_a.text.strip():
+                            title_text = span_in_a.text.strip()
+                        else:
+                            title_text = link_tag.text.strip()
+
+                    if link_tag and title_text and len(title_text) > 5: # 제목이 너무 짧으면 제외
+                        href = link_tag.get('href')
+                        if href.startswith('/'): # 상대 경로 확인
+                            full_url = urljoin(base_url, href)
+
+                            parsed_full_url = urlparse(full_url)
+                            if parsed_full_url.netloc == urlparse(base_url).netloc and full_url not in links_found and \
+                               not full_url.endswith(category_url) and \
+                               _ARTICLE_PATH_RE.search(parsed_full_url.path) and \
+                               not _EXCLUDED_PATH_RE.search(parsed_full_url.path):
+                                article_links.append({'title': title_text, 'url': full_url})
+                                links_found.add(full_url)
+
+    # 만약 위에서 못 찾았다면, 더 일반적인 탐색 시도 (이전 로직 일부 활용)
+    if not article_links:
+        print(f"[{site_name.upper()}] Specific selectors found 0 links. Trying generic fallback on {category_url}")
+        generic_items = soup.find_all('a', href=True, class_=_HEADLINE_LINK_CLASS_RE)
+        for link_tag in generic_items:
+            title_text = None
+            span_in_a = link_tag.find('span')
+            if span_in_a and span_in_a.text.strip():
+                title_text = span_in_a.text.strip()
+            else:
+                title_text = link_tag.text.strip()
+
+            if title_text and len(title_text) > 5:
+                href = link_tag.get('href')
+                if href.startswith('/'):
+                    full_url = urljoin(base_url, href)
+                    parsed_full_url = urlparse(full_url)
+                    if parsed_full_url.netloc == urlparse(base_url).netloc and full_url not in links_found and \
+                       not full_url.endswith(category_url) and \
+                       _ARTICLE_PATH_RE.search(parsed_full_url.path) and \
+                       not _EXCLUDED_PATH_RE.search(parsed_full_url.path):
+                        article_links.append({'title': title_text, 'url': full_url})
+                        links_found.add(full_url)
+    return article_links
+
+
+def parse_thetimes_article(html_content: bytes, article_url: str, original_title: str, category: str, site_name: str, parser: str = DEFAULT_PARSER) -> dict | None:
+    """
+    기능: The Times 기사 페이지 HTML에서 제목, 대표 이미지, 본문을 추출한다. 파싱 프로세스 풀에서 실행된다.
+    input: 기사 페이지 HTML(html_content), 기사 URL(article_url), 원본 제목(original_title), 카테고리(category), 사이트 이름(site_name), 파서 백엔드(parser)
+    output: 기사 상세 정보 딕셔너리 또는 본문이 없으면 None (dict | None)
+    """
+    soup = make_soup(html_content, parser)
+
+    # 새로운 간단한 추출 로직
+    # 1. 제목 추출
+    title_tag = soup.find('h1')
+    article_title = title_tag.get_text(strip=True) if title_tag else original_title
+
+    # 2. 이미지 추출 (og:image 우선, 없으면 본문 첫 이미지)
+    main_image_url = None
+    og_image_tag = soup.find('meta', property='og:image')
+    if og_image_tag and og_image_tag.get('content'):
+        main_image_url = og_image_tag['content']
+
+    # 3. 본문 추출
+    article_text_parts = []
+    # The Times는 기사 본문을 담는 div나 article 태그가 유동적일 수 있음
+    article_body = soup.select_one('div.sc-3c4f9a2-0, article[role="article"]')
+    if article_body:
+        paragraphs = article_body.find_all('p')
+        for p in paragraphs:
+            article_text_parts.append(p.get_text(strip=True))
+
+    # 이미지를 찾지 못했고, 본문이 있다면 본문 첫 이미지라도 시도
+    if not main_image_url and article_body:
+        first_img_tag = article_body.find('img')
+        if first_img_tag and first_img_tag.get('src'):
+            main_image_url = first_img_tag.get('src')
+
+
+    article_text = "\n".join(article_text_parts)
+
+    if not article_text.strip():
+        print(f"[{site_name.upper()}/{category.upper()}] No text found in article: {article_url} after all attempts.")
+        return None
+
+    return {
+        "url": article_url,
+        "title": article_title,
+        "main_image_url": main_image_url,
+        "article_text": article_text.strip(),
+        "source": site_name,
+        "category": category
+    }
+
 
 class TheTimesCollector(BaseCollector):
     def __init__(self):
@@ -17,13 +190,9 @@ class TheTimesCollector(BaseCollector):
         }
 
     async def fetch_article_links(self, session: aiohttp.ClientSession, category_url: str) -> list[dict]:
-        await asyncio.sleep(1)
         print(f"[{self.site_name.upper()}] Fetching article links from: {category_url}")
-        article_links = []
         try:
-            async with session.get(category_url, headers=self.headers, timeout=30) as response:
-                response.raise_for_status()
-                html_content = await response.text()
+            html_content = await self.fetch_text(session, category_url, timeout=30, use_cache=True)
         except asyncio.TimeoutError:
             print(f"[{self.site_name.upper()}] Timeout error fetching page: {category_url}")
             return []
@@ -34,117 +203,7 @@ class TheTimesCollector(BaseCollector):
             print(f"[{self.site_name.upper()}] Unknown error fetching HTML ({category_url}): {e}")
             return []
 
-        soup = BeautifulSoup(html_content, 'html.parser')
-        links_found = set()
-
-        # 사용자가 제공한 다양한 목록 컨테이너 선택자들
-        # data-testid 속성을 우선적으로 활용
-        list_container_selectors = [
-            {"tag": "div", "attrs": {"data-testid": "slice/ad/list-slice container"}},
-            {"tag": "section", "attrs": {"class": "css-2wymkw"}}, # World 섹션 상단
-            {"tag": "div", "attrs": {"class": "css-1luqq5m"}},
-            {"tag": "div", "attrs": {"class": "article-container css-kwby65", "data-testid": "article-container"}},
-            {"tag": "div", "attrs": {"class": "css-1fglklz"}}, # US 섹션 등
-            {"tag": "div", "attrs": {"class": "css-1ovapnw"}}  # US 섹션 4열
-        ]
-
-        # 사용자가 제공한 다양한 개별 기사 항목 선택자들
-        article_item_selectors = [
-            {"tag": "div", "attrs": {"data-testid": "lead-article"}},
-            {"tag": "div", "attrs": {"data-testid": "vertical-article"}},
-            {"tag": "div", "attrs": {"data-testid": "horizontal-article"}},
-            {"tag": "div", "attrs": {"class": re.compile(r"css-dwp5gw|css-167tk2u|css-13fsqun|composed-article-card-.*css-dwp5gw|css-crn8pc|css-1d2smxu|css-15403k6|css-j6p0ps")}},
-             # css-dwp5gw가 매우 흔하게 사용됨. 다른 구체적인 클래스명도 포함.
-        ]
-        
-        # 제목 및 링크를 포함하는 a 태그 클래스 패턴
-        # article-headline 또는 css-xxxxxx 형태
-        title_link_a_tag_class_pattern = re.compile(r"^(article-headline|css-)")
-
-
-        processed_containers = set()
-
-        for container_selector_info in list_container_selectors:
-            tag_name = container_selector_info["tag"]
-            attrs = container_selector_info["attrs"]
-            # print(f"DEBUG: Trying container selector: <{tag_name} {attrs}>")
-            
-            # 한 페이지에 동일한 구조의 컨테이너가 여러개 나올 수 있음 (예: 광고 후 새 목록)
-            # find_all로 모든 해당 컨테이너를 찾아서 순회
-            containers = soup.find_all(tag_name, attrs=attrs)
-            if not containers and tag_name == "div" and "data-testid" in attrs and attrs["data-testid"] == "slice/ad/list-slice container":
-                 # css-13y27az 와 같은 래퍼 div를 못찾는 경우, 그 하위의 css-18xk854 (IN DEPTH 목록)를 직접 시도
-                containers = soup.find_all("div", attrs={"data-testid":"article-container", "class":"css-18xk854"})
-
-
-            for container in containers:
-                # 컨테이너 식별자를 만들어 중복 처리 방지 (너무 복잡하면 간단히 hash(str(container)) 사용)
-                container_id = str(container.attrs) 
-                if container_id in processed_containers:
-                    continue
-                processed_containers.add(container_id)
-                # print(f"DEBUG: Processing container: {container_id}")
-
-                for item_selector_info in article_item_selectors:
-                    item_tag_name = item_selector_info["tag"]
-                    item_attrs = item_selector_info["attrs"]
-                    
-                    potential_articles_in_item_selector = container.find_all(item_tag_name, attrs=item_attrs)
-                    # print(f"DEBUG:   Found {len(potential_articles_in_item_selector)} items with <{item_tag_name} {item_attrs}> in container {container_id}")
-
-                    for item in potential_articles_in_item_selector:
-                        # 링크 태그: data-testid 우선, 그 다음엔 다양한 class를 가진 a 태그
-                        link_tag = item.find('a', href=True, class_=title_link_a_tag_class_pattern)
-                        
-                        if not link_tag: # 가끔 a 태그가 더 깊이 있을 수 있음 (예: div > div > a)
-                            link_tag = item.find('a', href=True, recursive=True, class_=title_link_a_tag_class_pattern)
-
-                        title_text = None
-                        if link_tag:
-                            # 제목: a 태그 내부의 span 또는 a 태그 자체 텍스트
-                            span_in_a = link_tag.find('span')
-                            if span_in_a and span_in_a.text.strip():
-                                title_text = span_in_a.text.strip()
-                            else:
-                                title_text = link_tag.text.strip()
-                        
-                        if link_tag and title_text and len(title_text) > 5: # 제목이 너무 짧으면 제외
-                            href = link_tag.get('href')
-                            if href.startswith('/'): # 상대 경로 확인
-                                full_url = urljoin(self.base_url, href)
-                                
-                                parsed_full_url = urlparse(full_url)
-                                if parsed_full_url.netloc == urlparse(self.base_url).netloc and full_url not in links_found and \
-                                   not full_url.endswith(category_url) and \
-                                   re.search(r'/article/|/news/|/comment/|/sport/|/business/|/money/|/life/|/style/|/culture/', parsed_full_url.path, re.I) and \
-                                   not re.search(r'(/section/|/topic/|/author/|/puzzles/|/search|/subscribe|/login|/video|/live)', parsed_full_url.path, re.I):
-                                    article_links.append({'title': title_text, 'url': full_url})
-                                    links_found.add(full_url)
-        
-        # 만약 위에서 못 찾았다면, 더 일반적인 탐색 시도 (이전 로직 일부 활용)
-        if not article_links:
-            print(f"[{self.site_name.upper()}] Specific selectors found 0 links. Trying generic fallback on {category_url}")
-            generic_items = soup.find_all('a', href=True, class_=title_link_a_tag_class_pattern)
-            for link_tag in generic_items:
-                title_text = None
-                span_in_a = link_tag.find('span')
-                if span_in_a and span_in_a.text.strip():
-                    title_text = span_in_a.text.strip()
-                else:
-                    title_text = link_tag.text.strip()
-
-                if title_text and len(title_text) > 5:
-                    href = link_tag.get('href')
-                    if href.startswith('/'):
-                        full_url = urljoin(self.base_url, href)
-                        parsed_full_url = urlparse(full_url)
-                        if parsed_full_url.netloc == urlparse(self.base_url).netloc and full_url not in links_found and \
-                           not full_url.endswith(category_url) and \
-                           re.search(r'/article/|/news/|/comment/|/sport/|/business/|/money/|/life/|/style/|/culture/', parsed_full_url.path, re.I) and \
-                           not re.search(r'(/section/|/topic/|/author/|/puzzles/|/search|/subscribe|/login|/video|/live)', parsed_full_url.path, re.I):
-                            article_links.append({'title': title_text, 'url': full_url})
-                            links_found.add(full_url)
-
+        article_links = await self.parse(parse_thetimes_article_links, html_content, category_url, self.base_url, self.site_name, self.html_parser)
 
         if not article_links:
             print(f"[{self.site_name.upper()}] No article links found on {category_url}. Check selectors or page structure (or paywall).")
@@ -176,59 +235,14 @@ class TheTimesCollector(BaseCollector):
         return parts
 
     async def fetch_article_content(self, session: aiohttp.ClientSession, article_url: str, original_title: str, category: str) -> dict | None:
-        await asyncio.sleep(random.uniform(1, 3))
         print(f"[{self.site_name.upper()}/{category.upper()}] 기사 내용 가져오기 시작: {original_title} ({article_url})")
         try:
-            async with session.get(article_url, headers=self.headers, timeout=30) as response:
-                response.raise_for_status()
-                html_content = await response.text()
+            html_content = await self.fetch_bytes(session, article_url, timeout=30)
         except Exception as e:
             print(f"[{self.site_name.upper()}/{category.upper()}] HTML 가져오는 중 알 수 없는 오류 ({article_url}): {e}")
             return None
 
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        # 새로운 간단한 추출 로직
-        # 1. 제목 추출
-        title_tag = soup.find('h1')
-        article_title = title_tag.get_text(strip=True) if title_tag else original_title
-
-        # 2. 이미지 추출 (og:image 우선, 없으면 본문 첫 이미지)
-        main_image_url = None
-        og_image_tag = soup.find('meta', property='og:image')
-        if og_image_tag and og_image_tag.get('content'):
-            main_image_url = og_image_tag['content']
-
-        # 3. 본문 추출
-        article_text_parts = []
-        # The Times는 기사 본문을 담는 div나 article 태그가 유동적일 수 있음
-        article_body = soup.select_one('div.sc-3c4f9a2-0, article[role="article"]')
-        if article_body:
-            paragraphs = article_body.find_all('p')
-            for p in paragraphs:
-                article_text_parts.append(p.get_text(strip=True))
-        
-        # 이미지를 찾지 못했고, 본문이 있다면 본문 첫 이미지라도 시도
-        if not main_image_url and article_body:
-            first_img_tag = article_body.find('img')
-            if first_img_tag and first_img_tag.get('src'):
-                main_image_url = first_img_tag.get('src')
-
-
-        article_text = "\n".join(article_text_parts)
-
-        if not article_text.strip():
-            print(f"[{self.site_name.upper()}/{category.upper()}] No text found in article: {article_url} after all attempts.")
-            return None
-            
-        return {
-            "url": article_url,
-            "title": article_title,
-            "main_image_url": main_image_url,
-            "article_text": article_text.strip(),
-            "source": self.site_name,
-            "category": category
-        }
+        return await self.parse_article(parse_thetimes_article, html_content, article_url, original_title, category, self.html_parser)
 
 # 테스트용 코드 (선택자 구현 후 주석 해제)
 # async def main_test():
@@ -0,0 +1,218 @@
+import os
+import time
+import sqlite3
+import threading
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_FRONTIER_PATH = os.getenv(
+    "URL_FRONTIER_PATH", os.path.join(PROJECT_ROOT, 'Data', 'cache', 'url_frontier.sqlite3')
+)
+# 수집한 URL을 다시 가져오지 않는 기간. 지나면 다시 수집 대상이 된다.
+DEFAULT_TTL_SECONDS = int(os.getenv("URL_FRONTIER_TTL_DAYS", 7)) * 24 * 60 * 60
+
+# 같은 기사를 가리키지만 URL만 달라지는 추적용 쿼리 파라미터
+TRACKING_PARAMS = {'fbclid', 'gclid', 'ref', 'ref_src', 'utm_source', 'utm_medium',
+                   'utm_campaign', 'utm_term', 'utm_content', 'cmpid', 'ocid'}
+SQLITE_MAX_VARIABLES = 900
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    기능: 같은 기사를 가리키는 URL이 같은 문자열이 되도록 정규화한다.
+          스킴/호스트 소문자화, www. 및 기본 포트 제거, 프래그먼트와 추적 파라미터 제거, 쿼리 정렬, 끝 슬래시 제거.
+    input: url (원본 URL)
+    output: 정규화된 URL 문자열
+    """
+    parts = urlsplit((url or '').strip())
+    scheme = (parts.scheme or 'https').lower()
+    host = (parts.hostname or '').lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith('utm_')
+    ))
+    path = parts.path.rstrip('/') or '/'
+    # http/https 차이는 같은 기사로 본다.
+    return urlunsplit(('https' if scheme in ('http', 'https') else scheme, host, path, query, ''))
+
+
+class UrlFrontier:
+    """
+    이미 수집한 기사 URL(정규화된 URL)을 기록하는 SQLite 저장소.
+    수집기가 본문을 가져오기 전에(discover_new_links) 확인하여, 재실행 시 새 기사만 수집하게 한다.
+    피드 탐색 모드에서 피드별로 마지막으로 본 발행 시각(워터마크)도 함께 기록한다.
+    워터마크는 피드에서 찾은 기사가 저장(mark_seen)된 뒤 commit_feed_watermarks로 올리므로, 본문 수집에 실패한 기사는 다음 실행에서 다시 찾는다.
+    """
+    def __init__(self, path: str = DEFAULT_FRONTIER_PATH, ttl_seconds: int = DEFAULT_TTL_SECONDS):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        # 이번 실행에서 피드별로 찾은 기사 {피드 URL: {정규화된 URL: 발행 시각}}. commit_feed_watermarks에서 비운다.
+        self._feed_entries: dict[str, dict[str, float]] = {}
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS seen_url (
+                url TEXT PRIMARY KEY,
+                seen_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_seen_url_seen_at ON seen_url(seen_at)")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS feed_watermark (
+                feed_url TEXT PRIMARY KEY,
+                latest_published REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+        self.purge_expired()
+
+    def purge_expired(self) -> int:
+        """TTL이 지난 URL을 삭제하고 삭제한 개수를 반환한다."""
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM seen_url WHERE seen_at < ?", (time.time() - self.ttl_seconds,))
+            self._conn.commit()
+        return cursor.rowcount
+
+    def filter_new(self, article_infos: list[dict]) -> list[dict]:
+        """
+        기능: 기사 링크 목록에서 TTL 안에 이미 수집한 URL을 제외한다.
+        input: article_infos ({'title': str, 'url': str} 딕셔너리 리스트)
+        output: 아직 수집하지 않은 항목만 남긴 리스트
+        """
+        canonical = [canonicalize_url(info['url']) for info in article_infos]
+        seen = self._seen(canonical)
+        return [info for info, url in zip(article_infos, canonical) if url not in seen]
+
+    def _seen(self, canonical_urls: list[str]) -> set[str]:
+        # 정규화된 URL 중 TTL 안에 기록된 URL의 집합
+        cutoff = time.time() - self.ttl_seconds
+        seen = set()
+        with self._lock:
+            for start in range(0, len(canonical_urls), SQLITE_MAX_VARIABLES):
+                chunk = canonical_urls[start:start + SQLITE_MAX_VARIABLES]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT url FROM seen_url WHERE seen_at >= ? AND url IN ({placeholders})", (cutoff, *chunk)
+                ).fetchall()
+                seen.update(row[0] for row in rows)
+        return seen
+
+    def mark_seen(self, urls: list[str], refresh: bool = True) -> int:
+        """
+        기능: URL들을 수집 완료로 기록한다.
+        input: urls (URL 리스트), refresh (True면 이미 있는 URL의 기록 시각을 지금으로 갱신, False면 없는 URL만 추가)
+        output: 새로 추가하거나 갱신한 URL 수
+        """
+        now = time.time()
+        rows = [(canonicalize_url(url), now) for url in urls if url]
+        if not rows:
+            return 0
+        verb = "INSERT OR REPLACE" if refresh else "INSERT OR IGNORE"
+        with self._lock:
+            cursor = self._conn.executemany(f"{verb} INTO seen_url (url, seen_at) VALUES (?, ?)", rows)
+            self._conn.commit()
+        return cursor.rowcount
+
+    def get_feed_watermark(self, feed_url: str) -> float | None:
+        """피드에서 지난 실행까지 본 가장 최신 항목의 발행 시각을 반환한다. 처음 보는 피드면 None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT latest_published FROM feed_watermark WHERE feed_url = ?", (feed_url,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set_feed_watermark(self, feed_url: str, latest_published: float):
+        """
+        기능: 피드의 최신 항목 발행 시각을 기록한다. 기존 값보다 과거 시각이면 바꾸지 않는다.
+        input: feed_url (피드 URL), latest_published (UNIX 시각)
+        output: 없음
+        """
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO feed_watermark (feed_url, latest_published) VALUES (?, ?)
+                ON CONFLICT(feed_url) DO UPDATE SET latest_published = MAX(latest_published, excluded.latest_published)
+                """,
+                (feed_url, latest_published)
+            )
+            self._conn.commit()
+
+    def record_feed_entries(self, feed_url: str, entries: list[dict]):
+        """
+        기능: 피드에서 찾은 기사들을 워터마크 후보로 기억한다. 워터마크는 commit_feed_watermarks에서 올린다.
+        input: feed_url (피드 URL), entries (FeedParser가 찾은 {'url', 'published', ...} 딕셔너리 리스트. 발행 시각이 없는 항목은 무시)
+        output: 없음
+        """
+        with self._lock:
+            pending = self._feed_entries.setdefault(feed_url, {})
+            for entry in entries:
+                if entry.get('published') is not None:
+                    url = canonicalize_url(entry['url'])
+                    pending[url] = max(pending.get(url, entry['published']), entry['published'])
+
+    def commit_feed_watermarks(self):
+        """
+        기능: 이번 실행에서 찾은 피드 기사들로 피드별 워터마크를 올린다. 수집 파이프라인이 끝난 뒤 호출한다.
+              찾은 기사가 모두 기록(mark_seen)됐으면 가장 최신 발행 시각으로, 기록되지 않은 기사(본문 수집/저장 실패)가 있으면
+              그중 가장 오래된 기사의 발행 시각으로 올려, 다음 실행이 그 기사부터 다시 찾게 한다.
+        input: 없음
+        output: 없음
+        """
+        with self._lock:
+            feed_entries, self._feed_entries = self._feed_entries, {}
+        for feed_url, pending in feed_entries.items():
+            if not pending:
+                continue
+            seen = self._seen(list(pending))
+            failed = [published for url, published in pending.items() if url not in seen]
+            if failed:
+                print(f"[UrlFrontier] 피드 {feed_url}: 저장되지 않은 기사 {len(failed)}개가 있어 워터마크를 그 발행 시각까지만 올립니다.")
+            self.set_feed_watermark(feed_url, min(failed) if failed else max(pending.values()))
+
+    def seed_from_db(self) -> int:
+        """
+        기능: article_source 테이블의 URL로 저장소를 채운다. DB 설정이 없거나 연결에 실패하면 건너뛴다.
+        input: 없음
+        output: 새로 기록한 URL 수
+        """
+        try:
+            from DB.database import get_db
+            from DB import crud
+            with get_db() as db:
+                urls = crud.get_all_source_urls(db)
+        except Exception as e:
+            print(f"[UrlFrontier] DB에서 수집 URL을 불러오지 못했습니다. 로컬 기록만 사용합니다: {e}")
+            return 0
+        # 이미 기록된 URL의 시각은 그대로 둔다. 매 실행 갱신하면 DB에서 온 URL이 만료(URL_FRONTIER_TTL_DAYS)되지 않는다.
+        added = self.mark_seen(urls, refresh=False)
+        print(f"[UrlFrontier] article_source의 {len(urls)}개 URL 중 {added}개를 새로 기록했습니다.")
+        return added
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+# 전역 URL 프런티어 인스턴스
+_url_frontier = None
+
+def get_url_frontier() -> UrlFrontier:
+    """
+    기능: 프로세스 전체에서 공유하는 UrlFrontier 싱글턴을 반환한다.
+    input: 없음
+    output: UrlFrontier 인스턴스
+    """
+    global _url_frontier
+    if _url_frontier is None:
+        _url_frontier = UrlFrontier()
+    return _url_frontier
@@ -3,6 +3,8 @@ from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.cluster import DBSCAN
 from typing import List, Dict, Any, Tuple
 
+from src.processing.translation_batcher import detect_language
+
 # 한국어 처리를 위한 Okt 토크나이zer 시도
 try:
     from konlpy.tag import Okt
@@ -14,6 +16,10 @@ except Exception as e:
     print("      'pip install konlpy'와 Java(JDK) 설치 및 JAVA_HOME 환경변수 설정이 필요할 수 있습니다.")
     print("      한국어 군집화 시 기본 토크나이저로 계속 진행합니다.")
 
+def article_text(article: Dict[str, Any]) -> str:
+    """군집화에 쓸 기사 본문을 반환합니다. 본문이 None이거나 비어 있으면 제목을, 둘 다 없으면 빈 문자열을 반환합니다."""
+    return article.get('body') or article.get('title') or ''
+
 def korean_tokenizer(text: str) -> List[str]:
     """
     기능: Konlpy Okt 형태소 분석기를 사용하여 입력된 한국어 텍스트에서 명사만 추출하여 리스트로 반환합니다. Okt가 없으면 공백 기준으로 단어를 분리합니다.
@@ -24,6 +30,15 @@ def korean_tokenizer(text: str) -> List[str]:
         return text.split()
     return okt.nouns(text)
 
+def warm_up_tokenizer():
+    """
+    기능: Okt의 첫 호출에서 일어나는 사전/클래스 로드(수 초)를 미리 실행합니다. 모델 레지스트리의 'tokenizer' 로더로 쓰입니다.
+    input: 없음
+    output: Okt 인스턴스 (없으면 None)
+    """
+    korean_tokenizer("기사 그룹화를 위한 형태소 분석기를 미리 불러옵니다.")
+    return okt
+
 class ArticleGrouper:
     def __init__(self, eps=0.5, min_samples=2):
         """
@@ -36,18 +51,34 @@ class ArticleGrouper:
 
     def group(self, articles: List[Dict[str, Any]]) -> Tuple[List[List[Dict[str, Any]]], List[Dict[str, Any]]]:
         """
-        기능: TF-IDF와 DBSCAN 알고리즘을 사용하여 기사 리스트를 내용이 유사한 그룹과 그렇지 않은 단일 기사(노이즈)로 분류
-        input: articles (처리할 기사 딕셔너리의 리스트)
+        기능: 기사를 언어별로 나눈 뒤, 언어마다 TF-IDF와 DBSCAN 알고리즘을 사용하여 내용이 유사한 그룹과 그렇지 않은 단일 기사(노이즈)로 분류
+              (번역하지 않은 영어 기사와 한국어 기사는 TF-IDF 어휘가 겹치지 않으므로 따로 군집화한다.)
+        input: articles (처리할 기사 딕셔너리의 리스트. 'language'가 없으면 수집 파이프라인과 같은 detect_language로 판단)
         output: (groups, noise) 튜플. groups는 유사 기사 묶음(리스트의 리스트)이고, noise는 그룹에 속하지 않는 단일 기사들의 리스트
         """
+        by_language: Dict[str, List[Dict[str, Any]]] = {}
+        for article in articles:
+            language = article.get('language') or detect_language(article_text(article))
+            by_language.setdefault(language, []).append(article)
+
+        groups, noise = [], []
+        for language, language_articles in by_language.items():
+            if len(by_language) > 1:
+                print(f"[{language}] 기사 {len(language_articles)}개 군집화")
+            language_groups, language_noise = self._group_same_language(language_articles, language)
+            groups.extend(language_groups)
+            noise.extend(language_noise)
+        return groups, noise
+
+    def _group_same_language(self, articles: List[Dict[str, Any]], language: str) -> Tuple[List[List[Dict[str, Any]]], List[Dict[str, Any]]]:
         if len(articles) < 2:
             print("기사가 2개 미만이라 그룹핑을 건너뛰고 모든 기사를 노이즈로 처리합니다.")
             return [], articles
 
-        bodies = [article.get('body', article.get('title', '')) for article in articles]
+        bodies = [article_text(article) for article in articles]
 
-        # 언어 감지 (첫 번째 기사 기준)
-        is_korean = any('\uac00' <= char <= '\ud7a3' for char in bodies[0])
+        # group()에서 나눈 언어 기준 ('ko'가 아니면 영어 토크나이저)
+        is_korean = language == 'ko'
         print(f"언어 감지 결과: 한국어={is_korean}")
 
         if is_korean and okt:
@@ -0,0 +1,117 @@
+import os
+import time
+
+from src.processing.translation_memory import SOURCE_LANG, TARGET_LANG
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# int8로 변환할 원본(transformers) 모델. 토크나이저도 여기서 불러온다.
+TRANSLATOR_MODEL_ID = os.getenv("TRANSLATOR_MODEL_ID", "facebook/nllb-200-distilled-600M")
+# 변환된 CTranslate2 모델 폴더. 없으면 처음 로드할 때 TRANSLATOR_MODEL_ID를 변환해 여기에 저장한다.
+CT2_MODEL_DIR = os.getenv("TRANSLATOR_CT2_MODEL_DIR", os.path.join(PROJECT_ROOT, 'Data', 'models', 'nllb-ct2-int8'))
+# int8 (CPU), int8_float16 (GPU) 등 CTranslate2 compute_type
+CT2_COMPUTE_TYPE = os.getenv("TRANSLATOR_CT2_COMPUTE_TYPE", "int8")
+# 한 번의 translate_batch를 나눠 계산하는 스레드 수 (intra-op). 기본값은 CPU 코어 수
+CT2_INTRA_THREADS = int(os.getenv("TRANSLATOR_INTRA_THREADS", os.cpu_count() or 4))
+CT2_BEAM_SIZE = int(os.getenv("TRANSLATOR_BEAM_SIZE", 4))
+CT2_MAX_DECODING_LENGTH = int(os.getenv("TRANSLATOR_MAX_LENGTH", 512))
+
+
+def convert_model(model_id: str = TRANSLATOR_MODEL_ID, output_dir: str = CT2_MODEL_DIR, quantization: str = "int8") -> str:
+    """
+    기능: transformers NLLB 모델을 CTranslate2 형식(int8 가중치)으로 변환해 저장한다.
+          명령줄의 `ct2-transformers-converter --model <id> --quantization int8 --output_dir <dir>`과 같다.
+    input: model_id (Hugging Face 모델 ID 또는 경로), output_dir (저장 폴더), quantization (가중치 양자화 형식)
+    output: output_dir
+    """
+    from ctranslate2.converters import TransformersConverter
+
+    print(f"[Ct2Translator] {model_id} 모델을 CTranslate2({quantization})로 변환합니다: {output_dir}")
+    started = time.perf_counter()
+    os.makedirs(os.path.dirname(output_dir), exist_ok=True)
+    TransformersConverter(model_id).convert(output_dir, quantization=quantization)
+    print(f"[Ct2Translator] 변환 완료 ({time.perf_counter() - started:.1f}초)")
+    return output_dir
+
+
+class Ct2NllbTranslator:
+    """
+    int8로 양자화한 NLLB 모델을 CTranslate2로 CPU에서 실행하는 번역기.
+    NllbTranslator와 같은 translate()/get_model_info() 인터페이스를 가지며, TranslationBatcher가 쓰는 translate_batch()도 제공한다.
+    translator_loader.get_translator()에서 TRANSLATOR_BACKEND=ct2로 선택한다.
+    """
+    def __init__(self, model_dir: str = CT2_MODEL_DIR, model_id: str = TRANSLATOR_MODEL_ID,
+                 source_lang: str = SOURCE_LANG, target_lang: str = TARGET_LANG,
+                 compute_type: str = CT2_COMPUTE_TYPE, intra_threads: int = CT2_INTRA_THREADS,
+                 beam_size: int = CT2_BEAM_SIZE, max_decoding_length: int = CT2_MAX_DECODING_LENGTH):
+        try:
+            import ctranslate2
+            from transformers import AutoTokenizer
+        except ImportError as e:
+            raise ImportError("TRANSLATOR_BACKEND=ct2 를 쓰려면 ctranslate2 패키지가 필요합니다. (pip install ctranslate2)") from e
+
+        if not os.path.exists(os.path.join(model_dir, 'model.bin')):
+            convert_model(model_id, model_dir)
+
+        self.model_dir = model_dir
+        self.model_id = model_id
+        self.source_lang = source_lang
+        self.target_lang = target_lang
+        self.compute_type = compute_type
+        self.intra_threads = max(1, intra_threads)
+        self.beam_size = beam_size
+        self.max_decoding_length = max_decoding_length
+
+        started = time.perf_counter()
+        self.tokenizer = AutoTokenizer.from_pretrained(model_id, src_lang=source_lang)
+        # 번역 호출은 번역 스레드 하나에서만 하므로 inter_threads는 1, 행렬 연산은 intra_threads개 스레드로 나눈다.
+        self.model = ctranslate2.Translator(
+            model_dir, device="cpu", compute_type=compute_type, inter_threads=1, intra_threads=self.intra_threads
+        )
+        print(f"[Ct2Translator] 모델 로드 완료 ({compute_type}, 스레드 {self.intra_threads}개, {time.perf_counter() - started:.1f}초)")
+
+    def translate_batch(self, texts: list[str]) -> list[str]:
+        """
+        기능: 문장들을 한 번의 CTranslate2 호출로 번역한다. 빈 문장은 그대로 돌려준다.
+        input: texts (번역할 문장 리스트)
+        output: 같은 순서의 번역 리스트
+        """
+        indices = [index for index, text in enumerate(texts) if text and text.strip()]
+        outputs = list(texts)
+        if not indices:
+            return outputs
+
+        source_tokens = [
+            self.tokenizer.convert_ids_to_tokens(self.tokenizer.encode(texts[index], truncation=True, max_length=self.max_decoding_length))
+            for index in indices
+        ]
+        results = self.model.translate_batch(
+            source_tokens,
+            target_prefix=[[self.target_lang]] * len(source_tokens),
+            beam_size=self.beam_size,
+            max_decoding_length=self.max_decoding_length,
+        )
+        for index, result in zip(indices, results):
+            # 첫 토큰은 target_prefix로 넣은 언어 코드이므로 빼고 디코딩한다.
+            target_tokens = result.hypotheses[0][1:]
+            outputs[index] = self.tokenizer.decode(self.tokenizer.convert_tokens_to_ids(target_tokens), skip_special_tokens=True)
+        return outputs
+
+    def translate(self, text: str) -> str:
+        """
+        기능: 텍스트 하나를 번역한다. (NllbTranslator.translate와 같은 인터페이스)
+        input: text (번역할 텍스트)
+        output: 번역 결과
+        """
+        return self.translate_batch([text])[0]
+
+    def get_model_info(self) -> dict:
+        # 번역 메모리 키에 쓰이므로 transformers 경로와 결과가 섞이지 않게 백엔드와 양자화 형식을 붙인다.
+        return {
+            'model_name': f"{self.model_id}:ct2-{self.compute_type}",
+            'backend': 'ctranslate2',
+            'model_dir': self.model_dir,
+            'compute_type': self.compute_type,
+            'intra_threads': self.intra_threads,
+            'source_lang': self.source_lang,
+            'target_lang': self.target_lang,
+        }
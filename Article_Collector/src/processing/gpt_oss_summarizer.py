@@ -0,0 +1,333 @@
+import os
+import sys
+import json
+import queue
+import threading
+import subprocess
+from typing import Callable, Iterator, Optional, TypeVar
+
+from src.processing.summary_cache import SummaryCache
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+SUMMARIZATION_SCRIPT_PATH = os.path.join(PROJECT_ROOT, 'scripts', 'run_summarization_by_gpt.py')
+# 워커(run_summarization_by_gpt.py)에 환경 변수로 넘겨 같은 모델을 쓰게 한다.
+SUMMARY_MODEL_ID = os.getenv("SUMMARY_MODEL_ID", "openai/gpt-oss-20b")
+# 요약 프롬프트(run_summarization_by_gpt.py의 build_prompt) 버전. 지시문을 바꾸면 반드시 올린다.
+# 요약 캐시 키에 포함되어 이전 결과가 무효화된다. 워커도 이 값을 import해 ready 이벤트로 알려주고, 다르면 워커를 쓰지 않는다.
+PROMPT_VERSION = "v1"
+
+# 모델 로드는 수 분이 걸릴 수 있으므로 준비 대기 시간은 넉넉하게 잡는다.
+WORKER_READY_TIMEOUT = int(os.getenv("SUMMARY_WORKER_READY_TIMEOUT", 1800))
+# 기사 한 건당 응답 대기 시간(초). 묶음 작업은 기사 수만큼 곱해서 기다린다.
+JOB_TIMEOUT = int(os.getenv("SUMMARY_JOB_TIMEOUT", 900))
+MAX_RESTARTS = int(os.getenv("SUMMARY_WORKER_MAX_RESTARTS", 3))
+# 파이프라인이 워커에 한 번에 보내는 묶음의 대략적인 입력 토큰 예산
+BATCH_TOKEN_BUDGET = int(os.getenv("SUMMARY_BATCH_TOKEN_BUDGET", 24000))
+BATCH_MAX_ITEMS = int(os.getenv("SUMMARY_BATCH_MAX_ITEMS", 16))
+# 토크나이저 없이 토큰 수를 어림할 때 쓰는 글자/토큰 비율 (한국어 기준 보수적으로 잡음)
+CHARS_PER_TOKEN = 2
+
+T = TypeVar("T")
+
+
+def estimate_tokens(text: str) -> int:
+    """토크나이저를 로드하지 않고 본문의 토큰 수를 어림한다."""
+    return len(text or "") // CHARS_PER_TOKEN + 1
+
+
+def make_token_budget_batches(entries: list[T], text_of: Callable[[T], str],
+                              token_budget: int = BATCH_TOKEN_BUDGET,
+                              max_items: int = BATCH_MAX_ITEMS) -> Iterator[list[T]]:
+    """
+    기능: 항목들을 입력 순서를 유지한 채, 어림 토큰 합이 예산을 넘지 않는 묶음으로 나눈다.
+          예산보다 큰 항목은 단독 묶음이 된다.
+    input: entries (나눌 항목 리스트), text_of (항목에서 요약할 본문을 꺼내는 함수),
+           token_budget (묶음당 어림 토큰 예산), max_items (묶음당 최대 항목 수)
+    output: 항목 리스트의 이터레이터
+    """
+    batch, batch_tokens = [], 0
+    for entry in entries:
+        tokens = estimate_tokens(text_of(entry))
+        if batch and (batch_tokens + tokens > token_budget or len(batch) >= max_items):
+            yield batch
+            batch, batch_tokens = [], 0
+        batch.append(entry)
+        batch_tokens += tokens
+    if batch:
+        yield batch
+
+
+class SummarizationWorkerError(Exception):
+    """요약 워커 프로세스를 시작하거나 응답을 받지 못했을 때 발생하는 예외."""
+
+
+class SummarizationPromptVersionError(SummarizationWorkerError):
+    """워커의 프롬프트 버전이 캐시 키의 PROMPT_VERSION과 다를 때 발생하는 예외. 재시작해도 같으므로 재시도하지 않는다."""
+
+
+class SummarizationTimeoutError(SummarizationWorkerError):
+    """작업 응답이 제한 시간 안에 오지 않았을 때 발생하는 예외. 같은 작업을 다시 보내도 또 넘길 가능성이 높아 재시도하지 않는다."""
+
+
+class SummarizationWorker:
+    """
+    run_summarization_by_gpt.py --serve 를 상주 자식 프로세스로 띄워 두고
+    stdin/stdout JSON 라인으로 요약 작업을 주고받는 클래스.
+    워커가 죽거나 응답이 없으면 프로세스를 다시 띄운다.
+    """
+    def __init__(self, script_path: str = SUMMARIZATION_SCRIPT_PATH):
+        if not os.path.exists(script_path):
+            raise FileNotFoundError(f"Summarization script not found at: {script_path}")
+        self.script_path = script_path
+        self._process: Optional[subprocess.Popen] = None
+        self._responses: "queue.Queue[Optional[dict]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._next_job_id = 0
+        self.restart_count = 0
+
+    def _child_env(self) -> dict:
+        # 부모 프로세스의 환경을 복사한 뒤, 필요한 HF 관련 변수를 덮어씁니다.
+        # 이렇게 해야 자식 프로세스가 올바른 캐시 경로를 사용합니다.
+        child_env = os.environ.copy()
+        child_env['HF_HOME'] = '/home/bobo9245/projects/hf_cache'
+        child_env['HF_HUB_ENABLE_HF_TRANSFER'] = '1'
+        child_env['SUMMARY_MODEL_ID'] = SUMMARY_MODEL_ID
+        return child_env
+
+    def _read_stdout(self, process: subprocess.Popen, responses: "queue.Queue[Optional[dict]]"):
+        """워커 stdout을 읽어 응답 큐에 넣는다. 파이프가 닫히면 None을 넣어 종료를 알린다."""
+        for line in process.stdout:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                responses.put(json.loads(line))
+            except json.JSONDecodeError:
+                print(f"[SummaryWorker] 프로토콜이 아닌 출력 무시: {line[:100]}")
+        responses.put(None)
+
+    def is_alive(self) -> bool:
+        return self._process is not None and self._process.poll() is None
+
+    def start(self):
+        """
+        기능: 워커 프로세스를 띄우고 모델 로드가 끝날 때까지(ready 이벤트) 기다린다.
+        input: 없음
+        output: 없음. 실패 시 SummarizationWorkerError, 프롬프트 버전이 다르면 SummarizationPromptVersionError
+        """
+        self.stop()
+        print("[SummaryWorker] 요약 워커 프로세스를 시작합니다. (모델 로드 대기)")
+        self._responses = queue.Queue()
+        self._process = subprocess.Popen(
+            [sys.executable, self.script_path, '--serve'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=None,  # 워커 로그는 부모 콘솔로 그대로 흘려보낸다.
+            text=True,
+            encoding='utf-8',
+            bufsize=1,
+            env=self._child_env()
+        )
+        threading.Thread(
+            target=self._read_stdout, args=(self._process, self._responses), daemon=True
+        ).start()
+
+        try:
+            message = self._responses.get(timeout=WORKER_READY_TIMEOUT)
+        except queue.Empty:
+            self.stop()
+            raise SummarizationWorkerError(f"워커가 {WORKER_READY_TIMEOUT}초 안에 준비되지 않았습니다.")
+
+        if not message or message.get("event") != "ready":
+            error = message.get("error") if message else "워커 프로세스가 종료되었습니다."
+            self.stop()
+            raise SummarizationWorkerError(f"워커 시작 실패: {error}")
+        if message.get("prompt_version") != PROMPT_VERSION:
+            self.stop()
+            # 다른 프롬프트로 만든 요약이 현재 버전의 캐시 키로 저장되지 않도록 워커를 쓰지 않는다.
+            raise SummarizationPromptVersionError(
+                f"워커 프롬프트 버전({message.get('prompt_version')})이 캐시 키의 버전({PROMPT_VERSION})과 다릅니다. "
+                f"워커 스크립트({self.script_path})가 이 저장소의 것인지 확인해 주세요."
+            )
+        print(f"[SummaryWorker] 요약 워커 준비 완료 (model: {message.get('model_id')}, prompt: {PROMPT_VERSION}, pid: {self._process.pid})")
+
+    def stop(self):
+        """워커 프로세스를 종료한다. stdin을 닫으면 워커는 루프를 빠져나와 스스로 종료한다."""
+        process = self._process
+        self._process = None
+        if process is None:
+            return
+        try:
+            if process.stdin:
+                process.stdin.close()
+            process.wait(timeout=10)
+        except Exception:
+            process.kill()
+            process.wait()
+
+    def _send_and_wait(self, job: dict, timeout: float) -> dict:
+        self._process.stdin.write(json.dumps(job, ensure_ascii=False) + "\n")
+        self._process.stdin.flush()
+        while True:
+            try:
+                message = self._responses.get(timeout=timeout)
+            except queue.Empty:
+                raise SummarizationTimeoutError(f"작업 {job['id']} 응답이 {timeout:.0f}초 안에 오지 않았습니다.")
+            if message is None:
+                raise SummarizationWorkerError("워커 프로세스가 작업 도중 종료되었습니다.")
+            if message.get("id") == job["id"]:
+                return message
+            # 타임아웃 뒤 늦게 도착한 이전 작업의 응답은 버린다.
+
+    def submit(self, title: str, body: str) -> dict:
+        """
+        기능: 한 건의 요약 작업을 워커에 보내고 결과를 기다린다. 워커가 죽었으면 재시작 후 다시 보낸다.
+        input: title (기사 제목), body (요약할 본문)
+        output: {"summary": str, "error": str | None} 딕셔너리
+        """
+        try:
+            return self._request({"title": title, "body": body}, JOB_TIMEOUT)
+        except SummarizationTimeoutError as e:
+            return {"summary": "", "error": str(e)}
+
+    def submit_batch(self, items: list[tuple[str, str]]) -> list[dict]:
+        """
+        기능: 여러 건을 하나의 묶음 작업으로 보낸다. 워커는 길이가 비슷한 것끼리 패딩해 함께 생성한다.
+              제한 시간(JOB_TIMEOUT x 기사 수)을 넘기면 같은 묶음을 다시 보내지 않고 반으로 나눠 보낸다.
+        input: items ((title, body) 리스트)
+        output: 입력 순서와 같은 {"summary": str, "error": str | None} 리스트
+        """
+        try:
+            response = self._request(
+                {"items": [{"title": title, "body": body} for title, body in items]}, JOB_TIMEOUT * len(items)
+            )
+        except SummarizationTimeoutError as e:
+            if len(items) == 1:
+                return [{"summary": "", "error": str(e)}]
+            middle = len(items) // 2
+            print(f"[SummaryWorker] 묶음 {len(items)}건이 제한 시간을 넘겨 {middle}건/{len(items) - middle}건으로 나눠 다시 보냅니다.")
+            return self.submit_batch(items[:middle]) + self.submit_batch(items[middle:])
+        results = response.get("results")
+        if not isinstance(results, list) or len(results) != len(items):
+            error = response.get("error") or "워커가 올바른 묶음 결과를 돌려주지 않았습니다."
+            return [{"summary": "", "error": error} for _ in items]
+        return results
+
+    def _request(self, payload: dict, timeout: float) -> dict:
+        """
+        기능: 작업을 보내고 응답을 기다린다. 워커가 죽었거나 파이프가 끊기면 재시작 후 다시 보낸다.
+              응답 시간 초과는 응답 없는 워커를 정리한 뒤 SummarizationTimeoutError로 올려 호출자가 작업을 나누게 한다.
+        input: payload (작업 내용), timeout (응답 대기 시간(초))
+        output: 워커 응답 딕셔너리
+        """
+        with self._lock:
+            self._next_job_id += 1
+            job = {"id": self._next_job_id, **payload}
+            last_error = None
+            for _ in range(MAX_RESTARTS + 1):
+                try:
+                    if not self.is_alive():
+                        if self._process is not None:
+                            self.restart_count += 1
+                            print(f"[SummaryWorker] 워커가 종료되어 재시작합니다. (재시작 {self.restart_count}회)")
+                        self.start()
+                    return self._send_and_wait(job, timeout)
+                except SummarizationTimeoutError as e:
+                    print(f"[SummaryWorker] 작업 {job['id']} 처리 실패: {e}")
+                    # 응답이 없는 워커는 정리하고 다음 작업에서 새로 띄운다.
+                    self._process.kill()
+                    self._process.wait()
+                    raise
+                except SummarizationPromptVersionError:
+                    raise
+                except (SummarizationWorkerError, BrokenPipeError, OSError) as e:
+                    last_error = e
+                    print(f"[SummaryWorker] 작업 {job['id']} 처리 실패: {e}")
+                    # 응답이 없는 워커는 정리하고 다음 시도에서 새로 띄운다.
+                    if self._process is not None:
+                        self._process.kill()
+                        self._process.wait()
+            return {"id": job["id"], "summary": "", "error": str(last_error)}
+
+
+class GptOssSummarizer:
+    """
+    상주 gpt-oss-20b 요약 워커를 통해 요약을 수행하는 클래스.
+    모델은 첫 요청 시 한 번만 로드되고, 이후 요청은 같은 프로세스를 재사용한다.
+    이전 실행에서 같은 본문을 요약한 적이 있으면 요약 캐시의 결과를 돌려주고 워커를 부르지 않는다.
+    """
+    def __init__(self, use_cache: bool = True):
+        self.worker = SummarizationWorker()
+        self.cache = SummaryCache(PROMPT_VERSION, SUMMARY_MODEL_ID) if use_cache else None
+
+    def refine_text(self, title: str, body: str) -> str:
+        if not body or not body.strip():
+            print("Warning: Empty body provided for summarization. Skipping.")
+            return ""
+
+        if self.cache is not None:
+            cached = self.cache.get(body)
+            if cached is not None:
+                print(f"Summary cache hit for title: {title[:30]}")
+                return cached
+
+        print(f"Requesting GPT-OSS summary for title: {title[:30]}...")
+        result = self.worker.submit(title, body)
+        if result.get("error"):
+            print(f"Error during summarization for title '{title[:30]}': {result['error']}")
+            return ""
+
+        summary = (result.get("summary") or "").strip()
+        if not summary:
+            print(f"Warning: Summarization worker returned an empty result for title: {title[:30]}")
+        elif self.cache is not None:
+            self.cache.put(body, summary)
+        return summary
+
+    def summarize_batch(self, items: list[tuple[str, str]]) -> list[dict]:
+        """
+        기능: 여러 (title, body)를 한 번의 워커 작업으로 요약한다. 빈 본문은 워커에 보내지 않는다.
+        input: items ((title, body) 리스트)
+        output: 입력 순서와 같은 {"summary": str, "error": str | None} 리스트
+        """
+        results = [{"summary": "", "error": None} for _ in items]
+        pending = []
+        for index, (_, body) in enumerate(items):
+            if not body or not body.strip():
+                continue
+            cached = self.cache.get(body) if self.cache is not None else None
+            if cached is not None:
+                results[index] = {"summary": cached, "error": None}
+            else:
+                pending.append(index)
+
+        empty_count = sum(1 for _, body in items if not body or not body.strip())
+        if empty_count:
+            print(f"Warning: {empty_count} empty bodies skipped in summarization batch.")
+        cached_count = len(items) - empty_count - len(pending)
+        if cached_count:
+            print(f"Summary cache hit for {cached_count} of {len(items)} items.")
+        if not pending:
+            return results
+
+        print(f"Requesting GPT-OSS batch summary for {len(pending)} items...")
+        worker_results = self.worker.submit_batch([items[index] for index in pending])
+        for index, result in zip(pending, worker_results):
+            title = items[index][0]
+            summary = (result.get("summary") or "").strip()
+            if result.get("error"):
+                print(f"Error during summarization for title '{title[:30]}': {result['error']}")
+                summary = ""
+            elif not summary:
+                print(f"Warning: Summarization worker returned an empty result for title: {title[:30]}")
+            elif self.cache is not None:
+                self.cache.put(items[index][1], summary)
+            results[index] = {"summary": summary, "error": result.get("error")}
+        return results
+
+    def close(self):
+        """요약 워커 프로세스를 종료하고 요약 캐시를 닫는다."""
+        self.worker.stop()
+        if self.cache is not None:
+            print(f"[SummaryCache] {self.cache.stats()}")
+            self.cache.close()
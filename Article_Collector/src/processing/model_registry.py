@@ -0,0 +1,190 @@
+import os
+import time
+import asyncio
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+# 0이면 파이프라인 시작 시 모델을 미리 로드하지 않고, 처음 필요한 단계에서 로드한다.
+MODEL_PREWARM = os.getenv("MODEL_PREWARM", "1") != "0"
+
+
+@dataclass
+class _ModelEntry:
+    name: str
+    loader: Callable[[], Any] = field(repr=False)
+    closer: Optional[Callable[[Any], None]] = field(default=None, repr=False)
+    future: Optional[Future] = field(default=None, repr=False)
+    started_at: Optional[float] = None
+    load_seconds: Optional[float] = None
+    waited_seconds: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def state(self) -> str:
+        if self.future is None:
+            return 'idle'
+        if not self.future.done():
+            return 'loading'
+        return 'failed' if self.error is not None else 'ready'
+
+
+class ModelRegistry:
+    """
+    번역기, 요약기처럼 로드에 수 초~수 분이 걸리는 모델을 이름으로 등록해 두고 백그라운드 스레드에서 미리 로드하는 레지스트리.
+    - start/prewarm: 모델마다 전용 로더 스레드를 띄우고 준비 Future를 돌려준다. 이미 시작했으면 같은 Future를 돌려준다.
+      (스레드 풀을 쓰면 가벼운 모델이 수십 분 걸릴 수 있는 요약기 로드 뒤에 줄을 서게 된다.)
+    - wait (async) / get (동기): 준비될 때까지 기다려 모델을 돌려준다. 시작하지 않았으면 이때 로드를 시작한다.
+    이벤트 루프는 로드를 기다리는 동안에도 다른 단계를 처리하므로, 수집(네트워크)과 모델 로드가 겹쳐 실행된다.
+    """
+    def __init__(self):
+        self._entries: dict[str, _ModelEntry] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, loader: Callable[[], Any], closer: Optional[Callable[[Any], None]] = None):
+        """
+        기능: 모델 로더를 등록한다. 이미 등록된 이름이면 무시한다. (스크립트를 여러 번 import해도 안전)
+        input: name (모델 이름), loader (모델을 만들어 반환하는 함수, 로더 스레드에서 실행), closer (release 시 모델을 정리하는 함수)
+        output: 없음
+        """
+        with self._lock:
+            self._entries.setdefault(name, _ModelEntry(name, loader, closer))
+
+    def start(self, name: str) -> Future:
+        """
+        기능: 모델 로드를 백그라운드에서 시작하고 준비 Future를 반환한다. 이미 시작했으면 같은 Future를 반환한다.
+        input: name (등록된 모델 이름)
+        output: 모델을 결과로 갖는 concurrent.futures.Future
+        """
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is None:
+                raise KeyError(f"등록되지 않은 모델입니다: {name}")
+            if entry.future is None:
+                entry.started_at = time.perf_counter()
+                entry.error = None
+                entry.future = Future()
+                threading.Thread(
+                    target=self._load, args=(entry, entry.future), name=f"model-loader-{name}", daemon=True
+                ).start()
+            return entry.future
+
+    def prewarm(self, *names: str):
+        """
+        기능: 모델들을 백그라운드에서 미리 로드하기 시작한다. 이름을 생략하면 등록된 모든 모델. MODEL_PREWARM=0이면 아무것도 하지 않는다.
+        input: names (모델 이름들)
+        output: 없음
+        """
+        if not MODEL_PREWARM:
+            return
+        names = names or tuple(self._entries)
+        print(f"[ModelRegistry] 모델 미리 로드 시작: {', '.join(names)}")
+        for name in names:
+            self.start(name)
+
+    def _load(self, entry: _ModelEntry, future: Future):
+        if not future.set_running_or_notify_cancel():
+            return
+        print(f"[ModelRegistry] {entry.name} 로드 중...")
+        try:
+            model = entry.loader()
+        except BaseException as e:
+            entry.load_seconds = time.perf_counter() - entry.started_at
+            entry.error = str(e)
+            print(f"[ModelRegistry] {entry.name} 로드 실패: {e}")
+            future.set_exception(e)
+            return
+        entry.load_seconds = time.perf_counter() - entry.started_at
+        print(f"[ModelRegistry] {entry.name} 로드 완료 ({entry.load_seconds:.1f}초)")
+        future.set_result(model)
+
+    def _record_wait(self, entry: _ModelEntry, started: float):
+        waited = time.perf_counter() - started
+        entry.waited_seconds += waited
+        if waited >= 0.1:
+            print(f"[ModelRegistry] {entry.name} 준비를 {waited:.1f}초 기다렸습니다.")
+
+    async def wait(self, name: str) -> Any:
+        """
+        기능: (async) 모델이 준비될 때까지 이벤트 루프를 막지 않고 기다려 모델을 반환한다. 로드 실패 시 로더의 예외를 올린다.
+        input: name (등록된 모델 이름)
+        output: 모델 인스턴스
+        """
+        future = self.start(name)
+        started = time.perf_counter()
+        try:
+            return await asyncio.wrap_future(future)
+        finally:
+            self._record_wait(self._entries[name], started)
+
+    def get(self, name: str, timeout: Optional[float] = None) -> Any:
+        """
+        기능: (동기) 모델이 준비될 때까지 기다려 모델을 반환한다. 로드 실패 시 로더의 예외를 올린다.
+        input: name (등록된 모델 이름), timeout (최대 대기 시간(초), None이면 무제한)
+        output: 모델 인스턴스
+        """
+        future = self.start(name)
+        started = time.perf_counter()
+        try:
+            return future.result(timeout=timeout)
+        finally:
+            self._record_wait(self._entries[name], started)
+
+    def is_ready(self, name: str) -> bool:
+        entry = self._entries.get(name)
+        return entry is not None and entry.state == 'ready'
+
+    def release(self, name: str):
+        """
+        기능: 로드된 모델을 closer로 정리하고 잊는다. 다음 start/get은 모델을 새로 로드한다. 로드 중이면 끝날 때까지 기다린다.
+        input: name (등록된 모델 이름)
+        output: 없음
+        """
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is None or entry.future is None:
+                return
+            future, entry.future = entry.future, None
+        try:
+            model = future.result()
+        except Exception:
+            return
+        if entry.closer is not None and model is not None:
+            entry.closer(model)
+
+    def close(self):
+        """
+        기능: 로드된 모든 모델을 정리한다. 파이프라인 종료 시 호출한다.
+        input: 없음
+        output: 없음
+        """
+        for name in list(self._entries):
+            self.release(name)
+
+    def status(self) -> dict:
+        """모델별 상태('idle', 'loading', 'ready', 'failed'), 로드 시간, 단계가 준비를 기다린 시간, 마지막 오류를 반환한다."""
+        return {
+            name: {
+                'state': entry.state,
+                'load_seconds': round(entry.load_seconds, 2) if entry.load_seconds is not None else None,
+                'waited_seconds': round(entry.waited_seconds, 2),
+                'error': entry.error,
+            }
+            for name, entry in self._entries.items()
+        }
+
+
+# 전역 모델 레지스트리 인스턴스
+_model_registry: Optional[ModelRegistry] = None
+
+def get_model_registry() -> ModelRegistry:
+    """
+    기능: 파이프라인 전체에서 공유하는 ModelRegistry 싱글턴을 반환한다.
+    input: 없음
+    output: ModelRegistry 인스턴스
+    """
+    global _model_registry
+    if _model_registry is None:
+        _model_registry = ModelRegistry()
+    return _model_registry
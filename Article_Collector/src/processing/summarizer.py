@@ -112,4 +112,63 @@ class KoBARTSummarizer:
         
         except Exception as e:
             print(f"  - KoBART 요약 중 에러 발생: {e}")
-            return None
\ No newline at end of file
+            return None
+
+    def summarize_batch(self, items: list[tuple[str, str]], max_length: int = 1024, min_length: int = 64,
+                        token_budget: int = 8192, max_batch_size: int = 16) -> list[dict]:
+        """
+        여러 (title, body)를 길이가 비슷한 것끼리 묶어 패딩한 뒤 한 번의 generate()로 요약합니다.
+        묶음 처리에 실패하면 해당 묶음만 한 건씩 summarize()로 다시 시도합니다.
+        결과는 입력 순서대로 {"summary": str | None, "error": str | None} 리스트입니다.
+        """
+        results = [{"summary": None, "error": None} for _ in items]
+        encoded = []
+        for index, (_, body) in enumerate(items):
+            if not body or not body.strip():
+                results[index]["error"] = "empty body"
+                continue
+            length = len(self.tokenizer(body, truncation=True, max_length=max_length)['input_ids'])
+            encoded.append((index, body, length))
+
+        encoded.sort(key=lambda entry: entry[2])
+        batches, current = [], []
+        for entry in encoded:
+            if current and (len(current) + 1 > max_batch_size or entry[2] * (len(current) + 1) > token_budget):
+                batches.append(current)
+                current = []
+            current.append(entry)
+        if current:
+            batches.append(current)
+
+        for batch in batches:
+            try:
+                inputs = self.tokenizer(
+                    [body for _, body, _ in batch],
+                    return_tensors="pt",
+                    padding=True,
+                    truncation=True,
+                    max_length=max_length
+                ).to(self.device)
+
+                with torch.no_grad():
+                    summary_ids = self.model.generate(
+                        inputs['input_ids'],
+                        attention_mask=inputs['attention_mask'],
+                        num_beams=4,
+                        max_length=max_length,
+                        min_length=min_length,
+                        length_penalty=1.2,
+                        repetition_penalty=1.5,
+                        early_stopping=True
+                    )
+
+                for (index, _, _), ids in zip(batch, summary_ids):
+                    results[index]["summary"] = self.tokenizer.decode(ids, skip_special_tokens=True).strip()
+            except Exception as e:
+                print(f"  - KoBART 묶음 요약 중 에러 발생, 한 건씩 재시도합니다: {e}")
+                for index, body, _ in batch:
+                    summary = self.summarize(body, max_length=max_length, min_length=min_length)
+                    results[index]["summary"] = summary
+                    if summary is None:
+                        results[index]["error"] = "summarization failed"
+        return results
\ No newline at end of file
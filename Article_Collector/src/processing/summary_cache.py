@@ -0,0 +1,66 @@
+import os
+import re
+import hashlib
+import unicodedata
+from typing import Optional
+
+from src.utils.sqlite_lru_store import SqliteLruStore
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_CACHE_PATH = os.getenv(
+    "SUMMARY_CACHE_PATH", os.path.join(PROJECT_ROOT, 'Data', 'cache', 'summary_cache.sqlite3')
+)
+# 캐시에 저장된 본문(키+요약)의 총 크기 상한. 넘으면 가장 오래 쓰이지 않은 항목부터 지운다.
+DEFAULT_MAX_BYTES = int(os.getenv("SUMMARY_CACHE_MAX_MB", 512)) * 1024 * 1024
+
+
+def normalize_text(text: str) -> str:
+    """
+    기능: 캐시 키 계산용으로 본문을 정규화한다. 유니코드 NFC 정규화 후 공백을 한 칸으로 합친다.
+    input: text (원본 본문)
+    output: 정규화된 본문
+    """
+    text = unicodedata.normalize("NFC", text or "")
+    return re.sub(r"\s+", " ", text).strip()
+
+
+class SummaryCache:
+    """
+    (프롬프트 버전, 모델 ID, 정규화된 입력 본문)의 해시를 키로 요약 결과를 저장하는 SQLite 캐시.
+    같은 본문(또는 같은 구성의 그룹)을 다시 수집해도 LLM을 다시 호출하지 않도록 한다.
+    저장과 크기 상한 정리는 SqliteLruStore가 맡는다.
+    """
+    def __init__(self, prompt_version: str, model_id: str,
+                 path: str = DEFAULT_CACHE_PATH, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.prompt_version = prompt_version
+        self.model_id = model_id
+        self.store = SqliteLruStore(path, 'summary_cache', 'summary', max_bytes, 'SummaryCache')
+
+    def make_key(self, text: str) -> str:
+        """프롬프트 버전, 모델 ID, 정규화된 본문을 합쳐 sha256 키를 만든다."""
+        material = "\x1f".join([self.prompt_version, self.model_id, normalize_text(text)])
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, text: str) -> Optional[str]:
+        """
+        기능: 본문에 해당하는 요약을 캐시에서 찾는다.
+        input: text (요약할 본문)
+        output: 캐시된 요약 문자열. 없으면 None
+        """
+        return self.store.get(self.make_key(text))
+
+    def put(self, text: str, summary: str):
+        """
+        기능: 요약 결과를 저장하고, 크기 상한을 넘으면 오래된 항목을 정리한다. 빈 요약은 저장하지 않는다.
+        input: text (요약한 본문), summary (요약 결과)
+        output: 없음
+        """
+        if not summary:
+            return
+        self.store.put(self.make_key(text), summary)
+
+    def stats(self) -> dict:
+        return self.store.stats()
+
+    def close(self):
+        self.store.close()
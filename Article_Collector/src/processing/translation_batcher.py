@@ -0,0 +1,217 @@
+import os
+import re
+import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Optional
+
+from src.processing.translation_memory import TranslationMemory
+
+# 번역 워커에 한 번에 보내는 문장 수
+TRANSLATION_BATCH_SIZE = int(os.getenv("TRANSLATION_BATCH_SIZE", 32))
+# 묶음이 다 차지 않아도 첫 문장이 들어온 뒤 이 시간(초)이 지나면 보낸다.
+TRANSLATION_BATCH_WAIT = float(os.getenv("TRANSLATION_BATCH_WAIT", 0.2))
+# 영어 알파벳 비율이 이보다 높으면 영어 기사로 보고 번역한다.
+ENGLISH_RATIO_THRESHOLD = 0.7
+# 번역 시점. collect: 수집 파이프라인에서 영어 기사 전체를 번역한다.
+#           summary: 영어 기사는 영어 그대로 (언어별로) 그룹화/요약하고, 처리 파이프라인에서 최종 제목과 요약문만 번역한다.
+TRANSLATION_MODE = os.getenv("TRANSLATION_MODE", "collect")
+
+# 문장 끝(. ! ?와 닫는 따옴표/괄호) 뒤 공백에서 나눈다. 약어(Mr. U.S.)를 피하려고 다음 글자가 대문자/따옴표/숫자일 때만 나눈다.
+_SENTENCE_SPLIT_RE = re.compile(r'(?:(?<=[.!?])|(?<=[.!?]["\'”’)\]]))\s+(?=["\'“‘(\[]?[A-Z0-9])')
+_ABBREVIATION_RE = re.compile(r'\b(?:Mr|Mrs|Ms|Dr|Prof|Sr|Jr|St|Gen|Gov|Sen|Rep|Lt|Col|Sgt|Capt|No|vs|U\.S|U\.K|Inc|Corp|Ltd|Co)\.$')
+
+
+def is_english_text(text: str) -> bool:
+    """
+    기능: 본문 알파벳 중 ASCII 영문자 비율로 영어 기사인지 판단한다.
+    input: text (본문)
+    output: 영어 기사이면 True
+    """
+    english_chars = sum(1 for c in text if c.isascii() and c.isalpha())
+    total_chars = sum(1 for c in text if c.isalpha())
+    return total_chars > 0 and english_chars / total_chars > ENGLISH_RATIO_THRESHOLD
+
+
+def detect_language(text: str) -> str:
+    """
+    기능: 본문 언어를 'en'(영어 기사) 또는 'ko'(그 외)로 구분한다. 그룹화를 언어별로 나누는 데 쓴다.
+    input: text (본문)
+    output: 'en' 또는 'ko'
+    """
+    return "en" if is_english_text(text or "") else "ko"
+
+
+def split_sentences(paragraph: str) -> list[str]:
+    """
+    기능: 영어 문단을 문장 단위로 나눈다. 약어 뒤에서 잘린 조각은 앞 문장에 다시 붙인다.
+    input: paragraph (줄바꿈 없는 문단)
+    output: 문장 리스트
+    """
+    sentences = []
+    for piece in _SENTENCE_SPLIT_RE.split(paragraph.strip()):
+        piece = piece.strip()
+        if not piece:
+            continue
+        if sentences and _ABBREVIATION_RE.search(sentences[-1]):
+            sentences[-1] = f"{sentences[-1]} {piece}"
+        else:
+            sentences.append(piece)
+    return sentences
+
+
+def translate_sentences(translator, sentences: list[str], memory: Optional[TranslationMemory] = None) -> list[str]:
+    """
+    기능: 문장들을 번역한다. 번역 메모리에 없는 문장만 모델로 번역하고 결과를 메모리에 저장한다.
+          번역기가 묶음 번역(translate_batch)을 지원하면 한 번에, 아니면 문장별로 번역한다.
+    input: translator (번역기), sentences (중복 없는 문장 리스트), memory (번역 메모리 또는 None)
+    output: 같은 순서의 번역 리스트
+    """
+    remembered = memory.get_many(sentences) if memory is not None else {}
+    misses = [sentence for sentence in sentences if sentence not in remembered]
+    if misses:
+        translate_batch = getattr(translator, "translate_batch", None)
+        outputs = list(translate_batch(misses)) if translate_batch is not None else [translator.translate(sentence) for sentence in misses]
+        translated = dict(zip(misses, outputs))
+        if memory is not None:
+            memory.put_many(translated)
+        remembered.update(translated)
+    return [remembered.get(sentence, sentence) for sentence in sentences]
+
+
+def translate_texts_blocking(translator, texts: list[str], memory: Optional[TranslationMemory] = None,
+                             batch_size: int = TRANSLATION_BATCH_SIZE) -> list[str]:
+    """
+    기능: 동기 코드(처리 파이프라인)용 번역. 여러 텍스트의 문장을 모아 중복을 없앤 뒤 batch_size개씩 번역하고 원래 문단 구조로 다시 조립한다.
+    input: translator (번역기), texts (번역할 텍스트 리스트), memory (번역 메모리 또는 None), batch_size (묶음당 문장 수)
+    output: 같은 순서의 번역 결과 리스트
+    """
+    layout = [[split_sentences(paragraph) for paragraph in (text or "").split("\n")] for text in texts]
+    unique = list(dict.fromkeys(sentence for paragraphs in layout for sentences in paragraphs for sentence in sentences))
+    translated = {}
+    for start in range(0, len(unique), max(1, batch_size)):
+        chunk = unique[start:start + batch_size]
+        translated.update(zip(chunk, translate_sentences(translator, chunk, memory)))
+    return [
+        "\n".join(" ".join(translated.get(sentence, sentence) for sentence in sentences) for sentences in paragraphs)
+        for paragraphs in layout
+    ]
+
+
+@dataclass
+class _PendingSentence:
+    text: str
+    future: asyncio.Future = field(repr=False)
+
+
+class TranslationBatcher:
+    """
+    여러 기사의 영어 문장을 모아 고정 크기 묶음으로 번역 워커 스레드에 보내는 번역 단계.
+    기사마다 translate_texts를 호출하면 문장이 공용 대기열에 들어가고, 배치 루프가 TRANSLATION_BATCH_SIZE개가 차거나
+    TRANSLATION_BATCH_WAIT가 지나면 한 묶음으로 번역한 뒤 결과를 각 문장의 Future로 돌려준다.
+    모델 호출은 모델을 가진 전용 스레드 하나에서만 실행되므로 이벤트 루프는 번역 중에도 다른 단계를 처리한다.
+    memory(번역 메모리)가 있으면 묶음 중 이미 번역한 문장은 모델에 보내지 않는다.
+    """
+    def __init__(self, translator, batch_size: int = TRANSLATION_BATCH_SIZE, batch_wait: float = TRANSLATION_BATCH_WAIT,
+                 memory: Optional[TranslationMemory] = None):
+        self.translator = translator
+        self.memory = memory
+        self.batch_size = max(1, batch_size)
+        self.batch_wait = batch_wait
+        self.stats = {'articles': 0, 'sentences': 0, 'batches': 0, 'translate_seconds': 0.0}
+        self._queue: Optional[asyncio.Queue] = None
+        self._loop_task: Optional[asyncio.Task] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="translator")
+
+    def _ensure_started(self):
+        if self._loop_task is None:
+            self._queue = asyncio.Queue()
+            self._loop_task = asyncio.create_task(self._batch_loop())
+
+    async def translate_texts(self, texts: list[str]) -> list[str]:
+        """
+        기능: 한 기사의 텍스트들(제목, 본문 등)을 문단/문장으로 나눠 공용 묶음에 넣고, 번역이 끝나면 원래 구조로 다시 조립한다.
+        input: texts (번역할 텍스트 리스트)
+        output: 같은 순서의 번역 결과 리스트
+        """
+        self._ensure_started()
+        loop = asyncio.get_running_loop()
+        # texts -> 문단 -> 문장 구조를 기억해 두고, 문장별 Future를 만든다.
+        layout: list[list[list[asyncio.Future]]] = []
+        for text in texts:
+            paragraphs = []
+            for paragraph in (text or "").split("\n"):
+                futures = []
+                for sentence in split_sentences(paragraph):
+                    future = loop.create_future()
+                    await self._queue.put(_PendingSentence(sentence, future))
+                    futures.append(future)
+                paragraphs.append(futures)
+            layout.append(paragraphs)
+
+        self.stats['articles'] += 1
+        translated = []
+        for paragraphs in layout:
+            lines = []
+            for futures in paragraphs:
+                lines.append(" ".join(await asyncio.gather(*futures)) if futures else "")
+            translated.append("\n".join(lines))
+        return translated
+
+    async def _batch_loop(self):
+        while True:
+            batch = [await self._queue.get()]
+            deadline = time.monotonic() + self.batch_wait
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            await self._run_batch(batch)
+
+    async def _run_batch(self, batch: list[_PendingSentence]):
+        # 같은 묶음 안의 중복 문장(기사 간 공통 문구 등)은 한 번만 번역한다.
+        unique_texts = list(dict.fromkeys(item.text for item in batch))
+        started = time.perf_counter()
+        try:
+            outputs = await asyncio.get_running_loop().run_in_executor(self._executor, self._translate_batch, unique_texts)
+        except Exception as e:
+            print(f"[TranslationBatcher] 묶음 번역 실패, 원문을 그대로 씁니다 ({len(unique_texts)}문장): {e}")
+            outputs = unique_texts
+        self.stats['batches'] += 1
+        self.stats['sentences'] += len(batch)
+        self.stats['translate_seconds'] += time.perf_counter() - started
+
+        translated = dict(zip(unique_texts, outputs))
+        for item in batch:
+            if not item.future.done():
+                item.future.set_result(translated.get(item.text, item.text))
+
+    def _translate_batch(self, sentences: list[str]) -> list[str]:
+        """번역 워커 스레드에서 실행된다."""
+        return translate_sentences(self.translator, sentences, self.memory)
+
+    async def close(self):
+        """
+        기능: 배치 루프를 멈추고 번역 워커 스레드를 정리한다. 파이프라인 종료 시 호출한다.
+        input: 없음
+        output: 없음
+        """
+        if self._loop_task is not None:
+            self._loop_task.cancel()
+            try:
+                await self._loop_task
+            except asyncio.CancelledError:
+                pass
+            self._loop_task = None
+        self._executor.shutdown(wait=True)
+        if self.stats['batches']:
+            print(f"[TranslationBatcher] 기사 {self.stats['articles']}개, 문장 {self.stats['sentences']}개를 "
+                  f"{self.stats['batches']}개 묶음으로 번역 ({self.stats['translate_seconds']:.1f}초)")
+        if self.memory is not None:
+            print(f"[TranslationMemory] {self.memory.stats()}")
+            self.memory.close()
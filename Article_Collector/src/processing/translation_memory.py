@@ -0,0 +1,57 @@
+import os
+import hashlib
+
+from src.processing.summary_cache import normalize_text
+from src.utils.sqlite_lru_store import SqliteLruStore
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_MEMORY_PATH = os.getenv(
+    "TRANSLATION_MEMORY_PATH", os.path.join(PROJECT_ROOT, 'Data', 'cache', 'translation_memory.sqlite3')
+)
+# 저장된 문장(키+번역)의 총 크기 상한. 넘으면 가장 오래 쓰이지 않은 문장부터 지운다.
+DEFAULT_MAX_BYTES = int(os.getenv("TRANSLATION_MEMORY_MAX_MB", 256)) * 1024 * 1024
+# NLLB 언어 코드
+SOURCE_LANG = os.getenv("TRANSLATION_SOURCE_LANG", "eng_Latn")
+TARGET_LANG = os.getenv("TRANSLATION_TARGET_LANG", "kor_Hang")
+
+
+class TranslationMemory:
+    """
+    (언어 쌍, 모델 ID, 정규화된 문장)의 해시를 키로 문장 번역을 저장하는 SQLite 번역 메모리.
+    통신사 상투 문구, 사진 설명, 실행마다 다시 올라오는 기사처럼 이미 번역한 문장은 모델에 보내지 않는다.
+    저장과 크기 상한 정리는 SqliteLruStore가 맡는다.
+    """
+    def __init__(self, model_id: str, source_lang: str = SOURCE_LANG, target_lang: str = TARGET_LANG,
+                 path: str = DEFAULT_MEMORY_PATH, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.model_id = model_id
+        self.source_lang = source_lang
+        self.target_lang = target_lang
+        self.store = SqliteLruStore(path, 'translation_memory', 'translation', max_bytes, 'TranslationMemory')
+
+    def make_key(self, sentence: str) -> str:
+        """언어 쌍, 모델 ID, 정규화된 문장을 합쳐 sha256 키를 만든다."""
+        material = "\x1f".join([self.source_lang, self.target_lang, self.model_id, normalize_text(sentence)])
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get_many(self, sentences: list[str]) -> dict[str, str]:
+        """
+        기능: 문장들의 번역을 한 번에 찾고, 찾은 문장의 최근 사용 시각을 갱신한다.
+        input: sentences (번역할 문장 리스트)
+        output: {문장: 번역} 딕셔너리 (찾은 문장만)
+        """
+        keys = {self.make_key(sentence): sentence for sentence in sentences}
+        return {keys[key]: translation for key, translation in self.store.get_many(list(keys)).items()}
+
+    def put_many(self, translations: dict[str, str]):
+        """
+        기능: 문장 번역들을 저장하고, 크기 상한을 넘으면 오래된 문장을 정리한다. 빈 번역은 저장하지 않는다.
+        input: translations ({원문 문장: 번역} 딕셔너리)
+        output: 없음
+        """
+        self.store.put_many({self.make_key(sentence): translation for sentence, translation in translations.items() if translation})
+
+    def stats(self) -> dict:
+        return self.store.stats()
+
+    def close(self):
+        self.store.close()
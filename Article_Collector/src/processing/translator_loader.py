@@ -0,0 +1,42 @@
+import os
+
+# 0이면 문장 번역 메모리(Data/cache/translation_memory.sqlite3)를 쓰지 않고 모든 문장을 모델로 번역한다.
+USE_TRANSLATION_MEMORY = os.getenv("USE_TRANSLATION_MEMORY", "1") != "0"
+# 번역기 백엔드. transformers: NllbTranslator (원본 정밀도), ct2: int8 양자화 모델을 CTranslate2로 CPU에서 실행 (Ct2NllbTranslator)
+TRANSLATOR_BACKEND = os.getenv("TRANSLATOR_BACKEND", "transformers")
+
+
+def create_translator(backend: str = TRANSLATOR_BACKEND):
+    """
+    기능: 백엔드 이름에 해당하는 번역기를 새로 만든다. 두 번역기는 같은 translate()/get_model_info() 인터페이스를 가진다.
+    input: backend ('transformers' 또는 'ct2')
+    output: NllbTranslator 또는 Ct2NllbTranslator 인스턴스
+    """
+    if backend == "ct2":
+        from src.processing.ct2_translator import Ct2NllbTranslator
+        return Ct2NllbTranslator()
+    from models.translation.nllb_translator import NllbTranslator
+    return NllbTranslator()
+
+
+# 번역기 인스턴스 - None으로 초기화하고, 필요할 때 생성
+translator = None
+
+def get_translator():
+    """
+    기능: 번역기의 싱글턴 인스턴스를 반환합니다. 인스턴스가 없으면 TRANSLATOR_BACKEND로 새로 생성하고, 이미 있으면 기존 인스턴스를 반환합니다.
+          수집/처리 스크립트가 모델 레지스트리의 'translator' 로더로 등록합니다.
+    input: 없음
+    output: NllbTranslator(또는 Ct2NllbTranslator) 인스턴스 또는 초기화 실패 시 None
+    """
+    global translator
+    if translator is None:
+        print(f"[Translator] 번역기 인스턴스가 없으므로 새로 생성합니다... (backend: {TRANSLATOR_BACKEND})")
+        try:
+            translator = create_translator()
+            model_info = translator.get_model_info()
+            print(f"[Translator] 번역기 로드 완료: {model_info['model_name']}")
+        except Exception as e:
+            print(f"[Translator] 번역기 초기화 실패: {e}")
+            translator = None
+    return translator
@@ -1,6 +1,9 @@
-from playwright.async_api import async_playwright, Browser, Playwright, Page
+from playwright.async_api import async_playwright, Browser, BrowserContext, Playwright, Page
 from typing import Optional
 import asyncio
+import os
+import time
+from src.utils.resource_blocker import BLOCK_RESOURCES, PageLoadStats, get_resource_blocker
 
 # --- For FastAPI server ---
 _playwright_fastapi: Optional[Playwright] = None
@@ -38,53 +41,204 @@ def get_browser() -> Optional[Browser]:
 
 
 # --- Singleton Pattern for Local Pipeline ---
+# 동시에 열 수 있는 페이지(탭) 수 상한. 넘으면 get_page가 반환될 때까지 기다린다.
+BROWSER_MAX_PAGES = int(os.getenv("BROWSER_MAX_PAGES", 4))
+# 브라우저 시작 시 미리 만들어 두는 컨텍스트 수. 페이지는 컨텍스트에 고르게 나눠 만든다.
+BROWSER_CONTEXTS = int(os.getenv("BROWSER_CONTEXTS", 2))
+# 빌려간 페이지가 하나도 없는 상태가 이 시간(초) 이어지면 브라우저를 종료한다.
+BROWSER_IDLE_TIMEOUT = float(os.getenv("BROWSER_IDLE_TIMEOUT", 60))
+# 페이지 하나를 이 횟수만큼 재사용하면 닫고 새로 만든다. (렌더러 메모리 누적 방지)
+BROWSER_PAGE_MAX_USES = int(os.getenv("BROWSER_PAGE_MAX_USES", 50))
+
+
 class BrowserManager:
     """
-    로컬 파이프라인을 위한 Playwright 브라우저 인스턴스를 관리하는 싱글톤 클래스.
+    로컬 파이프라인을 위한 Playwright 브라우저 페이지 풀 (싱글톤).
+    브라우저를 띄울 때 컨텍스트를 미리 만들어 두고, 페이지는 BROWSER_MAX_PAGES개까지만 동시에 빌려준다.
+    반환된 페이지는 about:blank로 비운 뒤 다음 요청에 재사용하며, 모든 페이지가 반환된 뒤
+    BROWSER_IDLE_TIMEOUT 동안 요청이 없을 때만 브라우저를 종료한다.
     """
     _instance = None
-    _playwright: Optional[Playwright] = None
-    _browser: Optional[Browser] = None
-    _lock = asyncio.Lock()
-    _active_pages = 0
 
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super(BrowserManager, cls).__new__(cls)
+            instance = super(BrowserManager, cls).__new__(cls)
+            instance._reset_state()
+            cls._instance = instance
         return cls._instance
 
+    def _reset_state(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._contexts: list[BrowserContext] = []
+        self._idle_pages: list[Page] = []
+        self._page_uses: dict[int, int] = {}
+        self._page_loads: dict[int, PageLoadStats] = {}
+        self._lock: Optional[asyncio.Lock] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._idle_task: Optional[asyncio.Task] = None
+        self._pages_in_use = 0
+        self._metrics = {
+            'browser_launches': 0, 'pages_created': 0, 'pages_reused': 0, 'pages_recycled': 0,
+            'acquired': 0, 'wait_time_total': 0.0, 'wait_time_max': 0.0,
+        }
+
+    def _bind_loop(self):
+        # Lock/Semaphore와 브라우저 연결은 만든 이벤트 루프에서만 쓸 수 있다. 루프가 바뀌면(asyncio.run 재호출) 상태를 새로 만든다.
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            metrics = self._metrics
+            self._reset_state()
+            self._metrics = metrics
+            self._loop = loop
+            self._lock = asyncio.Lock()
+            self._semaphore = asyncio.Semaphore(BROWSER_MAX_PAGES)
+
     async def _get_browser(self) -> Browser:
         async with self._lock:
             if self._browser is None:
-                print("[BrowserManager] 로컬 파이프라인용 새 브라우저 인스턴스를 시작합니다...")
+                print(f"[BrowserManager] 로컬 파이프라인용 브라우저를 시작합니다. (컨텍스트 {BROWSER_CONTEXTS}개, 최대 페이지 {BROWSER_MAX_PAGES}개)")
                 self._playwright = await async_playwright().start()
                 self._browser = await self._playwright.chromium.launch(headless=True)
+                self._contexts = [await self._browser.new_context() for _ in range(max(1, BROWSER_CONTEXTS))]
+                self._metrics['browser_launches'] += 1
                 print("[BrowserManager] 로컬 파이프라인용 브라우저가 성공적으로 실행되었습니다.")
         return self._browser
 
-    async def get_page(self) -> Page:
-        browser = await self._get_browser()
-        async with self._lock:
-            self._active_pages += 1
-            print(f"[BrowserManager] 새 페이지를 제공합니다. (활성 페이지: {self._active_pages})")
-        return await browser.new_page()
+    async def _new_page(self) -> Page:
+        # 열린 페이지가 가장 적은 컨텍스트에 새 페이지를 만든다.
+        context = min(self._contexts, key=lambda c: len(c.pages))
+        page = await context.new_page()
+        self._metrics['pages_created'] += 1
+        return page
+
+    async def get_page(self, url: Optional[str] = None) -> Page:
+        """
+        기능: 풀에서 페이지를 빌린다. 동시에 빌려간 페이지가 BROWSER_MAX_PAGES개면 반환될 때까지 기다린다.
+              BLOCK_RESOURCES이면 반환할 때까지 url 사이트의 정책으로 이미지/폰트/광고 등의 요청을 차단한다.
+        input: url (불러올 페이지 URL, 리소스 차단 정책을 고르는 데 쓴다)
+        output: Playwright Page (사용 후 반드시 release_page로 반환)
+        """
+        self._bind_loop()
+        started = time.perf_counter()
+        await self._semaphore.acquire()
+        try:
+            waited = time.perf_counter() - started
+            self._metrics['acquired'] += 1
+            self._metrics['wait_time_total'] += waited
+            self._metrics['wait_time_max'] = max(self._metrics['wait_time_max'], waited)
+            if self._idle_task is not None:
+                self._idle_task.cancel()
+                self._idle_task = None
+
+            await self._get_browser()
+            page = None
+            while self._idle_pages:
+                candidate = self._idle_pages.pop()
+                if not candidate.is_closed():
+                    page = candidate
+                    self._metrics['pages_reused'] += 1
+                    break
+            if page is None:
+                page = await self._new_page()
+            self._page_uses[id(page)] = self._page_uses.get(id(page), 0) + 1
+            if BLOCK_RESOURCES:
+                self._page_loads[id(page)] = await get_resource_blocker().attach(page, url)
+            self._pages_in_use += 1
+            return page
+        except BaseException:
+            self._semaphore.release()
+            raise
 
     async def release_page(self, page: Page):
-        await page.close()
-        should_shutdown = False
-        async with self._lock:
-            self._active_pages -= 1
-            print(f"[BrowserManager] 페이지를 닫았습니다. (활성 페이지: {self._active_pages})")
-            if self._active_pages == 0 and self._browser is not None:
-                should_shutdown = True
-        
-        if should_shutdown:
+        """
+        기능: 빌린 페이지를 풀에 반환한다. 비운 뒤 재사용하고, 재사용 횟수를 넘었거나 비우기에 실패한 페이지는 닫는다.
+              빌려간 페이지가 0개가 되면 유휴 타이머를 시작한다.
+        input: page (get_page로 받은 페이지)
+        output: 없음
+        """
+        try:
+            load = self._page_loads.pop(id(page), None)
+            if load is not None:
+                await get_resource_blocker().detach(page, load)
+            if not page.is_closed():
+                if self._page_uses.get(id(page), 0) >= BROWSER_PAGE_MAX_USES:
+                    await self._close_page(page)
+                    self._metrics['pages_recycled'] += 1
+                else:
+                    try:
+                        await page.goto("about:blank")
+                        self._idle_pages.append(page)
+                    except Exception:
+                        await self._close_page(page)
+            else:
+                self._page_uses.pop(id(page), None)
+        finally:
+            self._pages_in_use -= 1
+            self._semaphore.release()
+            if self._pages_in_use == 0 and self._browser is not None and self._idle_task is None:
+                self._idle_task = asyncio.create_task(self._shutdown_when_idle())
+
+    async def _close_page(self, page: Page):
+        self._page_uses.pop(id(page), None)
+        try:
+            await page.close()
+        except Exception:
+            pass
+
+    async def _shutdown_when_idle(self):
+        try:
+            await asyncio.sleep(BROWSER_IDLE_TIMEOUT)
+        except asyncio.CancelledError:
+            return
+        if self._pages_in_use == 0:
+            self._idle_task = None
+            print(f"[BrowserManager] {BROWSER_IDLE_TIMEOUT:g}초 동안 요청이 없어 브라우저를 종료합니다.")
             await self.shutdown()
-    
+
+    def metrics(self) -> dict:
+        """
+        기능: 페이지 풀 지표를 반환한다.
+        input: 없음
+        output: {'pages_in_use', 'idle_pages', 'max_pages', 'contexts', 'browser_running', 'browser_launches', 'pages_created',
+                 'pages_reused', 'pages_recycled', 'acquired', 'wait_time_avg_ms', 'wait_time_max_ms', 'resource_blocking'} 딕셔너리
+        """
+        acquired = self._metrics['acquired']
+        return {
+            'pages_in_use': self._pages_in_use,
+            'idle_pages': len(self._idle_pages),
+            'max_pages': BROWSER_MAX_PAGES,
+            'contexts': len(self._contexts),
+            'browser_running': self._browser is not None,
+            'browser_launches': self._metrics['browser_launches'],
+            'pages_created': self._metrics['pages_created'],
+            'pages_reused': self._metrics['pages_reused'],
+            'pages_recycled': self._metrics['pages_recycled'],
+            'acquired': acquired,
+            'wait_time_avg_ms': round(self._metrics['wait_time_total'] / acquired * 1000, 2) if acquired else 0.0,
+            'wait_time_max_ms': round(self._metrics['wait_time_max'] * 1000, 2),
+            'resource_blocking': get_resource_blocker().stats() if BLOCK_RESOURCES else None,
+        }
+
     async def shutdown(self):
+        """
+        기능: 유휴 페이지, 컨텍스트, 브라우저를 모두 닫는다. 파이프라인 종료 시 호출한다.
+        input: 없음
+        output: 없음
+        """
+        if self._lock is None:
+            return
+        if self._idle_task is not None and self._idle_task is not asyncio.current_task():
+            self._idle_task.cancel()
+        self._idle_task = None
         async with self._lock:
             if self._browser:
-                print("[BrowserManager] 모든 작업이 완료되어 로컬 파이프라인용 브라우저를 종료합니다.")
+                print(f"[BrowserManager] 로컬 파이프라인용 브라우저를 종료합니다. 지표: {self.metrics()}")
+                self._idle_pages.clear()
+                self._page_uses.clear()
+                self._page_loads.clear()
+                self._contexts = []
                 await self._browser.close()
                 await self._playwright.stop()
                 self._browser = None
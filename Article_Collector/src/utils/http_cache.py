@@ -0,0 +1,163 @@
+import os
+import time
+import sqlite3
+import threading
+import yaml
+from dataclasses import dataclass
+from urllib.parse import urlencode, urlparse
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_CONFIG_PATH = os.path.join(PROJECT_ROOT, 'configs', 'news_sites.yaml')
+DEFAULT_CACHE_PATH = os.getenv(
+    "HTTP_CACHE_PATH", os.path.join(PROJECT_ROOT, 'Data', 'cache', 'http_cache.sqlite3')
+)
+# news_sites.yaml에 http_cache 설정이 없을 때의 신선도 유지 시간(초)
+DEFAULT_TTL = 300
+# 이보다 오래된 항목은 조건부 요청에도 쓰지 않고 정리한다.
+MAX_ENTRY_AGE = 7 * 24 * 60 * 60
+
+
+@dataclass
+class CacheEntry:
+    url: str
+    body: str
+    etag: str | None
+    last_modified: str | None
+    fetched_at: float
+
+
+def make_cache_key(url: str, params: dict | None = None) -> str:
+    """쿼리 파라미터를 정렬해 붙여 요청 하나를 가리키는 캐시 키를 만든다."""
+    if not params:
+        return url
+    separator = '&' if '?' in url else '?'
+    return f"{url}{separator}{urlencode(sorted(params.items()))}"
+
+
+class HttpCache:
+    """
+    목록/검색 페이지용 디스크 HTTP 캐시.
+    신선도 시간(TTL) 안이면 네트워크 없이 저장된 본문을 돌려주고,
+    지났으면 ETag/Last-Modified로 조건부 요청을 보내 304일 때 저장된 본문을 재사용한다.
+    TTL은 configs/news_sites.yaml의 http_cache.default_ttl, http_cache.hosts.<호스트>, sites.<사이트>.cache_ttl로 정한다.
+    """
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, config_path: str = DEFAULT_CONFIG_PATH):
+        self.path = path
+        self.default_ttl = DEFAULT_TTL
+        self.host_ttls: dict[str, int] = {}
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._load_config(config_path)
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS http_cache (
+                url TEXT PRIMARY KEY,
+                body TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("DELETE FROM http_cache WHERE fetched_at < ?", (time.time() - MAX_ENTRY_AGE,))
+        self._conn.commit()
+
+    def _load_config(self, config_path: str):
+        try:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                config = yaml.safe_load(f) or {}
+        except Exception as e:
+            print(f"[HttpCache] 설정 파일 로드 오류 ({config_path}): {e}. 기본 TTL을 사용합니다.")
+            return
+
+        cache_config = config.get('http_cache') or {}
+        self.default_ttl = int(cache_config.get('default_ttl', DEFAULT_TTL))
+        for host, ttl in (cache_config.get('hosts') or {}).items():
+            self.host_ttls[_host_key(host)] = int(ttl)
+        for site_config in (config.get('sites') or {}).values():
+            if site_config and 'cache_ttl' in site_config and 'base_url' in site_config:
+                self.host_ttls[_host_key(urlparse(site_config['base_url']).hostname)] = int(site_config['cache_ttl'])
+
+    def ttl_for(self, url: str) -> int:
+        """url 호스트(또는 상위 도메인)에 설정된 신선도 유지 시간을 반환한다."""
+        parts = _host_key(urlparse(url).hostname).split('.')
+        for i in range(len(parts) - 1):
+            ttl = self.host_ttls.get('.'.join(parts[i:]))
+            if ttl is not None:
+                return ttl
+        return self.default_ttl
+
+    def lookup(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, body, etag, last_modified, fetched_at FROM http_cache WHERE url = ?", (key,)
+            ).fetchone()
+        return CacheEntry(*row) if row else None
+
+    def get_fresh(self, entry: CacheEntry | None, url: str) -> str | None:
+        """항목이 신선도 시간 안이면 본문을, 아니면 None을 반환한다."""
+        if entry is not None and time.time() - entry.fetched_at < self.ttl_for(url):
+            self.hits += 1
+            return entry.body
+        return None
+
+    @staticmethod
+    def conditional_headers(entry: CacheEntry | None) -> dict:
+        """저장된 검증자로 If-None-Match / If-Modified-Since 헤더를 만든다."""
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                headers['If-Modified-Since'] = entry.last_modified
+        return headers
+
+    def store(self, key: str, body: str, response_headers) -> None:
+        """200 응답의 본문과 검증자(ETag, Last-Modified)를 저장한다."""
+        self.misses += 1
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO http_cache (url, body, etag, last_modified, fetched_at) VALUES (?, ?, ?, ?, ?)",
+                (key, body, response_headers.get('ETag'), response_headers.get('Last-Modified'), time.time())
+            )
+            self._conn.commit()
+
+    def refresh(self, key: str) -> None:
+        """304 응답을 받은 항목의 신선도 시간을 갱신한다."""
+        self.revalidated += 1
+        with self._lock:
+            self._conn.execute("UPDATE http_cache SET fetched_at = ? WHERE url = ?", (time.time(), key))
+            self._conn.commit()
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "revalidated": self.revalidated, "misses": self.misses}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def _host_key(host: str | None) -> str:
+    host = (host or '').lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+# 전역 HTTP 캐시 인스턴스
+_http_cache = None
+
+def get_http_cache() -> HttpCache:
+    """
+    기능: 프로세스 전체에서 공유하는 HttpCache 싱글턴을 반환한다.
+    input: 없음
+    output: HttpCache 인스턴스
+    """
+    global _http_cache
+    if _http_cache is None:
+        _http_cache = HttpCache()
+    return _http_cache
@@ -0,0 +1,177 @@
+import os
+import time
+import asyncio
+import yaml
+from urllib.parse import urlparse
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_CONFIG_PATH = os.path.join(PROJECT_ROOT, 'configs', 'news_sites.yaml')
+
+# news_sites.yaml에 rate_limit 설정이 없을 때 쓰는 기본값
+DEFAULT_RATE = 2.0         # 초당 요청 수
+DEFAULT_BURST = 4          # 쉬고 있던 호스트에 한 번에 보낼 수 있는 요청 수
+DEFAULT_BACKOFF = 5.0      # 429/503을 처음 받았을 때 해당 호스트를 쉬게 하는 시간(초)
+MAX_BACKOFF = 120.0
+MIN_RATE_RATIO = 0.1       # 감속 시 설정 속도의 10% 밑으로는 내리지 않는다.
+RECOVERY_RATIO = 0.1       # 정상 응답마다 설정 속도의 10%씩 회복한다.
+THROTTLE_STATUSES = {429, 503}
+
+
+class TokenBucket:
+    """
+    한 호스트에 대한 토큰 버킷. 토큰이 없으면 다음 토큰이 생길 시점까지 기다린다.
+    이벤트 루프는 단일 스레드이므로 await 없이 토큰을 먼저 예약(음수 허용)하고 나서 잠든다.
+    """
+    def __init__(self, host: str, rate: float, burst: int, backoff: float = DEFAULT_BACKOFF):
+        if rate <= 0:
+            raise ValueError(f"rate_limit.rate는 0보다 커야 합니다: {host} rate={rate}")
+        self.host = host
+        self.configured_rate = rate
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.base_backoff = backoff
+        self.tokens = float(self.burst)
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0
+        self.consecutive_throttles = 0
+        self.throttle_count = 0
+
+    def _refill(self, now: float):
+        # 차단 중에는 updated_at이 차단이 끝나는 시각이므로 토큰이 쌓이지 않는다.
+        if now > self.updated_at:
+            self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+
+    async def acquire(self):
+        """토큰 하나를 얻을 때까지 기다린다. 차단 중이면 차단이 끝난 시점부터 토큰 간격을 두고 깨어난다."""
+        now = time.monotonic()
+        self._refill(now)
+        self.tokens -= 1
+        start = max(now, self.blocked_until)
+        wait = start - now + (0.0 if self.tokens >= 0 else -self.tokens / self.rate)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def on_throttled(self, retry_after: float | None = None):
+        """429/503 응답: 속도를 절반으로 줄이고 일정 시간 호스트 요청을 멈춘다."""
+        self.throttle_count += 1
+        self.consecutive_throttles += 1
+        self.rate = max(self.configured_rate * MIN_RATE_RATIO, self.rate / 2)
+        backoff = retry_after if retry_after is not None else min(
+            MAX_BACKOFF, self.base_backoff * (2 ** (self.consecutive_throttles - 1))
+        )
+        now = time.monotonic()
+        self._refill(now)
+        self.blocked_until = max(self.blocked_until, now + backoff)
+        # 쌓여 있던 토큰으로 재개 직후 몰아서 요청하지 않도록 재개 시점에는 한 건만 허용하고,
+        # 차단이 끝날 때까지 토큰이 다시 쌓이지 않게 한다. 대기 중인 예약(음수 토큰)은 그대로 유지한다.
+        self.tokens = min(self.tokens, 1.0)
+        self.updated_at = self.blocked_until
+        print(f"[RateLimiter] {self.host}: 응답 제한 감지. {backoff:.1f}초 대기, 속도 {self.rate:.2f} req/s로 감속")
+
+    def on_success(self):
+        """정상 응답: 설정 속도까지 조금씩 회복한다."""
+        self.consecutive_throttles = 0
+        if self.rate < self.configured_rate:
+            self.rate = min(self.configured_rate, self.rate + self.configured_rate * RECOVERY_RATIO)
+
+
+def _host_key(host: str) -> str:
+    host = (host or '').lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None  # HTTP-date 형식은 기본 백오프를 쓴다.
+
+
+class HostRateLimiter:
+    """
+    호스트별 토큰 버킷 스케줄러. 속도와 버스트는 configs/news_sites.yaml에서 읽는다.
+      rate_limit.default: 모든 호스트의 기본값
+      sites.<사이트>.rate_limit: 해당 사이트 base_url 호스트(및 하위 도메인)에 적용
+    """
+    def __init__(self, config_path: str = DEFAULT_CONFIG_PATH):
+        self.default = {'rate': DEFAULT_RATE, 'burst': DEFAULT_BURST, 'backoff': DEFAULT_BACKOFF}
+        self.host_settings: dict[str, dict] = {}
+        self.buckets: dict[str, TokenBucket] = {}
+        self._load_config(config_path)
+
+    def _load_config(self, config_path: str):
+        try:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                config = yaml.safe_load(f) or {}
+        except Exception as e:
+            print(f"[RateLimiter] 설정 파일 로드 오류 ({config_path}): {e}. 기본 속도 제한을 사용합니다.")
+            return
+
+        self.default.update((config.get('rate_limit') or {}).get('default') or {})
+        for site_config in (config.get('sites') or {}).values():
+            if not site_config or 'rate_limit' not in site_config or 'base_url' not in site_config:
+                continue
+            host = _host_key(urlparse(site_config['base_url']).hostname)
+            self.host_settings[host] = {**self.default, **site_config['rate_limit']}
+
+    def _settings_for(self, host: str) -> tuple[str, dict]:
+        # news.chosun.com -> chosun.com 순으로 상위 도메인 설정을 찾는다.
+        # 설정된 사이트의 하위 도메인들은 같은 버킷을 공유한다.
+        parts = host.split('.')
+        for i in range(len(parts) - 1):
+            domain = '.'.join(parts[i:])
+            if domain in self.host_settings:
+                return domain, self.host_settings[domain]
+        return host, self.default
+
+    def bucket_for(self, url: str) -> TokenBucket:
+        key, settings = self._settings_for(_host_key(urlparse(url).hostname))
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(key, float(settings['rate']), int(settings['burst']), float(settings['backoff']))
+            self.buckets[key] = bucket
+        return bucket
+
+    async def acquire(self, url: str):
+        """
+        기능: url의 호스트에 요청을 보낼 수 있을 때까지 기다린다.
+        input: url (요청할 URL)
+        output: 없음
+        """
+        await self.bucket_for(url).acquire()
+
+    def report(self, url: str, status: int, retry_after: str | None = None):
+        """
+        기능: 응답 상태를 알려 호스트 속도를 조정한다. 429/503이면 감속, 그 외 정상 응답이면 회복.
+        input: url (요청한 URL), status (HTTP 상태 코드), retry_after (Retry-After 헤더 값)
+        output: 없음
+        """
+        bucket = self.bucket_for(url)
+        if status in THROTTLE_STATUSES:
+            bucket.on_throttled(_parse_retry_after(retry_after))
+        elif status < 500:
+            bucket.on_success()
+
+    def stats(self) -> dict:
+        return {
+            host: {'rate': round(bucket.rate, 3), 'throttled': bucket.throttle_count}
+            for host, bucket in self.buckets.items()
+        }
+
+
+# 전역 레이트 리미터 인스턴스
+_rate_limiter = None
+
+def get_rate_limiter() -> HostRateLimiter:
+    """
+    기능: 프로세스 전체에서 공유하는 HostRateLimiter 싱글턴을 반환한다.
+    input: 없음
+    output: HostRateLimiter 인스턴스
+    """
+    global _rate_limiter
+    if _rate_limiter is None:
+        _rate_limiter = HostRateLimiter()
+    return _rate_limiter
@@ -0,0 +1,211 @@
+import os
+import re
+import time
+import yaml
+from dataclasses import dataclass, field
+from urllib.parse import urlparse
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_CONFIG_PATH = os.path.join(PROJECT_ROOT, 'configs', 'news_sites.yaml')
+
+# 0이면 헤드리스 페이지에서 리소스를 차단하지 않는다. (차단 때문에 페이지가 깨지는지 확인할 때)
+BLOCK_RESOURCES = os.getenv("BLOCK_RESOURCES", "1") != "0"
+
+# news_sites.yaml에 resource_blocking 설정이 없을 때 쓰는 기본값
+DEFAULT_BLOCK_TYPES = ("image", "media", "font")
+DEFAULT_BLOCK_URLS = (
+    r"doubleclick\.net", r"googlesyndication\.com", r"googletagservices\.com", r"googletagmanager\.com",
+    r"google-analytics\.com", r"adservice\.google\.", r"amazon-adsystem\.com", r"adnxs\.com",
+    r"criteo\.(com|net)", r"taboola\.com", r"outbrain\.com", r"scorecardresearch\.com",
+    r"chartbeat\.(com|net)", r"facebook\.net", r"connect\.facebook\.", r"/pagead/", r"/beacon\b",
+)
+# 문서 자체는 어떤 설정으로도 막지 않는다.
+_NEVER_BLOCKED_TYPES = {"document"}
+
+# 차단한 요청의 크기는 알 수 없으므로 리소스 종류별 대략적인 응답 크기(bytes)로 절약량을 추정한다.
+_ESTIMATED_BYTES = {
+    "image": 40_000, "media": 500_000, "font": 35_000, "stylesheet": 20_000,
+    "script": 30_000, "xhr": 5_000, "fetch": 5_000, "other": 2_000,
+}
+
+
+def _host_key(host: str | None) -> str:
+    host = (host or '').lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+@dataclass
+class BlockPolicy:
+    """한 사이트에 적용하는 차단 정책. allow 패턴에 맞는 URL은 종류/패턴과 관계없이 통과시킨다."""
+    block_types: frozenset[str]
+    block_urls: list[re.Pattern] = field(default_factory=list)
+    allow_urls: list[re.Pattern] = field(default_factory=list)
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        if resource_type in _NEVER_BLOCKED_TYPES:
+            return False
+        if any(pattern.search(url) for pattern in self.allow_urls):
+            return False
+        return resource_type in self.block_types or any(pattern.search(url) for pattern in self.block_urls)
+
+
+@dataclass
+class PageLoadStats:
+    """페이지 한 번의 로드(get_page ~ release_page) 동안의 요청/차단 기록."""
+    host: str
+    requests: int = 0
+    blocked: int = 0
+    blocked_by_type: dict[str, int] = field(default_factory=dict)
+    bytes_loaded: int = 0
+    estimated_bytes_saved: int = 0
+    started_at: float = field(default_factory=time.perf_counter)
+    elapsed_ms: float = 0.0
+    # attach가 건 (route 핸들러, 응답 리스너). detach에서 떼어낸다.
+    hooks: tuple | None = field(default=None, repr=False)
+
+    def record_block(self, resource_type: str):
+        self.blocked += 1
+        self.blocked_by_type[resource_type] = self.blocked_by_type.get(resource_type, 0) + 1
+        self.estimated_bytes_saved += _ESTIMATED_BYTES.get(resource_type, _ESTIMATED_BYTES["other"])
+
+    @property
+    def estimated_time_saved_ms(self) -> float:
+        """이번 로드에서 관측한 처리량(받은 bytes / 걸린 시간)으로 차단한 bytes를 받는 데 걸렸을 시간을 추정한다."""
+        if not self.bytes_loaded or not self.elapsed_ms:
+            return 0.0
+        return self.estimated_bytes_saved / (self.bytes_loaded / self.elapsed_ms)
+
+
+class ResourceBlocker:
+    """
+    헤드리스 페이지 로드에서 이미지/미디어/폰트와 광고·트래킹 요청을 route 가로채기로 막는다.
+    정책은 configs/news_sites.yaml에서 읽는다.
+      resource_blocking.block_types / block_urls: 모든 사이트의 기본 차단 리소스 종류와 URL 정규식
+      sites.<사이트>.resource_blocking: 해당 사이트 base_url 호스트(및 하위 도메인)의 페이지에 적용.
+                                        allow(항상 통과시킬 URL 정규식), block_types, block_urls(기본값에 추가)
+    """
+    def __init__(self, config_path: str = DEFAULT_CONFIG_PATH):
+        self.default = {'block_types': list(DEFAULT_BLOCK_TYPES), 'block_urls': list(DEFAULT_BLOCK_URLS)}
+        self.host_settings: dict[str, dict] = {}
+        self.policies: dict[str, BlockPolicy] = {}
+        self.totals = {'page_loads': 0, 'requests': 0, 'blocked': 0, 'bytes_loaded': 0,
+                       'estimated_bytes_saved': 0, 'estimated_time_saved_ms': 0.0}
+        self._load_config(config_path)
+
+    def _load_config(self, config_path: str):
+        try:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                config = yaml.safe_load(f) or {}
+        except Exception as e:
+            print(f"[ResourceBlocker] 설정 파일 로드 오류 ({config_path}): {e}. 기본 차단 정책을 사용합니다.")
+            return
+
+        self.default.update(config.get('resource_blocking') or {})
+        for site_config in (config.get('sites') or {}).values():
+            if not site_config or 'resource_blocking' not in site_config or 'base_url' not in site_config:
+                continue
+            self.host_settings[_host_key(urlparse(site_config['base_url']).hostname)] = site_config['resource_blocking']
+
+    def _settings_for(self, host: str) -> tuple[str, dict]:
+        # news.chosun.com -> chosun.com 순으로 상위 도메인 설정을 찾는다.
+        parts = host.split('.')
+        for i in range(len(parts) - 1):
+            domain = '.'.join(parts[i:])
+            if domain in self.host_settings:
+                return domain, self.host_settings[domain]
+        return "", {}
+
+    def policy_for(self, url: str | None) -> BlockPolicy:
+        """
+        기능: 페이지 URL의 사이트 차단 정책을 컴파일해 돌려준다. (사이트별로 한 번만 컴파일)
+        input: url (불러올 페이지 URL, 없으면 기본 정책)
+        output: BlockPolicy
+        """
+        key, site = self._settings_for(_host_key(urlparse(url).hostname if url else ""))
+        policy = self.policies.get(key)
+        if policy is None:
+            policy = BlockPolicy(
+                block_types=frozenset(site.get('block_types', self.default['block_types'])),
+                block_urls=[re.compile(p) for p in [*self.default['block_urls'], *site.get('block_urls', [])]],
+                allow_urls=[re.compile(p) for p in site.get('allow', [])],
+            )
+            self.policies[key] = policy
+        return policy
+
+    async def attach(self, page, url: str | None = None) -> PageLoadStats:
+        """
+        기능: 페이지에 차단 route와 응답 크기 기록기를 건다. 페이지를 풀에 돌려주기 전에 detach로 떼어낸다.
+        input: page (Playwright Page), url (불러올 페이지 URL, 정책을 고르는 데 쓴다)
+        output: 이번 로드의 PageLoadStats
+        """
+        policy = self.policy_for(url)
+        stats = PageLoadStats(host=_host_key(urlparse(url).hostname if url else "") or "-")
+
+        async def handle_route(route, request):
+            stats.requests += 1
+            try:
+                if policy.should_block(request.resource_type, request.url):
+                    stats.record_block(request.resource_type)
+                    await route.abort("blockedbyclient")
+                else:
+                    await route.continue_()
+            except Exception:
+                # 페이지가 이미 닫혔거나 이동해 요청이 사라진 경우
+                pass
+
+        def on_response(response):
+            length = response.headers.get("content-length")
+            if length and length.isdigit():
+                stats.bytes_loaded += int(length)
+
+        await page.route("**/*", handle_route)
+        page.on("response", on_response)
+        stats.hooks = (handle_route, on_response)
+        return stats
+
+    async def detach(self, page, stats: PageLoadStats):
+        """
+        기능: attach로 건 route와 기록기를 떼고, 이번 로드의 차단 결과를 로그로 남기고 누적한다.
+        input: page (Playwright Page), stats (attach가 돌려준 PageLoadStats)
+        output: 없음
+        """
+        stats.elapsed_ms = (time.perf_counter() - stats.started_at) * 1000
+        if stats.hooks and not page.is_closed():
+            handle_route, on_response = stats.hooks
+            try:
+                await page.unroute("**/*", handle_route)
+                page.remove_listener("response", on_response)
+            except Exception:
+                pass
+        stats.hooks = None
+        self.record(stats)
+
+    def record(self, stats: PageLoadStats):
+        self.totals['page_loads'] += 1
+        self.totals['requests'] += stats.requests
+        self.totals['blocked'] += stats.blocked
+        self.totals['bytes_loaded'] += stats.bytes_loaded
+        self.totals['estimated_bytes_saved'] += stats.estimated_bytes_saved
+        self.totals['estimated_time_saved_ms'] += stats.estimated_time_saved_ms
+        if stats.requests:
+            print(f"[ResourceBlocker] {stats.host}: 요청 {stats.requests}개 중 {stats.blocked}개 차단 {stats.blocked_by_type}, "
+                  f"약 {stats.estimated_bytes_saved / 1024:.0f}KB / {stats.estimated_time_saved_ms:.0f}ms 절약 추정 "
+                  f"(받은 양 {stats.bytes_loaded / 1024:.0f}KB, {stats.elapsed_ms:.0f}ms)")
+
+    def stats(self) -> dict:
+        return {**self.totals, 'estimated_time_saved_ms': round(self.totals['estimated_time_saved_ms'], 1)}
+
+
+# 전역 리소스 차단기 인스턴스
+_resource_blocker = None
+
+def get_resource_blocker() -> ResourceBlocker:
+    """
+    기능: 프로세스 전체에서 공유하는 ResourceBlocker 싱글턴을 반환한다.
+    input: 없음
+    output: ResourceBlocker 인스턴스
+    """
+    global _resource_blocker
+    if _resource_blocker is None:
+        _resource_blocker = ResourceBlocker()
+    return _resource_blocker
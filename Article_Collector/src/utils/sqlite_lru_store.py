@@ -0,0 +1,140 @@
+import os
+import time
+import sqlite3
+import threading
+from typing import Optional
+
+# SQLite 변수 개수 제한(999)보다 작게 나눠 조회한다.
+_LOOKUP_CHUNK = 500
+# 크기 상한을 넘으면 상한의 이 비율까지 줄여서 매번 정리가 일어나지 않게 한다.
+EVICT_TARGET_RATIO = 0.9
+
+
+class SqliteLruStore:
+    """
+    키(해시 문자열) -> 텍스트 값을 저장하는 SQLite 저장소. 요약 캐시와 번역 메모리가 함께 쓴다.
+    저장된 키+값의 총 크기가 max_bytes를 넘으면 가장 오래 쓰이지 않은(last_access) 항목부터 지운다.
+    총 크기는 열 때 한 번만 SUM(size)로 읽고 이후에는 쓰기/삭제마다 더하고 빼서 유지한다.
+    (다른 프로세스가 같은 파일에 쓰면 어긋날 수 있으므로, 상한을 넘었을 때는 SUM으로 다시 맞춘 뒤 정리한다.)
+    """
+    def __init__(self, path: str, table: str, value_column: str, max_bytes: int, log_tag: str):
+        self.path = path
+        self.table = table
+        self.value_column = value_column
+        self.max_bytes = max_bytes
+        self.log_tag = log_tag
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                key TEXT PRIMARY KEY,
+                {value_column} TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_last_access ON {table}(last_access)")
+        self._conn.commit()
+        self._total_bytes = self._sum_size()
+
+    def _sum_size(self) -> int:
+        return self._conn.execute(f"SELECT COALESCE(SUM(size), 0) FROM {self.table}").fetchone()[0]
+
+    def get_many(self, keys: list[str]) -> dict[str, str]:
+        """
+        기능: 키들의 값을 한 번에 찾고, 찾은 항목의 최근 사용 시각을 갱신한다.
+        input: keys (키 리스트)
+        output: {키: 값} 딕셔너리 (찾은 키만)
+        """
+        key_list = list(dict.fromkeys(keys))
+        found = {}
+        with self._lock:
+            for start in range(0, len(key_list), _LOOKUP_CHUNK):
+                chunk = key_list[start:start + _LOOKUP_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                found.update(self._conn.execute(
+                    f"SELECT key, {self.value_column} FROM {self.table} WHERE key IN ({placeholders})", chunk
+                ))
+            if found:
+                hit_keys = list(found)
+                for start in range(0, len(hit_keys), _LOOKUP_CHUNK):
+                    chunk = hit_keys[start:start + _LOOKUP_CHUNK]
+                    placeholders = ",".join("?" * len(chunk))
+                    self._conn.execute(
+                        f"UPDATE {self.table} SET last_access = ? WHERE key IN ({placeholders})", [time.time(), *chunk]
+                    )
+                self._conn.commit()
+            self.hits += len(found)
+            self.misses += len(key_list) - len(found)
+        return found
+
+    def get(self, key: str) -> Optional[str]:
+        """키 하나의 값을 찾는다. 없으면 None."""
+        return self.get_many([key]).get(key)
+
+    def put_many(self, values: dict[str, str]):
+        """
+        기능: 값들을 저장(같은 키는 덮어씀)하고, 크기 상한을 넘으면 오래된 항목을 정리한다. 빈 값은 저장하지 않는다.
+        input: values ({키: 값} 딕셔너리)
+        output: 없음
+        """
+        now = time.time()
+        rows = [(key, value, len(key) + len(value.encode("utf-8")), now, now) for key, value in values.items() if value]
+        if not rows:
+            return
+        with self._lock:
+            # 덮어쓰는 항목의 이전 크기를 빼야 총 크기가 맞는다.
+            replaced = 0
+            for start in range(0, len(rows), _LOOKUP_CHUNK):
+                chunk = [row[0] for row in rows[start:start + _LOOKUP_CHUNK]]
+                placeholders = ",".join("?" * len(chunk))
+                replaced += self._conn.execute(
+                    f"SELECT COALESCE(SUM(size), 0) FROM {self.table} WHERE key IN ({placeholders})", chunk
+                ).fetchone()[0]
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO {self.table} (key, {self.value_column}, size, created_at, last_access) VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+            self._total_bytes += sum(row[2] for row in rows) - replaced
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+            self._conn.commit()
+
+    def put(self, key: str, value: str):
+        """키 하나의 값을 저장한다."""
+        self.put_many({key: value})
+
+    def _evict(self):
+        self._total_bytes = self._sum_size()
+        if self._total_bytes <= self.max_bytes:
+            return
+        target = int(self.max_bytes * EVICT_TARGET_RATIO)
+        removed = 0
+        for key, size in self._conn.execute(
+            f"SELECT key, size FROM {self.table} ORDER BY last_access ASC"
+        ).fetchall():
+            if self._total_bytes <= target:
+                break
+            self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+            self._total_bytes -= size
+            removed += 1
+        print(f"[{self.log_tag}] 크기 상한 초과로 {removed}개 항목을 정리했습니다.")
+
+    def stats(self) -> dict:
+        with self._lock:
+            count = self._conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "entries": count, "bytes": self._total_bytes}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
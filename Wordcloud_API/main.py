@@ -1,19 +1,41 @@
 from fastapi import FastAPI, HTTPException
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import asyncio
+import os
+import time
+from datetime import datetime
 from contextlib import asynccontextmanager
 
 from services.browser_manager import start_browser, stop_browser, get_browser
-from services.google_trends_scraper import get_trending_keywords
+from services.google_trends_scraper import get_trending_keywords, fetch_trending_keywords_from_feed
+from services.trends_cache import TrendsSnapshot, get_trends_cache
+from services.trends_refresher import TRENDS_REFRESHER_ENABLED, TrendsRefresher
+from services.resource_blocker import get_resource_blocking_stats
 from DB.database import get_db
 from DB import crud
 
+# 트렌드 수집 방식. feed: 브라우저 없이 RSS를 읽고 실패할 때만 Playwright로 스크레이핑, browser: 항상 Playwright.
+TRENDS_SOURCE = os.getenv("TRENDS_SOURCE", "feed")
+
+# 전역 백그라운드 트렌드 갱신 인스턴스 (TRENDS_REFRESHER=0이면 None)
+_refresher: Optional[TrendsRefresher] = None
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # 시작 시 실행
-    await start_browser()
+    global _refresher
+    # 시작 시 실행 (feed 모드에서는 RSS 수집이 실패해 처음 필요할 때 브라우저를 띄운다)
+    if TRENDS_SOURCE == "browser":
+        await start_browser()
+    if TRENDS_REFRESHER_ENABLED:
+        _refresher = TrendsRefresher(get_trends_cache(), refresh_trends)
+        _refresher.start()
     yield
     # 종료 시 실행
+    if _refresher:
+        await _refresher.stop()
+        _refresher = None
+    # 요청이 시작한 새로 고침이 브라우저를 쓰는 중일 수 있으므로 브라우저보다 먼저 정리한다.
+    await get_trends_cache().cancel_refresh()
     await stop_browser()
 
 app = FastAPI(
@@ -27,28 +49,87 @@ app = FastAPI(
 async def read_root():
     return {"message": "Welcome to the Extractor API Server!"}
 
+class TrendsRefreshError(Exception):
+    pass
+
+async def refresh_trends() -> TrendsSnapshot:
+    """
+    Google Trends 키워드를 가져와 DB의 트렌드 키워드를 교체하고 새 스냅샷을 반환합니다.
+    feed 모드에서는 RSS를 먼저 읽고, 비어 있거나 실패했을 때만 Playwright로 스크레이핑합니다.
+    캐시 새로 고침 한 번에 한 번만 실행됩니다.
+    """
+    trending_keywords = []
+    if TRENDS_SOURCE == "feed":
+        trending_keywords = await fetch_trending_keywords_from_feed()
+
+    if not trending_keywords:
+        print("[trends] Playwright 스크레이핑으로 트렌드 키워드를 가져옵니다.")
+        await start_browser()
+        browser = await get_browser()
+        if not browser:
+            raise TrendsRefreshError("Browser is not available. Check server logs.")
+        trending_keywords = await get_trending_keywords(browser)
+
+    if not trending_keywords:
+        raise TrendsRefreshError("Failed to scrape trending keywords. The structure of the page might have changed.")
+
+    def save():
+        with get_db() as db:
+            return len(crud.clear_and_save_trend_keywords(db, trending_keywords))
+
+    # 동기 DB 저장이 이벤트 루프(다른 요청)를 막지 않도록 스레드에서 실행한다.
+    saved_count = await asyncio.to_thread(save)
+    return TrendsSnapshot(keywords=trending_keywords, saved_count=saved_count, fetched_at=time.time())
+
 @app.get("/trends/korea", 
          response_model=Dict[str, Any],
          summary="Get Google Trends and Save to DB",
-         description="Google Trends 페이지에서 최신 인기 검색어를 스크레이핑하여 DB에 저장하고 결과를 반환합니다.")
+         description="Google Trends 인기 검색어를 반환합니다. 백그라운드 갱신이 켜져 있으면 마지막 결과를 반환하고, 꺼져 있으면 TRENDS_CACHE_TTL 동안 캐시한 결과를 반환하며 만료된 결과는 백그라운드에서 새로 스크레이핑해 DB에 저장하는 동안 그대로 반환됩니다.")
 async def trends():
-    browser = await get_browser()
-    if not browser:
-        raise HTTPException(status_code=500, detail="Browser is not available. Check server logs.")
-    
+    if _refresher:
+        # 백그라운드 갱신이 돌고 있으면 요청은 스크레이핑을 일으키지 않고 마지막 결과만 읽는다.
+        return await trends_snapshot()
+
     try:
-        trending_keywords = await get_trending_keywords(browser)
-        if not trending_keywords:
-            raise HTTPException(status_code=500, detail="Failed to scrape trending keywords. The structure of the page might have changed.")
-        
-        with get_db() as db:
-            saved_keywords = crud.clear_and_save_trend_keywords(db, trending_keywords)
-            
-        return {
-            "message": f"{len(saved_keywords)}개의 트렌드 키워드가 DB에 저장되었습니다.",
-            "saved_count": len(saved_keywords),
-            "keywords": trending_keywords
-        }
-        
+        snapshot, cache_status = await get_trends_cache().get(refresh_trends)
+    except TrendsRefreshError as e:
+        raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {str(e)}") 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {str(e)}")
+
+    return _snapshot_response(snapshot, cache_status)
+
+def _iso(timestamp: Optional[float]) -> Optional[str]:
+    return datetime.fromtimestamp(timestamp).isoformat() if timestamp else None
+
+def _snapshot_response(snapshot: TrendsSnapshot, cache_status: str) -> Dict[str, Any]:
+    return {
+        "message": f"{snapshot.saved_count}개의 트렌드 키워드가 DB에 저장되었습니다.",
+        "saved_count": snapshot.saved_count,
+        "keywords": snapshot.keywords,
+        "cache": cache_status,
+        "fetched_at": _iso(snapshot.fetched_at),
+    }
+
+@app.get("/trends/korea/snapshot",
+         response_model=Dict[str, Any],
+         summary="Get Latest Trends Snapshot",
+         description="마지막으로 수집한 트렌드 키워드를 반환합니다. 스크레이핑을 일으키지 않으며, 서버 시작 직후 첫 수집이 진행 중이면 그 결과를 기다립니다.")
+async def trends_snapshot():
+    snapshot = await get_trends_cache().latest()
+    if snapshot is None:
+        raise HTTPException(status_code=503, detail="Trend keywords have not been collected yet. Check /trends/status.")
+    return _snapshot_response(snapshot, "snapshot")
+
+@app.get("/trends/status",
+         response_model=Dict[str, Any],
+         summary="Get Trends Refresh Status",
+         description="백그라운드 갱신(마지막 성공 시각, 소요 시간, 다음 실행, 오류)과 캐시, 리소스 차단 통계를 반환합니다.")
+async def trends_status():
+    refresher = _refresher.status() if _refresher else {'enabled': False}
+    cache = get_trends_cache().status()
+    return {
+        "refresher": {key: _iso(value) if key.endswith("_at") else value for key, value in refresher.items()},
+        "cache": {key: _iso(value) if key.endswith("_at") else value for key, value in cache.items()},
+        "resource_blocking": get_resource_blocking_stats(),
+    }
@@ -5,16 +5,89 @@ from typing import List, Dict, Any
 import os
 import asyncio
 
+import re
+import aiohttp
+from xml.etree import ElementTree
+
+from services.resource_blocker import BLOCK_RESOURCES, attach_resource_blocking, detach_resource_blocking
+
+# 브라우저 없이 읽는 Google Trends 실시간 인기 검색어 RSS
+TRENDS_FEED_URL = os.getenv("TRENDS_FEED_URL", "https://trends.google.com/trending/rss?geo=KR")
+TRENDS_FEED_TIMEOUT = int(os.getenv("TRENDS_FEED_TIMEOUT", 10))
+# RSS의 ht: 확장 네임스페이스 (ht:approx_traffic)
+_HT_NS = "https://trends.google.com/trending/rss"
+_TRAFFIC_RE = re.compile(r"([\d.,]+)\s*([KkMm만천]?)")
+_TRAFFIC_UNITS = {"": 1, "K": 1000, "k": 1000, "M": 1000000, "m": 1000000, "천": 1000, "만": 10000}
+TOP_KEYWORDS = 20
+
+
+def parse_traffic(raw_traffic: str) -> int:
+    """
+    RSS의 검색량 표기("2000+", "1,000+", "20K+", "5만+")를 정수로 바꿉니다. 해석할 수 없으면 0을 반환합니다.
+    """
+    match = _TRAFFIC_RE.search(raw_traffic or "")
+    if not match:
+        return 0
+    try:
+        return int(float(match.group(1).replace(",", "")) * _TRAFFIC_UNITS[match.group(2)])
+    except ValueError:
+        return 0
+
+
+def parse_trends_feed(xml_content: bytes) -> List[Dict[str, Any]]:
+    """
+    Google Trends 인기 검색어 RSS에서 {"keyword", "search_volume"} 목록을 만들어 검색량 상위 TOP_KEYWORDS개를 반환합니다.
+    """
+    root = ElementTree.fromstring(xml_content)
+    results = []
+    for item in root.iter("item"):
+        title = item.findtext("title") or ""
+        keyword = title.strip().replace(" ", "")
+        if not keyword:
+            continue
+        traffic = item.findtext(f"{{{_HT_NS}}}approx_traffic")
+        if traffic is None:
+            # 네임스페이스 URI가 바뀌어도 로컬 이름으로 찾는다.
+            traffic = next((child.text for child in item if child.tag.rsplit("}", 1)[-1] == "approx_traffic"), "")
+        results.append({"keyword": keyword, "search_volume": parse_traffic(traffic)})
+    return sorted(results, key=lambda item: item['search_volume'], reverse=True)[:TOP_KEYWORDS]
+
+
+async def fetch_trending_keywords_from_feed() -> List[Dict[str, Any]]:
+    """
+    브라우저 없이 aiohttp로 Google Trends RSS를 받아 트렌드 키워드를 추출합니다.
+    요청이나 파싱에 실패하면 빈 리스트를 반환하므로, 호출한 쪽에서 Playwright 스크레이핑으로 대체할 수 있습니다.
+    """
+    print(f"[trends] RSS 피드에서 트렌드 키워드를 가져옵니다: {TRENDS_FEED_URL}")
+    try:
+        timeout = aiohttp.ClientTimeout(total=TRENDS_FEED_TIMEOUT)
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            async with session.get(TRENDS_FEED_URL, headers={"Accept-Language": "ko"}) as response:
+                response.raise_for_status()
+                xml_content = await response.read()
+        results = parse_trends_feed(xml_content)
+    except (aiohttp.ClientError, asyncio.TimeoutError, ElementTree.ParseError) as e:
+        print(f"[trends] RSS 피드 수집 실패: {e}")
+        return []
+
+    print(f"[trends] RSS 피드에서 {len(results)}개의 트렌드 키워드를 추출했습니다.")
+    return results
+
+
 async def get_trending_keywords(browser: Browser) -> List[Dict[str, Any]]:
     print("\n[trends] 공유된 브라우저를 사용하여 스크레이핑 시작 (Async)...")
     html_source = ""
     page: Page = None
+    page_load = None
+    url = "https://trends.google.com/trending?geo=KR&hl=ko&sort=search-volume&status=active&hours=48"
 
     try:
         print("[trends] 1. 새 페이지를 엽니다.")
         page = await browser.new_page()
-        
-        url = "https://trends.google.com/trending?geo=KR&hl=ko&sort=search-volume&status=active&hours=48"
+        if BLOCK_RESOURCES:
+            # 표의 텍스트만 읽으므로 이미지/폰트/광고·트래킹 요청은 받지 않는다.
+            page_load = await attach_resource_blocking(page, url)
+
         print(f"[trends] 2. Google Trends URL로 이동합니다: {url}")
         await page.goto(url, wait_until='domcontentloaded', timeout=30000)
 
@@ -49,6 +122,8 @@ async def get_trending_keywords(browser: Browser) -> List[Dict[str, Any]]:
         return []
     finally:
         if page:
+            if page_load:
+                await detach_resource_blocking(page, page_load)
             await page.close()
             print("[trends] 7. 사용한 페이지를 닫았습니다. (브라우저는 계속 실행 중)")
 
@@ -96,7 +171,7 @@ async def get_trending_keywords(browser: Browser) -> List[Dict[str, Any]]:
     print(f"[trends] 총 {len(results)}개의 트렌드 키워드를 성공적으로 추출했습니다.")
     
     sorted_results = sorted(results, key=lambda item: item['search_volume'], reverse=True)
-    final_results = sorted_results[:20]
+    final_results = sorted_results[:TOP_KEYWORDS]
     
     print(f"[trends] search_volume 상위 {len(final_results)}개를 반환합니다.")
 
@@ -0,0 +1,124 @@
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from urllib.parse import urlparse
+from typing import Dict, Any
+
+# 0이면 헤드리스 페이지에서 리소스를 차단하지 않는다. (차단 때문에 페이지가 깨지는지 확인할 때)
+BLOCK_RESOURCES = os.getenv("BLOCK_RESOURCES", "1") != "0"
+# 막을 Playwright 리소스 종류 (쉼표 구분). 문서(document)는 막지 않는다.
+BLOCK_TYPES = frozenset(t.strip() for t in os.getenv("BLOCK_RESOURCE_TYPES", "image,media,font").split(",") if t.strip())
+# 종류와 관계없이 막을 광고/트래킹 URL
+BLOCK_URLS = [re.compile(p) for p in (
+    r"doubleclick\.net", r"googlesyndication\.com", r"googletagservices\.com", r"googletagmanager\.com",
+    r"google-analytics\.com", r"adservice\.google\.", r"/pagead/", r"/log\?format=json", r"play\.google\.com/log",
+)]
+# 사이트(호스트)별로 항상 통과시킬 URL. Google Trends 표 데이터는 batchexecute RPC로 받아오므로 절대 막지 않는다.
+SITE_ALLOWLISTS = {
+    "trends.google.com": [re.compile(r"/_/TrendsUi/")],
+}
+_NEVER_BLOCKED_TYPES = {"document"}
+
+# 차단한 요청의 크기는 알 수 없으므로 리소스 종류별 대략적인 응답 크기(bytes)로 절약량을 추정한다.
+_ESTIMATED_BYTES = {
+    "image": 40_000, "media": 500_000, "font": 35_000, "stylesheet": 20_000,
+    "script": 30_000, "xhr": 5_000, "fetch": 5_000, "other": 2_000,
+}
+
+# 서버 시작 이후 누적 차단 결과
+_totals = {'page_loads': 0, 'requests': 0, 'blocked': 0, 'bytes_loaded': 0, 'estimated_bytes_saved': 0, 'estimated_time_saved_ms': 0.0}
+
+
+@dataclass
+class PageLoadStats:
+    host: str
+    requests: int = 0
+    blocked: int = 0
+    blocked_by_type: dict = field(default_factory=dict)
+    bytes_loaded: int = 0
+    estimated_bytes_saved: int = 0
+    started_at: float = field(default_factory=time.perf_counter)
+    elapsed_ms: float = 0.0
+    hooks: tuple = field(default=None, repr=False)
+
+    @property
+    def estimated_time_saved_ms(self) -> float:
+        # 이번 로드에서 관측한 처리량(받은 bytes / 걸린 시간)으로 차단한 bytes를 받는 데 걸렸을 시간을 추정한다.
+        if not self.bytes_loaded or not self.elapsed_ms:
+            return 0.0
+        return self.estimated_bytes_saved / (self.bytes_loaded / self.elapsed_ms)
+
+
+def _should_block(resource_type: str, url: str, allow_urls: list) -> bool:
+    if resource_type in _NEVER_BLOCKED_TYPES:
+        return False
+    if any(pattern.search(url) for pattern in allow_urls):
+        return False
+    return resource_type in BLOCK_TYPES or any(pattern.search(url) for pattern in BLOCK_URLS)
+
+
+async def attach_resource_blocking(page, url: str) -> PageLoadStats:
+    """
+    페이지에 이미지/미디어/폰트와 광고·트래킹 요청을 막는 route를 겁니다.
+    url의 호스트에 등록된 허용 목록(SITE_ALLOWLISTS)에 맞는 요청은 통과시킵니다.
+    """
+    host = (urlparse(url).hostname or "").lower()
+    allow_urls = SITE_ALLOWLISTS.get(host, [])
+    stats = PageLoadStats(host=host or "-")
+
+    async def handle_route(route, request):
+        stats.requests += 1
+        try:
+            if _should_block(request.resource_type, request.url, allow_urls):
+                stats.blocked += 1
+                stats.blocked_by_type[request.resource_type] = stats.blocked_by_type.get(request.resource_type, 0) + 1
+                stats.estimated_bytes_saved += _ESTIMATED_BYTES.get(request.resource_type, _ESTIMATED_BYTES["other"])
+                await route.abort("blockedbyclient")
+            else:
+                await route.continue_()
+        except Exception:
+            # 페이지가 이미 닫혔거나 이동해 요청이 사라진 경우
+            pass
+
+    def on_response(response):
+        length = response.headers.get("content-length")
+        if length and length.isdigit():
+            stats.bytes_loaded += int(length)
+
+    await page.route("**/*", handle_route)
+    page.on("response", on_response)
+    stats.hooks = (handle_route, on_response)
+    return stats
+
+
+async def detach_resource_blocking(page, stats: PageLoadStats):
+    """
+    attach_resource_blocking으로 건 route를 떼고, 이번 페이지 로드의 차단 결과를 출력하고 누적합니다.
+    """
+    stats.elapsed_ms = (time.perf_counter() - stats.started_at) * 1000
+    if stats.hooks and not page.is_closed():
+        handle_route, on_response = stats.hooks
+        try:
+            await page.unroute("**/*", handle_route)
+            page.remove_listener("response", on_response)
+        except Exception:
+            pass
+    stats.hooks = None
+
+    _totals['page_loads'] += 1
+    _totals['requests'] += stats.requests
+    _totals['blocked'] += stats.blocked
+    _totals['bytes_loaded'] += stats.bytes_loaded
+    _totals['estimated_bytes_saved'] += stats.estimated_bytes_saved
+    _totals['estimated_time_saved_ms'] += stats.estimated_time_saved_ms
+    print(f"[ResourceBlocker] {stats.host}: 요청 {stats.requests}개 중 {stats.blocked}개 차단 {stats.blocked_by_type}, "
+          f"약 {stats.estimated_bytes_saved / 1024:.0f}KB / {stats.estimated_time_saved_ms:.0f}ms 절약 추정 "
+          f"(받은 양 {stats.bytes_loaded / 1024:.0f}KB, {stats.elapsed_ms:.0f}ms)")
+
+
+def get_resource_blocking_stats() -> Dict[str, Any]:
+    """
+    서버 시작 이후 누적된 리소스 차단 결과를 반환합니다.
+    """
+    return {**_totals, 'estimated_time_saved_ms': round(_totals['estimated_time_saved_ms'], 1)}
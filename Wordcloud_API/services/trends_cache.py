@@ -0,0 +1,144 @@
+import os
+import time
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+# 이 시간(초) 안의 결과는 새로 스크레이핑하지 않고 그대로 돌려준다.
+TRENDS_CACHE_TTL = int(os.getenv("TRENDS_CACHE_TTL", 600))
+# TTL이 지났어도 이 시간(초) 안의 결과는 바로 돌려주고 뒤에서 새로 고친다. 더 오래되면 새 결과를 기다린다.
+TRENDS_STALE_TTL = int(os.getenv("TRENDS_STALE_TTL", 6 * 60 * 60))
+
+
+@dataclass
+class TrendsSnapshot:
+    keywords: List[Dict[str, Any]]
+    saved_count: int
+    fetched_at: float
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.fetched_at
+
+
+class TrendsCache:
+    """
+    Google Trends 스크레이핑 결과의 TTL 캐시.
+    - 동시에 들어온 요청은 진행 중인 스크레이핑 하나를 함께 기다린다. (single-flight)
+    - TTL이 지난 결과는 stale 기간 동안 바로 돌려주고, 새로 고침은 백그라운드에서 한 번만 돈다. (stale-while-revalidate)
+    - 새로 고침이 실패하면 마지막으로 성공한 결과를 유지한다.
+    """
+    def __init__(self, ttl: float = TRENDS_CACHE_TTL, stale_ttl: float = TRENDS_STALE_TTL):
+        self.ttl = ttl
+        self.stale_ttl = max(stale_ttl, ttl)
+        self.snapshot: Optional[TrendsSnapshot] = None
+        self.last_error: Optional[str] = None
+        self.stats = {'hit': 0, 'stale': 0, 'miss': 0, 'coalesced': 0, 'refreshes': 0, 'refresh_failures': 0}
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    async def get(self, refresh: Callable[[], Awaitable[TrendsSnapshot]]) -> Tuple[TrendsSnapshot, str]:
+        """
+        캐시된 결과와 캐시 상태('hit', 'stale', 'miss')를 반환합니다.
+        refresh는 스크레이핑과 DB 저장을 수행하고 새 TrendsSnapshot을 반환하는 코루틴 함수입니다.
+        캐시가 비었거나 stale 기간도 지났는데 새로 고침이 실패하면 refresh의 예외를 그대로 올립니다.
+        """
+        snapshot = self.snapshot
+        if snapshot is not None and snapshot.age < self.ttl:
+            self.stats['hit'] += 1
+            return snapshot, 'hit'
+        if snapshot is not None and snapshot.age < self.stale_ttl:
+            self.stats['stale'] += 1
+            self.start_refresh(refresh)
+            return snapshot, 'stale'
+
+        self.stats['miss'] += 1
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self.stats['coalesced'] += 1
+        # 요청이 취소되더라도 다른 요청이 기다리는 스크레이핑은 계속 돈다.
+        return await asyncio.shield(self.start_refresh(refresh)), 'miss'
+
+    async def refresh(self, refresh: Callable[[], Awaitable[TrendsSnapshot]]) -> TrendsSnapshot:
+        """
+        캐시 나이와 관계없이 새로 고침을 실행하고 그 결과를 반환합니다. 이미 진행 중이면 그것을 함께 기다립니다.
+        """
+        return await asyncio.shield(self.start_refresh(refresh))
+
+    async def latest(self) -> Optional[TrendsSnapshot]:
+        """
+        스크레이핑을 시작하지 않고 마지막 결과를 반환합니다. 아직 결과가 없고 새로 고침이 진행 중이면 그 결과를 기다립니다.
+        """
+        if self.snapshot is None and self._refresh_task is not None and not self._refresh_task.done():
+            try:
+                return await asyncio.shield(self._refresh_task)
+            except Exception:
+                return None
+        return self.snapshot
+
+    def start_refresh(self, refresh: Callable[[], Awaitable[TrendsSnapshot]]) -> asyncio.Task:
+        """
+        새로 고침 작업을 시작하고 그 Task를 반환합니다. 이미 진행 중이면 진행 중인 Task를 반환합니다.
+        """
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._run_refresh(refresh))
+            # 백그라운드 새로 고침의 실패는 _run_refresh에서 기록했으므로 여기서 예외를 회수만 한다.
+            self._refresh_task.add_done_callback(lambda task: task.cancelled() or task.exception())
+        return self._refresh_task
+
+    async def cancel_refresh(self):
+        """
+        진행 중인 새로 고침 Task를 취소하고 끝날 때까지 기다립니다. 서버 종료 시 브라우저를 닫기 전에 호출합니다.
+        """
+        task = self._refresh_task
+        if task is None or task.done():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            # 취소 직전에 실패한 경우. 실패는 _run_refresh에서 이미 기록했다.
+            pass
+        print("[TrendsCache] 진행 중이던 트렌드 새로 고침을 취소했습니다.")
+
+    async def _run_refresh(self, refresh: Callable[[], Awaitable[TrendsSnapshot]]) -> TrendsSnapshot:
+        self.stats['refreshes'] += 1
+        started = time.perf_counter()
+        try:
+            snapshot = await refresh()
+        except Exception as e:
+            self.stats['refresh_failures'] += 1
+            self.last_error = str(e)
+            print(f"[TrendsCache] 트렌드 새로 고침 실패: {e}")
+            raise
+        self.snapshot = snapshot
+        self.last_error = None
+        print(f"[TrendsCache] 트렌드 키워드 {len(snapshot.keywords)}개로 캐시를 새로 고쳤습니다. ({time.perf_counter() - started:.1f}초)")
+        return snapshot
+
+    def status(self) -> Dict[str, Any]:
+        """
+        캐시 상태(마지막 결과 시각과 나이, 새로 고침 진행 여부, 마지막 오류, 요청 통계)를 반환합니다.
+        """
+        return {
+            'ttl': self.ttl,
+            'stale_ttl': self.stale_ttl,
+            'fetched_at': self.snapshot.fetched_at if self.snapshot else None,
+            'age': round(self.snapshot.age, 1) if self.snapshot else None,
+            'refreshing': self._refresh_task is not None and not self._refresh_task.done(),
+            'last_error': self.last_error,
+            **self.stats,
+        }
+
+
+# 전역 트렌드 캐시 인스턴스
+_trends_cache: Optional[TrendsCache] = None
+
+def get_trends_cache() -> TrendsCache:
+    """
+    서버 전체에서 공유하는 TrendsCache 싱글턴을 반환합니다.
+    """
+    global _trends_cache
+    if _trends_cache is None:
+        _trends_cache = TrendsCache()
+    return _trends_cache
@@ -0,0 +1,113 @@
+import os
+import time
+import random
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from services.trends_cache import TrendsCache, TrendsSnapshot
+
+# 0이면 백그라운드 갱신을 돌리지 않고, /trends/korea 요청이 캐시가 만료됐을 때 스크레이핑한다.
+TRENDS_REFRESHER_ENABLED = os.getenv("TRENDS_REFRESHER", "1") != "0"
+# 백그라운드 스크레이핑 주기(초)
+TRENDS_REFRESH_INTERVAL = int(os.getenv("TRENDS_REFRESH_INTERVAL", 600))
+# 주기에 더하거나 빼는 무작위 시간(초). 여러 인스턴스가 같은 순간에 Google Trends를 두드리지 않도록 한다.
+TRENDS_REFRESH_JITTER = int(os.getenv("TRENDS_REFRESH_JITTER", 60))
+# 실패하면 주기를 기다리지 않고 이 시간(초) 뒤에 다시 시도한다.
+TRENDS_RETRY_DELAY = int(os.getenv("TRENDS_RETRY_DELAY", 60))
+
+
+class TrendsRefresher:
+    """
+    서버가 떠 있는 동안 일정 주기(+지터)로 Google Trends를 스크레이핑해 DB와 TrendsCache를 갱신하는 백그라운드 작업.
+    새로 고침은 캐시를 거치므로 /trends/korea 요청과 겹쳐도 스크레이핑은 한 번만 돈다.
+    """
+    def __init__(self, cache: TrendsCache, refresh: Callable[[], Awaitable[TrendsSnapshot]],
+                 interval: float = TRENDS_REFRESH_INTERVAL, jitter: float = TRENDS_REFRESH_JITTER):
+        self.cache = cache
+        self.refresh = refresh
+        self.interval = interval
+        self.jitter = jitter
+        self.runs = 0
+        self.failures = 0
+        self.last_attempt_at: Optional[float] = None
+        self.last_success_at: Optional[float] = None
+        self.last_duration: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.next_run_at: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        """
+        백그라운드 갱신을 시작합니다. 첫 스크레이핑은 바로 실행됩니다.
+        """
+        if not self.running:
+            # 첫 새로 고침을 바로 등록해 두어, 시작 직후의 스냅샷 요청이 빈 결과 대신 이 결과를 기다리게 한다.
+            self.cache.start_refresh(self.refresh)
+            self._task = asyncio.create_task(self._run())
+            print(f"[TrendsRefresher] 백그라운드 갱신을 시작합니다. (주기 {self.interval}초 ± {self.jitter}초)")
+
+    async def stop(self):
+        """
+        백그라운드 갱신을 멈추고 작업이 끝날 때까지 기다립니다.
+        갱신 루프가 기다리던 캐시 새로 고침은 shield로 보호되어 루프를 취소해도 계속 돌기 때문에 함께 취소합니다.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            print("[TrendsRefresher] 백그라운드 갱신을 멈췄습니다.")
+        await self.cache.cancel_refresh()
+
+    async def _run(self):
+        while True:
+            ok = await self.run_once()
+            delay = self.interval + random.uniform(-self.jitter, self.jitter) if ok else TRENDS_RETRY_DELAY
+            delay = max(1.0, delay)
+            self.next_run_at = time.time() + delay
+            await asyncio.sleep(delay)
+
+    async def run_once(self) -> bool:
+        """
+        스크레이핑과 DB 저장을 한 번 실행하고 결과를 기록합니다. 성공 여부를 반환합니다.
+        """
+        self.runs += 1
+        self.last_attempt_at = time.time()
+        started = time.perf_counter()
+        try:
+            await self.cache.refresh(self.refresh)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.failures += 1
+            self.last_error = str(e)
+            print(f"[TrendsRefresher] 갱신 실패 ({TRENDS_RETRY_DELAY}초 뒤 재시도): {e}")
+            return False
+        self.last_duration = time.perf_counter() - started
+        self.last_success_at = time.time()
+        self.last_error = None
+        return True
+
+    def status(self) -> Dict[str, Any]:
+        """
+        백그라운드 갱신 상태(마지막 성공 시각과 소요 시간, 다음 실행 예정 시각, 마지막 오류, 실행/실패 횟수)를 반환합니다.
+        """
+        return {
+            'enabled': True,
+            'running': self.running,
+            'interval': self.interval,
+            'jitter': self.jitter,
+            'runs': self.runs,
+            'failures': self.failures,
+            'last_attempt_at': self.last_attempt_at,
+            'last_success_at': self.last_success_at,
+            'last_duration': round(self.last_duration, 2) if self.last_duration is not None else None,
+            'last_error': self.last_error,
+            'next_run_at': self.next_run_at,
+        }